@@ -16,15 +16,22 @@ from __future__ import annotations
 
 from io import open
 import collections
+import pickle
 import os
 import logging
 
 from glyphsLib.classes import GSFont, __all__ as __all_classes__
 from glyphsLib.classes import *  # noqa
 from glyphsLib.builder import to_ufos, to_designspace, to_glyphs  # noqa
+from glyphsLib.builder.profiling import stage
 from glyphsLib.parser import load, loads  # noqa
 from glyphsLib.writer import dump, dumps  # noqa
-from glyphsLib.util import clean_ufo, ufo_create_background_layer_for_all_glyphs
+from glyphsLib.util import (
+    ProcessPool,
+    clean_ufo,
+    ufo_create_background_layer_for_all_glyphs,
+    update_ufo,
+)
 
 try:
     from ._version import version as __version__
@@ -87,6 +94,7 @@ def build_masters(
     propagate_anchors=None,
     minimize_glyphs_diffs=False,
     normalize_ufos=False,
+    update_ufos=False,
     create_background_layers=False,
     generate_GDEF=True,
     store_editor_state=True,
@@ -95,6 +103,11 @@ def build_masters(
     ufo_module=None,
     minimal=False,
     glyph_data=None,
+    designspace_only=False,
+    glyph_filter=None,
+    profile=None,
+    workers=1,
+    anchor_cache=None,
 ):
     """Write and return UFOs from the masters and the designspace defined in a
     .glyphs file.
@@ -106,6 +119,27 @@ def build_masters(
             written alongside the master UFOs though no instances will be built.
         family_name: If provided, the master UFOs will be given this name and
             only instances with this name will be included in the designspace.
+        designspace_only: If True, only the designspace document is built and
+            written, without converting glyphs or writing the master UFOs.
+        glyph_filter: If provided, a collection of glyph names or a callable
+            selecting the glyphs to convert, along with their components.
+        profile: If provided, a `glyphsLib.builder.BuildProfile` recording the
+            time spent in each stage of the build, including parsing the
+            Glyphs file and writing the UFOs.
+        update_ufos: If True, the master UFOs already in master_dir are updated
+            in place: only the files whose content changed are rewritten, and
+            the stale ones deleted. Otherwise the UFOs are deleted and written
+            anew. Either way, the returned UFOs are bound to their path.
+        workers: Number of processes used to propagate the anchors and to
+            write (and normalize) the master UFOs concurrently (default: 1,
+            i.e. serially in this process; None uses the number of CPUs).
+            The UFOs must be picklable, as ufoLib2 fonts are, when using more
+            than one worker. The returned UFOs are the same as with a single
+            worker.
+        anchor_cache: If provided, an `AnchorPropagationCache`, or the path of
+            a JSON file keeping one between builds, from which the anchors of
+            the glyphs that did not change are taken instead of being
+            propagated again.
 
     Returns:
         A named tuple of master UFOs (`ufos`) and the path to the designspace
@@ -117,7 +151,8 @@ def build_masters(
     if isinstance(filename, GSFont):
         font = filename
     else:
-        font = GSFont(filename)
+        with stage(profile, "parse"):
+            font = GSFont(filename)
 
     if not os.path.isdir(master_dir):
         os.mkdir(master_dir)
@@ -140,32 +175,107 @@ def build_masters(
         ufo_module=ufo_module,
         minimal=minimal,
         glyph_data=glyph_data,
+        designspace_only=designspace_only,
+        glyph_filter=glyph_filter,
+        profile=profile,
+        workers=workers,
+        anchor_cache=anchor_cache,
     )
 
     # Only write full masters to disk. This assumes that layer sources are always part
     # of another full master source, which must always be the case in a .glyphs file.
     ufos = {}
-    for source in designspace.sources:
-        if source.filename in ufos:
-            assert source.font is ufos[source.filename]
-            continue
+    if not designspace_only:
+        for source in designspace.sources:
+            if source.filename in ufos:
+                assert source.font is ufos[source.filename]
+                continue
 
-        if create_background_layers and not minimal:
-            ufo_create_background_layer_for_all_glyphs(source.font)
+            if create_background_layers and not minimal:
+                ufo_create_background_layer_for_all_glyphs(source.font)
 
-        ufo_path = os.path.join(master_dir, source.filename)
-        clean_ufo(ufo_path)
-        source.font.save(ufo_path)
-
-        if normalize_ufos:
-            import ufonormalizer
-
-            ufonormalizer.normalizeUFO(ufo_path, writeModTimes=False)
+            ufos[source.filename] = source.font
 
-        ufos[source.filename] = source.font
+        _write_masters(
+            ufos,
+            master_dir,
+            normalize_ufos,
+            update_ufos,
+            workers=workers,
+            profile=profile,
+        )
+        for source in designspace.sources:
+            source.font = ufos[source.filename]
 
     if not designspace_path:
         designspace_path = os.path.join(master_dir, designspace.filename)
     designspace.write(designspace_path)
 
     return Masters(ufos, designspace_path)
+
+
+def _write_masters(ufos, master_dir, normalize_ufos, update_ufos, workers, profile):
+    jobs = [
+        (ufo, os.path.join(master_dir, filename), normalize_ufos, update_ufos)
+        for filename, ufo in ufos.items()
+    ]
+    if workers == 1 or len(jobs) < 2:
+        for job in jobs:
+            _write_master(*job, profile=profile)
+        _bind_written_ufos(ufos, master_dir)
+        return
+
+    # The UFOs are pickled here, so that a UFO that can't be is reported
+    # before any work starts, then saved by the worker processes; the first
+    # error is raised here once all the writes are done.
+    pickled_jobs = []
+    for filename, (ufo, *args) in zip(ufos, jobs):
+        try:
+            data = pickle.dumps(ufo, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise TypeError(
+                f"The UFO {filename} can't be pickled to a worker process ({e}); "
+                "use workers=1, or a picklable UFO module such as ufoLib2"
+            ) from e
+        pickled_jobs.append((data, *args))
+    with stage(profile, "save_ufos", len(jobs)), ProcessPool(workers) as pool:
+        pool.map(_write_master_job, pickled_jobs)
+    _bind_written_ufos(ufos, master_dir)
+
+
+def _bind_written_ufos(ufos, master_dir):
+    """Replace the UFOs that writing left without their path (e.g. updated
+    ufoLib2 UFOs) with the UFOs written at that path, so that the returned
+    UFOs are always bound to their files."""
+    for filename, ufo in ufos.items():
+        ufo_path = os.path.join(master_dir, filename)
+        if ufo.path is None or os.path.normpath(ufo.path) != os.path.normpath(ufo_path):
+            ufos[filename] = _open_written_ufo(type(ufo), ufo_path)
+
+
+def _open_written_ufo(font_class, path):
+    try:
+        return font_class.open(path)  # ufoLib2, loads the glyphs lazily
+    except AttributeError:
+        return font_class(path)  # defcon
+
+
+def _write_master(ufo, ufo_path, normalize_ufos, update_ufos, profile=None):
+    if update_ufos:
+        with stage(profile, "save_ufos"):
+            update_ufo(ufo, ufo_path, normalize=normalize_ufos)
+        return
+
+    with stage(profile, "save_ufos"):
+        clean_ufo(ufo_path)
+        ufo.save(ufo_path)
+
+    if normalize_ufos:
+        import ufonormalizer
+
+        ufonormalizer.normalizeUFO(ufo_path, writeModTimes=False)
+
+
+def _write_master_job(job):
+    data, *args = job
+    _write_master(pickle.loads(data), *args)
@@ -12,13 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import logging
+import os
+from contextlib import contextmanager
 
 from glyphsLib import classes, glyphdata
 
 from .builders import UFOBuilder, GlyphsBuilder
-from .transformations import TRANSFORMATIONS, TRANSFORMATION_CUSTOM_PARAMS
+from .profiling import BuildProfile, stage  # noqa: F401
+from .snapshot import snapshot_font
+from .subset import subset_features, subset_glyphs
+from .transformations import (
+    TRANSFORMATIONS,
+    TRANSFORMATION_CUSTOM_PARAMS,
+    propagate_all_anchors,
+)
+from .transformations.propagate_anchors import AnchorPropagationCache
+from .variation_models import interpolation_models
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +47,11 @@ def to_ufos(
     minimal=False,
     glyph_data=None,
     preserve_original=False,
+    compact_kerning=False,
+    glyph_filter=None,
+    profile=None,
+    workers=1,
+    anchor_cache=None,
 ):
     """Take a GSFont object and convert it into one UFO per master.
 
@@ -60,32 +75,74 @@ def to_ufos(
     will be skipped.
 
     If preserve_original is True, this works on a copy of the font object
-    to avoid modifying the original object.
+    to avoid modifying the original object. Only the glyphs that the conversion
+    modifies are deep-copied (see `glyphsLib.builder.snapshot`).
 
     The optional glyph_data parameter takes a list of GlyphData.xml paths or
     a pre-parsed GlyphData object that overrides the default one.
+
+    If compact_kerning is True, kerning pairs that are identical in all masters
+    are stored once and shared by the master UFOs' kerning, which cuts memory
+    for families with many masters; kerning sparsity statistics are logged.
+
+    The optional glyph_filter parameter, a collection of glyph names or a
+    callable taking a glyph name and returning a boolean, restricts the
+    conversion to the selected glyphs plus the glyphs they use as components,
+    transitively; kerning, kerning groups and feature code are pruned
+    accordingly (see `glyphsLib.builder.subset`). The conversion then always
+    works on a copy of the font object, as with preserve_original.
+
+    The optional profile parameter takes a `glyphsLib.builder.BuildProfile`
+    in which the time spent in each stage of the conversion is recorded.
+
+    The optional workers parameter is the number of processes propagating the
+    anchors (default: 1, i.e. serially in this process; None uses the number
+    of CPUs), see `propagate_all_anchors`.
+
+    The optional anchor_cache parameter takes an `AnchorPropagationCache`, or
+    the path of a JSON file keeping one between conversions, from which the
+    anchors of the glyphs that did not change are taken instead of being
+    propagated again.
     """
-    if preserve_original:
-        font = copy.deepcopy(font)
+    # The glyph filter removes glyphs, kerning and classes from the font it
+    # works on, which must not be the caller's
+    if preserve_original or glyph_filter is not None:
+        with stage(profile, "snapshot_font", len(font.glyphs)):
+            font = snapshot_font(font)
+    if glyph_filter is not None:
+        with stage(profile, "subset_glyphs"):
+            glyph_names = {glyph.name for glyph in font.glyphs}
+            subset_glyphs(font, glyph_filter)
     if glyph_data is not None and not isinstance(glyph_data, glyphdata.GlyphData):
         glyph_data = glyphdata.GlyphData.from_files(*glyph_data)
-    font = preflight_glyphs(
-        font, glyph_data=glyph_data, do_propagate_all_anchors=propagate_anchors
-    )
-    builder = UFOBuilder(
-        font,
-        ufo_module=ufo_module,
-        family_name=family_name,
-        minimize_glyphs_diffs=minimize_glyphs_diffs,
-        generate_GDEF=generate_GDEF,
-        store_editor_state=store_editor_state,
-        write_skipexportglyphs=write_skipexportglyphs,
-        expand_includes=expand_includes,
-        minimal=minimal,
-        glyph_data=glyph_data,
-    )
-
-    result = list(builder.masters)
+    with _count_interpolation_cache_stats(profile, font):
+        font = preflight_glyphs(
+            font,
+            glyph_data=glyph_data,
+            profile=profile,
+            workers=workers,
+            anchor_cache=anchor_cache,
+            do_propagate_all_anchors=propagate_anchors,
+        )
+        builder = UFOBuilder(
+            font,
+            ufo_module=ufo_module,
+            family_name=family_name,
+            minimize_glyphs_diffs=minimize_glyphs_diffs,
+            generate_GDEF=generate_GDEF,
+            store_editor_state=store_editor_state,
+            write_skipexportglyphs=write_skipexportglyphs,
+            expand_includes=expand_includes,
+            minimal=minimal,
+            glyph_data=glyph_data,
+            compact_kerning=compact_kerning,
+            profile=profile,
+        )
+
+        result = list(builder.masters)
+    if glyph_filter is not None:
+        with stage(profile, "subset_features"):
+            subset_features(result, glyph_names)
 
     if include_instances:
         return result, builder.instance_data
@@ -106,6 +163,12 @@ def to_designspace(
     minimal=False,
     glyph_data=None,
     preserve_original=False,
+    compact_kerning=False,
+    designspace_only=False,
+    glyph_filter=None,
+    profile=None,
+    workers=1,
+    anchor_cache=None,
 ):
     """Take a GSFont object and convert it into a Designspace Document + UFOS.
     The UFOs are available as the attribute `font` of each SourceDescriptor of
@@ -132,36 +195,98 @@ def to_designspace(
     UFO's features.fea, containing GlyphClassDef and LigatureCaretByPos.
 
     If preserve_original is True, this works on a copy of the font object
-    to avoid modifying the original object.
+    to avoid modifying the original object. Only the glyphs that the conversion
+    modifies are deep-copied (see `glyphsLib.builder.snapshot`).
 
     The optional glyph_data parameter takes a list of GlyphData.xml paths or
     a pre-parsed GlyphData object that overrides the default one.
+
+    If compact_kerning is True, kerning pairs that are identical in all masters
+    are stored once and shared by the master UFOs' kerning, which cuts memory
+    for families with many masters; kerning sparsity statistics are logged.
+
+    The optional glyph_filter parameter, a collection of glyph names or a
+    callable taking a glyph name and returning a boolean, restricts the
+    conversion to the selected glyphs plus the glyphs they use as components,
+    transitively; kerning, kerning groups and feature code are pruned
+    accordingly (see `glyphsLib.builder.subset`). The conversion then always
+    works on a copy of the font object, as with preserve_original.
+
+    The optional profile parameter takes a `glyphsLib.builder.BuildProfile`
+    in which the time spent in each stage of the conversion is recorded.
+
+    The optional workers parameter is the number of processes propagating the
+    anchors (default: 1, i.e. serially in this process; None uses the number
+    of CPUs), see `propagate_all_anchors`.
+
+    The optional anchor_cache parameter takes an `AnchorPropagationCache`, or
+    the path of a JSON file keeping one between conversions, from which the
+    anchors of the glyphs that did not change are taken instead of being
+    propagated again.
+
+    If designspace_only is True, only the designspace skeleton is built: axes,
+    sources, instances, bracket layer rules and STAT labels. Glyphs, features and
+    kerning are not converted, the sources' UFOs only hold font-level info and
+    lib, and of the preflight transformations only `align_alternate_layers` is
+    run, as it adds the bracket layers that the rules are made from.
     """
-    if preserve_original:
-        font = copy.deepcopy(font)
+    # The glyph filter removes glyphs, kerning and classes from the font it
+    # works on, which must not be the caller's
+    if preserve_original or glyph_filter is not None:
+        with stage(profile, "snapshot_font", len(font.glyphs)):
+            font = snapshot_font(font)
+    if glyph_filter is not None:
+        with stage(profile, "subset_glyphs"):
+            glyph_names = {glyph.name for glyph in font.glyphs}
+            subset_glyphs(font, glyph_filter)
     if glyph_data is not None and not isinstance(glyph_data, glyphdata.GlyphData):
         glyph_data = glyphdata.GlyphData.from_files(*glyph_data)
-    font = preflight_glyphs(
-        font, glyph_data=glyph_data, do_propagate_all_anchors=propagate_anchors
-    )
-    builder = UFOBuilder(
-        font,
-        ufo_module=ufo_module,
-        family_name=family_name,
-        instance_dir=instance_dir,
-        use_designspace=True,
-        minimize_glyphs_diffs=minimize_glyphs_diffs,
-        generate_GDEF=generate_GDEF,
-        store_editor_state=store_editor_state,
-        write_skipexportglyphs=write_skipexportglyphs,
-        expand_includes=expand_includes,
-        minimal=minimal,
-        glyph_data=glyph_data,
-    )
-    return builder.designspace
-
-
-def preflight_glyphs(font, *, glyph_data=None, **flags):
+    with _count_interpolation_cache_stats(profile, font):
+        if designspace_only:
+            font = preflight_glyphs(
+                font,
+                glyph_data=glyph_data,
+                profile=profile,
+                do_apply_origin_anchor=False,
+                do_propagate_all_anchors=False,
+            )
+        else:
+            font = preflight_glyphs(
+                font,
+                glyph_data=glyph_data,
+                profile=profile,
+                workers=workers,
+                anchor_cache=anchor_cache,
+                do_propagate_all_anchors=propagate_anchors,
+            )
+        builder = UFOBuilder(
+            font,
+            ufo_module=ufo_module,
+            family_name=family_name,
+            instance_dir=instance_dir,
+            use_designspace=True,
+            minimize_glyphs_diffs=minimize_glyphs_diffs,
+            generate_GDEF=generate_GDEF,
+            store_editor_state=store_editor_state,
+            write_skipexportglyphs=write_skipexportglyphs,
+            expand_includes=expand_includes,
+            minimal=minimal,
+            glyph_data=glyph_data,
+            compact_kerning=compact_kerning,
+            designspace_only=designspace_only,
+            profile=profile,
+        )
+        designspace = builder.designspace
+    if glyph_filter is not None and not designspace_only:
+        with stage(profile, "subset_features"):
+            ufos = {id(source.font): source.font for source in designspace.sources}
+            subset_features(ufos.values(), glyph_names)
+    return designspace
+
+
+def preflight_glyphs(
+    font, *, glyph_data=None, profile=None, workers=1, anchor_cache=None, **flags
+):
     """Run a set of transformations over a GSFont object to make
     it easier to convert to UFO; resolve all the "smart stuff".
 
@@ -179,6 +304,13 @@ def preflight_glyphs(font, *, glyph_data=None, **flags):
         font: a GSFont object
         glyph_data: an optional GlyphData object associating various properties to
             glyph names (e.g. category) that overrides the default one
+        profile: an optional `BuildProfile` recording the time spent in each
+            transformation
+        workers: the number of processes propagating the anchors (None means
+            the number of CPUs)
+        anchor_cache: an optional `AnchorPropagationCache` for the propagation
+            of anchors, or the path of the JSON file it is loaded from, if it
+            exists, and saved to afterwards
         **flags: a set of boolean flags to enable/disable specific transformations,
             named `do_<transformation_name>`, e.g. `do_propagate_all_anchors=False`
             will disable the propagation of anchors.
@@ -201,18 +333,60 @@ def preflight_glyphs(font, *, glyph_data=None, **flags):
         else:
             raise ValueError(f"Invalid value for do_{transform.__name__}")
         logger.info(f"Running '{transform.__name__}' transformation")
-        transform(font, glyph_data=glyph_data)
+        options = {}
+        cache_path = None
+        if transform is propagate_all_anchors:
+            options["workers"] = workers
+            options["cache"] = anchor_cache
+            if isinstance(anchor_cache, (str, os.PathLike)):
+                cache_path = anchor_cache
+                options["cache"] = _load_anchor_cache(cache_path)
+        with stage(profile, "preflight." + transform.__name__, len(font.glyphs)):
+            transform(font, glyph_data=glyph_data, **options)
+        if cache_path is not None:
+            options["cache"].save(cache_path)
     if flags:
         logger.warning(f"preflight_glyphs has unused `flags` arguments: {flags}")
     return font
 
 
+@contextmanager
+def _count_interpolation_cache_stats(profile, font):
+    # The InterpolationModels of a font live as long as the font, count the
+    # hits and misses of this conversion only
+    if profile is None:
+        yield
+        return
+    models = interpolation_models(font)
+    before = models.stats()
+    try:
+        yield
+    finally:
+        for name, stats in models.stats().items():
+            profile.add_cache_stats(
+                "interpolation_models." + name,
+                stats["hits"] - before[name]["hits"],
+                stats["misses"] - before[name]["misses"],
+            )
+
+
+def _load_anchor_cache(path):
+    if not os.path.exists(path):
+        return AnchorPropagationCache()
+    try:
+        return AnchorPropagationCache.load(path)
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning("Ignoring anchor cache %s, which can't be read: %s", path, e)
+        return AnchorPropagationCache()
+
+
 def to_glyphs(
     ufos_or_designspace,
     glyphs_module=classes,
     ufo_module=None,
     minimize_ufo_diffs=False,
     expand_includes=False,
+    profile=None,
 ):
     """
     Take a list of UFOs or a single DesignspaceDocument with attached UFOs
@@ -224,6 +398,9 @@ def to_glyphs(
     This should be the inverse function of `to_ufos` and `to_designspace`,
     so we should have to_glyphs(to_ufos(font)) == font
     and also to_glyphs(to_designspace(font)) == font
+
+    The optional profile parameter takes a `glyphsLib.builder.BuildProfile`
+    in which the time spent in each stage of the conversion is recorded.
     """
     if hasattr(ufos_or_designspace, "sources"):
         builder = GlyphsBuilder(
@@ -232,6 +409,7 @@ def to_glyphs(
             ufo_module=ufo_module,
             minimize_ufo_diffs=minimize_ufo_diffs,
             expand_includes=expand_includes,
+            profile=profile,
         )
     else:
         builder = GlyphsBuilder(
@@ -240,5 +418,6 @@ def to_glyphs(
             ufo_module=ufo_module,
             minimize_ufo_diffs=minimize_ufo_diffs,
             expand_includes=expand_includes,
+            profile=profile,
         )
     return builder.font
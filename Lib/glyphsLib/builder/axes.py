@@ -82,6 +82,15 @@ def user_loc_string_to_value(axis_tag, user_loc):
     raise NotImplementedError
 
 
+# (class, user location) and (Glyphs UI string, class) pairs, sorted once to
+# look up the closest ones
+_WIDTH_CLASSES = sorted(WIDTH_CLASS_TO_VALUE.items())
+_INSTANCE_CODES = {
+    tag: sorted((code, class_) for code, class_ in codes.items() if code is not None)
+    for tag, codes in (("wght", WEIGHT_CODES), ("wdth", WIDTH_CODES))
+}
+
+
 def user_loc_value_to_class(axis_tag, user_loc):
     """Return the OS/2 weight or width class that is closest to the provided
     user location. For weight the user location is between 0 and 1000 and for
@@ -95,10 +104,7 @@ def user_loc_value_to_class(axis_tag, user_loc):
     if axis_tag == "wght":
         return int(user_loc)
     elif axis_tag == "wdth":
-        return min(
-            sorted(WIDTH_CLASS_TO_VALUE.items()),
-            key=lambda item: abs(item[1] - user_loc),
-        )[0]
+        return min(_WIDTH_CLASSES, key=lambda item: abs(item[1] - user_loc))[0]
 
     raise NotImplementedError
 
@@ -112,35 +118,32 @@ def user_loc_value_to_instance_string(axis_tag, user_loc):
     >>> user_loc_value_to_instance_string('wdth', 150)
     'Extra Expanded'
     """
-    codes = {}
-    if axis_tag == "wght":
-        codes = WEIGHT_CODES
-    elif axis_tag == "wdth":
-        codes = WIDTH_CODES
-    else:
+    if axis_tag not in _INSTANCE_CODES:
         raise NotImplementedError
     class_ = user_loc_value_to_class(axis_tag, user_loc)
-    return min(
-        sorted((code, class_) for code, class_ in codes.items() if code is not None),
-        key=lambda item: abs(item[1] - class_),
-    )[0]
+    return min(_INSTANCE_CODES[axis_tag], key=lambda item: abs(item[1] - class_))[0]
 
 
 def update_mapping_from_instances(
     mapping, instances, axis_def, minimize_glyphs_diffs, cp_only=False
 ):
     # Collect the axis mappings from instances and update the mapping dict.
-    for instance in instances:
-        if instance.type == InstanceType.VARIABLE:
-            continue
-        if is_instance_active(instance) or minimize_glyphs_diffs:
-            designLoc = axis_def.get_design_loc(instance)
-            if cp_only:
-                # Only use the Axis Location custom parameter for the user location
-                userLoc = axis_def.get_user_loc_from_axis_location_cp(instance)
-            else:
-                # Use all heuristics to derive a user location
-                userLoc = axis_def.get_user_loc(instance)
+    # The instances can be given as an InstanceLocations matrix.
+    if not isinstance(instances, InstanceLocations):
+        instances = InstanceLocations(instances)
+    if cp_only:
+        # Only use the Axis Location custom parameter for the user location
+        user_locs = instances.axis_location_column(axis_def)
+    else:
+        # Use all heuristics to derive a user location
+        user_locs = instances.user_column(axis_def)
+    for instance, active, designLoc, userLoc in zip(
+        instances.instances,
+        instances.active,
+        instances.design_column(axis_def),
+        user_locs,
+    ):
+        if active or minimize_glyphs_diffs:
             if userLoc is None:
                 # May happen if the custom parameter is disabled
                 continue
@@ -172,7 +175,8 @@ def to_designspace_axes(self):
         if not cp.disabled
     ]
 
-    for axis_def in get_axis_definitions(self.font):
+    axis_locations = self.axis_locations
+    for axis_def in axis_locations.axis_definitions():
         axis = self.designspace.newAxisDescriptor()
         axis.tag = axis_def.tag
         axis.name = axis_def.name
@@ -194,7 +198,7 @@ def to_designspace_axes(self):
         if custom_mapping:
             if axis.tag in custom_mapping:
                 mapping = {float(k): v for k, v in custom_mapping[axis.tag].items()}
-                regularDesignLoc = axis_def.get_design_loc(regular_master)
+                regularDesignLoc = axis_locations.design_loc(axis_def, regular_master)
                 reverse_mapping = {dl: ul for ul, dl in sorted(mapping.items())}
                 regularUserLoc = piecewiseLinearMap(regularDesignLoc, reverse_mapping)
             else:
@@ -210,8 +214,8 @@ def to_designspace_axes(self):
             # instances.
             mapping = {}
             for master in self.font.masters:
-                designLoc = axis_def.get_design_loc(master)
-                userLoc = axis_def.get_user_loc(master)
+                designLoc = axis_locations.design_loc(axis_def, master)
+                userLoc = axis_locations.user_loc(axis_def, master)
                 if userLoc in mapping and mapping[userLoc] != designLoc:
                     logger.warning(
                         f"Axis {axis_def.tag}: Master '{master.name}' redefines "
@@ -222,7 +226,7 @@ def to_designspace_axes(self):
 
             update_mapping_from_instances(
                 mapping,
-                self.font.instances,
+                axis_locations.instance_locations(),
                 axis_def,
                 minimize_glyphs_diffs=self.minimize_glyphs_diffs,
                 # Glyphs doesn't deduce instance mappings if font uses axis locations.
@@ -230,15 +234,15 @@ def to_designspace_axes(self):
                 cp_only=True,
             )
 
-            regularDesignLoc = axis_def.get_design_loc(regular_master)
-            regularUserLoc = axis_def.get_user_loc(regular_master)
+            regularDesignLoc = axis_locations.design_loc(axis_def, regular_master)
+            regularUserLoc = axis_locations.user_loc(axis_def, regular_master)
         else:
             # Build the mapping from the instances because they have both
             # a user location and a design location.
             instance_mapping = {}
             update_mapping_from_instances(
                 instance_mapping,
-                self.font.instances,
+                axis_locations.instance_locations(),
                 axis_def,
                 minimize_glyphs_diffs=self.minimize_glyphs_diffs,
             )
@@ -246,7 +250,7 @@ def to_designspace_axes(self):
             master_mapping = {}
             for master in self.font.masters:
                 # Glyphs masters don't have a user location
-                userLoc = designLoc = axis_def.get_design_loc(master)
+                userLoc = designLoc = axis_locations.design_loc(axis_def, master)
                 master_mapping[userLoc] = designLoc
 
             # Prefer the instance-based mapping (but only if interesting)
@@ -256,7 +260,7 @@ def to_designspace_axes(self):
                 else master_mapping
             )
 
-            regularDesignLoc = axis_def.get_design_loc(regular_master)
+            regularDesignLoc = axis_locations.design_loc(axis_def, regular_master)
             # Glyphs masters don't have a user location, so we compute it by
             # looking at the axis mapping in reverse.
             reverse_mapping = {dl: ul for ul, dl in sorted(mapping.items())}
@@ -588,6 +592,123 @@ def get_axis_definitions(font):
     ]
 
 
+_NOT_COMPUTED = object()
+
+
+def _axes_key(axes_parameter):
+    if axes_parameter is None:
+        return None
+    return tuple(
+        (axis.get("Tag"), axis["Name"], bool(axis.get("Hidden")))
+        for axis in axes_parameter
+    )
+
+
+class AxisLocationCache:
+    """Compute the axis definitions of a font, and the design and user locations
+    of its masters and instances along them, once per build.
+
+    The font is assumed not to change during the build, except for its "Axes"
+    custom parameter: when it does, the axis definitions are recomputed and all
+    the locations are forgotten.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self._axes_key = _NOT_COMPUTED
+        self._axis_defs = None
+        # (getter name, axis definition name, id of the master or instance) ->
+        # (master or instance, location). The object is kept alongside its
+        # location so that its id can't be reused.
+        self._locations = {}
+        self._instance_locations = None
+
+    def axis_definitions(self):
+        """Return the same value as `get_axis_definitions` for the font."""
+        key = _axes_key(self.font.customParameters["Axes"])
+        if key != self._axes_key:
+            self._axes_key = key
+            self._axis_defs = get_axis_definitions(self.font)
+            self._locations.clear()
+            self._instance_locations = None
+        return self._axis_defs
+
+    def instance_locations(self):
+        """Return the `InstanceLocations` of the instances of the font."""
+        self.axis_definitions()
+        if self._instance_locations is None:
+            self._instance_locations = InstanceLocations(self.font.instances)
+        return self._instance_locations
+
+    def design_loc(self, axis_def, master_or_instance):
+        """Return `axis_def.get_design_loc(master_or_instance)`, memoized.
+
+        The axis definition must come from `axis_definitions`.
+        """
+        return self._get("get_design_loc", axis_def, master_or_instance)
+
+    def user_loc(self, axis_def, master_or_instance):
+        """Return `axis_def.get_user_loc(master_or_instance)`, memoized."""
+        return self._get("get_user_loc", axis_def, master_or_instance)
+
+    def user_loc_from_axis_location_cp(self, axis_def, master_or_instance):
+        """Return `axis_def.get_user_loc_from_axis_location_cp(master_or_instance)`,
+        memoized."""
+        return self._get(
+            "get_user_loc_from_axis_location_cp", axis_def, master_or_instance
+        )
+
+    def _get(self, getter, axis_def, master_or_instance):
+        key = (getter, axis_def.name, id(master_or_instance))
+        try:
+            return self._locations[key][1]
+        except KeyError:
+            pass
+        value = getattr(axis_def, getter)(master_or_instance)
+        self._locations[key] = (master_or_instance, value)
+        return value
+
+
+class InstanceLocations:
+    """The locations of instances along axes, as a matrix with one row per
+    instance and one column per axis definition and kind of location.
+
+    The columns are lists aligned with `instances`, computed the first time they
+    are asked for. Variable font settings, which have no location, are left out.
+    """
+
+    def __init__(self, instances):
+        self.instances = [i for i in instances if i.type != InstanceType.VARIABLE]
+        self.active = [bool(is_instance_active(i)) for i in self.instances]
+        self._rows = {id(instance): row for row, instance in enumerate(self.instances)}
+        self._columns = {}
+
+    def row(self, instance):
+        """Return the index of the row of an instance."""
+        return self._rows[id(instance)]
+
+    def design_column(self, axis_def):
+        """Return the design locations of the instances along an axis."""
+        return self._column("get_design_loc", axis_def)
+
+    def user_column(self, axis_def):
+        """Return the user locations of the instances along an axis."""
+        return self._column("get_user_loc", axis_def)
+
+    def axis_location_column(self, axis_def):
+        """Return the user locations of the instances along an axis given by
+        their "Axis Location" custom parameters, or None."""
+        return self._column("get_user_loc_from_axis_location_cp", axis_def)
+
+    def _column(self, getter, axis_def):
+        key = (getter, axis_def.name)
+        column = self._columns.get(key)
+        if column is None:
+            get = getattr(axis_def, getter)
+            column = self._columns[key] = [get(i) for i in self.instances]
+        return column
+
+
 def _is_subset_of_default_axes(axes_parameter):
     if len(axes_parameter) > 3:
         return False
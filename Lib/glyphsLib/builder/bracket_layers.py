@@ -44,6 +44,9 @@ def to_designspace_bracket_layers(self):
         # the 'public.skipExportGlyphs' list as they might be used as components
         if not layer.parent.export:
             any_non_export_bracket_glyphs = True
+            if self.designspace_only:
+                # Otherwise added when the bracket glyph is built
+                self.skip_export_glyphs.add(bracket_glyph_name)
             continue
 
         box_with_name = {tag_to_name[k]: v for k, v in box_with_tag.items()}
@@ -68,7 +71,8 @@ def to_designspace_bracket_layers(self):
         self._designspace.lib[FEAVAR_FEATURETAG_LIB_KEY] = feat
 
     # Finally, copy bracket layers to their own glyphs.
-    copy_bracket_layers_to_ufo_glyphs(self, bracket_layer_map)
+    if not self.designspace_only:
+        copy_bracket_layers_to_ufo_glyphs(self, bracket_layer_map)
 
     # we need to update the skipExportGlyphs list if there were any bracket glyphs
     # marked as non-export. We do it in-place because a reference to the same list
@@ -81,7 +85,7 @@ def to_designspace_bracket_layers(self):
 
     # re-generate the GDEF table since we have added new BRACKET glyphs, which may
     # also need to be included: https://github.com/googlefonts/glyphsLib/issues/578
-    if self.generate_GDEF:
+    if self.generate_GDEF and not self.designspace_only:
         self.regenerate_gdef()
 
 
@@ -16,6 +16,7 @@
 from collections import OrderedDict, defaultdict
 import os
 from textwrap import dedent
+from time import perf_counter
 from typing import Dict
 
 from fontTools import designspaceLib
@@ -27,7 +28,14 @@ from .constants import (
     BRACKET_GLYPH_RE,
     FONT_CUSTOM_PARAM_PREFIX,
 )
-from .axes import WEIGHT_AXIS_DEF, WIDTH_AXIS_DEF, find_base_style, class_to_value
+from .axes import (
+    WEIGHT_AXIS_DEF,
+    WIDTH_AXIS_DEF,
+    AxisLocationCache,
+    find_base_style,
+    class_to_value,
+)
+from .profiling import stage
 from glyphsLib.util import LoggerMixin, _DeprecatedArgument
 
 
@@ -50,6 +58,9 @@ class UFOBuilder(LoggerMixin):
         expand_includes=False,
         minimal=False,
         glyph_data=None,
+        compact_kerning=False,
+        designspace_only=False,
+        profile=None,
     ):
         """Create a builder that goes from Glyphs to UFO + designspace.
 
@@ -86,6 +97,16 @@ class UFOBuilder(LoggerMixin):
         minimal -- If True, it is assumed that the UFOs will only be used in font
                    production, and unnecessary steps will be skipped.
         glyph_data -- A list of GlyphData.
+        compact_kerning -- If True, kerning pairs that are identical in all
+                           masters share their keys and values between the
+                           master UFOs, and kerning sparsity statistics are
+                           logged and stored in `kerning_sparsity`.
+        designspace_only -- If True, the designspace only gets its skeleton (axes,
+                            sources, instances, rules, STAT labels) and the
+                            source UFOs only hold font-level info and lib; no
+                            glyphs, features or kerning are converted.
+        profile -- A glyphsLib.builder.profiling.BuildProfile in which to record
+                   the time spent in each conversion stage.
         """
         self.font = font
 
@@ -105,6 +126,10 @@ class UFOBuilder(LoggerMixin):
         self.skip_export_glyphs = set()
         self.expand_includes = expand_includes
         self.minimal = minimal
+        self.compact_kerning = compact_kerning
+        self.kerning_sparsity = None
+        self.designspace_only = designspace_only
+        self.profile = profile
 
         if propagate_anchors is not _DeprecatedArgument:
             from warnings import warn
@@ -137,6 +162,14 @@ class UFOBuilder(LoggerMixin):
         # for passing into pens as glyph sets.
         self._glyph_sets: Dict[str, Dict[str, classes.GSLayer]] = {}
 
+        # The axis definitions of the font, and the design and user locations of
+        # the masters and instances along them.
+        self.axis_locations = AxisLocationCache(font)
+
+        # The features parsed for the "Replace Prefix" custom parameters, by
+        # features text and glyph names (see replace_prefixes).
+        self._fea_documents = {}
+
         # The designSpaceDocument object that will be built.
         # The sources will be built in any case, at the same time that we build
         # the master UFOs, when the user requests them.
@@ -223,6 +256,8 @@ class UFOBuilder(LoggerMixin):
     @property
     def masters(self):
         """Get an iterator over master UFOs that match the given family_name."""
+        if self.designspace_only:
+            raise ValueError("Master UFOs are not built in designspace_only mode.")
         if self._sources:
             for source in self._sources.values():
                 yield source.font
@@ -231,9 +266,12 @@ class UFOBuilder(LoggerMixin):
         # TODO(jamesgk) maybe create one font at a time to reduce memory usage
         # TODO: (jany) in the future, return a lazy iterator that builds UFOs
         #     on demand.
-        self.to_ufo_font_attributes(self.family_name)  # .font
+        profile = self.profile
+        with stage(profile, "to_ufo_font_attributes"):
+            self.to_ufo_font_attributes(self.family_name)  # .font
 
-        self.to_ufo_layers()  # below!
+        with stage(profile, "to_ufo_layers"):
+            self.to_ufo_layers()  # below!
 
         for master_id, source in self._sources.items():
             ufo = source.font
@@ -241,8 +279,9 @@ class UFOBuilder(LoggerMixin):
             if self.propagate_anchors:  # deprecated, will be removed one day
                 self.to_ufo_propagate_font_anchors(ufo)  # .anchor_propagation
             if not self.minimal:
-                for layer in list(ufo.layers):
-                    self.to_ufo_layer_lib(master, ufo, layer)  # .user_data
+                with stage(profile, "to_ufo_layer_lib", len(ufo.layers)):
+                    for layer in list(ufo.layers):
+                        self.to_ufo_layer_lib(master, ufo, layer)  # .user_data
 
             # Color layer mapping is stored using layer IDs, we now rewrite it
             # to use the final UFO layer names.
@@ -252,10 +291,13 @@ class UFOBuilder(LoggerMixin):
             # parameters so it requires UFOs have their features set first; at the
             # same time, to generate a GDEF table we first need to have defined the
             # glyphOrder, exported the glyphs and propagated anchors from components.
-            self.to_ufo_master_features(ufo, master)  # .features
-            self.to_ufo_custom_params(ufo, master)  # .custom_params
+            with stage(profile, "to_ufo_master_features"):
+                self.to_ufo_master_features(ufo, master)  # .features
+            with stage(profile, "to_ufo_custom_params"):
+                self.to_ufo_custom_params(ufo, master)  # .custom_params
 
-            self.to_ufo_color_layers(ufo, master)  # .color_layers
+            with stage(profile, "to_ufo_color_layers"):
+                self.to_ufo_color_layers(ufo, master)  # .color_layers
 
         if self.write_skipexportglyphs and self.skip_export_glyphs:
             # Sanitize skip list and write it to both Designspace- and UFO-level lib
@@ -267,8 +309,15 @@ class UFOBuilder(LoggerMixin):
             for source in self._sources.values():
                 source.font.lib["public.skipExportGlyphs"] = skip_export_glyphs
 
-        self.to_ufo_groups()  # .groups
-        self.to_ufo_kerning()  # .kerning
+        with stage(profile, "to_ufo_groups"):
+            self.to_ufo_groups()  # .groups
+        with stage(profile, "to_ufo_kerning"):
+            self.to_ufo_kerning()  # .kerning
+        if profile is not None:
+            profile.add_items(
+                "to_ufo_kerning",
+                sum(len(source.font.kerning) for source in self._sources.values()),
+            )
 
         for source in self._sources.values():
             yield source.font
@@ -294,9 +343,7 @@ class UFOBuilder(LoggerMixin):
                     supplementary_layer_data.append((glyph, layer))
                     continue
 
-                ufo_layer = self.to_ufo_layer(glyph, layer)  # .layers
-                ufo_glyph = ufo_layer.newGlyph(glyph.name)
-                self.to_ufo_glyph(ufo_glyph, layer, glyph)  # .glyph
+                self._to_ufo_glyph_layer(glyph, layer, glyph)
 
         # And sublayers (brace, bracket, ...) second.
         for glyph, layer in supplementary_layer_data:
@@ -343,9 +390,43 @@ class UFOBuilder(LoggerMixin):
                 # palette layers are handled by to_ufo_color_layers.
                 continue
             else:
-                ufo_layer = self.to_ufo_layer(glyph, layer)  # .layers
-                ufo_glyph = ufo_layer.newGlyph(glyph.name)
-                self.to_ufo_glyph(ufo_glyph, layer, layer.parent)  # .glyph
+                self._to_ufo_glyph_layer(glyph, layer, layer.parent)
+
+    def _to_ufo_glyph_layer(self, glyph, layer, parent):
+        ufo_layer = self.to_ufo_layer(glyph, layer)  # .layers
+        ufo_glyph = ufo_layer.newGlyph(glyph.name)
+        profile = self.profile
+        if profile is None:
+            self.to_ufo_glyph(ufo_glyph, layer, parent)  # .glyph
+            return
+        start = perf_counter()
+        self.to_ufo_glyph(ufo_glyph, layer, parent)  # .glyph
+        if profile.slowest_glyphs:
+            profile.add_glyph_time(glyph.name, layer.name, perf_counter() - start)
+        profile.add_items("to_ufo_layers", 1)
+
+    def _collect_designspace_skeleton_glyph_data(self):
+        master_layer_ids = {m.id for m in self.font.masters}
+        for glyph in self.font.glyphs:
+            if not glyph.export:
+                self.skip_export_glyphs.add(glyph.name)
+            for layer in glyph.layers.values():
+                if (
+                    layer.associatedMasterId != layer.layerId
+                    and (
+                        layer.layerId in master_layer_ids
+                        or layer.associatedMasterId in master_layer_ids
+                    )
+                    and layer._is_bracket_layer()
+                    and ".background" not in layer.name
+                ):
+                    self.bracket_layers.append(layer)
+
+        if self.write_skipexportglyphs and self.skip_export_glyphs:
+            skip_export_glyphs = sorted(self.skip_export_glyphs)
+            self._designspace.lib["public.skipExportGlyphs"] = skip_export_glyphs
+            for source in self._sources.values():
+                source.font.lib["public.skipExportGlyphs"] = skip_export_glyphs
 
     @property
     def designspace(self):
@@ -356,16 +437,31 @@ class UFOBuilder(LoggerMixin):
             return self._designspace
 
         self._designspace_is_complete = True
-        list(self.masters)  # Make sure that the UFOs are built
-        self.to_designspace_axes()  # .axes
-        self.to_designspace_sources()  # .sources
-        self.to_designspace_instances()  # .instances
+        profile = self.profile
+        if self.designspace_only:
+            # Only create the UFOs holding the source names and font-level data,
+            # and gather what the rules and skip list need from the glyphs.
+            with stage(profile, "to_ufo_font_attributes"):
+                self.to_ufo_font_attributes(self.family_name)  # .font
+            self._collect_designspace_skeleton_glyph_data()
+        else:
+            list(self.masters)  # Make sure that the UFOs are built
+        with stage(profile, "to_designspace_axes"):
+            self.to_designspace_axes()  # .axes
+        with stage(profile, "to_designspace_sources"):
+            self.to_designspace_sources()  # .sources
+        with stage(profile, "to_designspace_instances", len(self.font.instances)):
+            self.to_designspace_instances()  # .instances
         self.to_designspace_family_user_data()  # .user_data
 
         if self.bracket_layers:
-            self.to_designspace_bracket_layers()  # .bracket_layers
+            with stage(
+                profile, "to_designspace_bracket_layers", len(self.bracket_layers)
+            ):
+                self.to_designspace_bracket_layers()  # .bracket_layers
 
-        self.to_designspace_stat()  # .axisLabels
+        with stage(profile, "to_designspace_stat"):
+            self.to_designspace_stat()  # .axisLabels
 
         # append base style shared by all masters to designspace file name
         base_family = self.family_name or "Unnamed"
@@ -457,6 +553,7 @@ class GlyphsBuilder(LoggerMixin):
         ufo_module=None,
         minimize_ufo_diffs=False,
         expand_includes=False,
+        profile=None,
     ):
         """Create a builder that goes from UFOs + designspace to Glyphs.
 
@@ -487,10 +584,13 @@ class GlyphsBuilder(LoggerMixin):
                               when going UFOs->glyphs->UFOs
         expand_includes -- If True, expand include statements in the UFOs' features.fea
                            and inline them in the GSFont features.
+        profile -- A glyphsLib.builder.profiling.BuildProfile in which to record
+                   the time spent in each conversion stage.
         """
         self.glyphs_module = glyphs_module
         self.minimize_ufo_diffs = minimize_ufo_diffs
         self.expand_includes = expand_includes
+        self.profile = profile
 
         if designspace is not None:
             if ufos:
@@ -519,6 +619,8 @@ class GlyphsBuilder(LoggerMixin):
         if self._font is not None:
             return self._font
 
+        profile = self.profile
+
         # Sort UFOS in the original order from the Glyphs file
         sorted_sources = self.to_glyphs_ordered_masters()
 
@@ -538,8 +640,10 @@ class GlyphsBuilder(LoggerMixin):
                     if not BRACKET_GLYPH_RE.match(glyph_name)
                 ]
 
-            self.to_glyphs_font_attributes(source, master, is_initial=(index == 0))
-            self.to_glyphs_master_attributes(source, master)
+            with stage(profile, "to_glyphs_font_attributes"):
+                self.to_glyphs_font_attributes(source, master, is_initial=(index == 0))
+            with stage(profile, "to_glyphs_master_attributes"):
+                self.to_glyphs_master_attributes(source, master)
             self._font.masters.insert(len(self._font.masters), master)
             self._sources[master.id] = source
 
@@ -580,12 +684,16 @@ class GlyphsBuilder(LoggerMixin):
 
             for layer in _sorted_backgrounds_last(source.font.layers):
                 self.to_glyphs_layer_lib(layer, master)
-                for glyph in layer:
-                    self.to_glyphs_glyph(glyph, layer, master)
+                with stage(profile, "to_glyphs_glyph", len(layer)):
+                    for glyph in layer:
+                        self.to_glyphs_glyph(glyph, layer, master)
 
-        self.to_glyphs_features()
-        self.to_glyphs_groups()
-        self.to_glyphs_kerning()
+        with stage(profile, "to_glyphs_features"):
+            self.to_glyphs_features()
+        with stage(profile, "to_glyphs_groups"):
+            self.to_glyphs_groups()
+        with stage(profile, "to_glyphs_kerning"):
+            self.to_glyphs_kerning()
 
         # Now that all GSGlyph are built, restore the glyph order
         if self.designspace.sources:
@@ -604,9 +712,11 @@ class GlyphsBuilder(LoggerMixin):
                 self.to_glyphs_layer_order(glyph)
 
         self.to_glyphs_family_user_data_from_designspace()
-        self.to_glyphs_axes()
+        with stage(profile, "to_glyphs_axes"):
+            self.to_glyphs_axes()
         self.to_glyphs_sources()
-        self.to_glyphs_instances()
+        with stage(profile, "to_glyphs_instances"):
+            self.to_glyphs_instances()
 
         return self._font
 
@@ -160,13 +160,23 @@ class GlyphsObjectProxy:
             return expand_text_tokens(self._owner.properties.get(key), self._owner)
         return None
 
+    def present_keys(self):
+        """Return the names of the custom parameters and properties that the
+        object has."""
+        keys = {key for key, values in self._lookup.items() if values}
+        if hasattr(self._owner, "properties"):
+            keys.update(item.name for item in self._owner.properties)
+        return keys
+
 
 class UFOProxy:
     """Record access to the UFO's lib custom parameters"""
 
-    def __init__(self, ufo):
+    def __init__(self, ufo, fea_documents=None):
         self._owner = ufo
         self._handled = set()
+        # The cache of parsed features to pass to replace_prefixes
+        self.fea_documents = fea_documents
 
     def has_info_attr(self, name):
         return hasattr(self._owner.info, name)
@@ -204,6 +214,14 @@ class AbstractParamHandler:
     def to_ufo(self):
         pass
 
+    def glyphs_keys(self):
+        """Return the names of the custom parameters and properties that
+        `to_ufo` reads, to call it only for objects that have one of them.
+
+        None means that it may read anything, and must always be called.
+        """
+        return None
+
 
 class ParamHandler(AbstractParamHandler):
     def __init__(
@@ -232,6 +250,13 @@ class ParamHandler(AbstractParamHandler):
         self.value_to_ufo = value_to_ufo
         self.value_to_glyphs = value_to_glyphs
 
+    def glyphs_keys(self):
+        return tuple(
+            key
+            for key in (self.glyphs_name, self.glyphs_long_name, self.glyphs3_property)
+            if key is not None
+        )
+
     # By default, the parameter is read from/written to:
     #  - the Glyphs object's customParameters
     #  - the UFO's info object if it has a matching attribute, else the lib
@@ -311,6 +336,41 @@ def register(handler):
     KNOWN_PARAM_HANDLERS.append(handler)
 
 
+# (handlers, number of handlers, indices of the handlers to always call,
+#  {key: indices of the handlers reading it}), see _handlers_to_ufo
+_handler_index = None
+
+
+def _handlers_to_ufo(glyphs_proxy):
+    """Return the registered handlers that may find something to convert in the
+    Glyphs object, in registration order: the handlers reading one of its
+    custom parameters or properties, and the handlers reading anything else.
+    """
+    global _handler_index
+    handlers = KNOWN_PARAM_HANDLERS
+    if (
+        _handler_index is None
+        or _handler_index[0] is not handlers
+        or _handler_index[1] != len(handlers)
+    ):
+        always = []
+        by_key = defaultdict(list)
+        for index, handler in enumerate(handlers):
+            keys = handler.glyphs_keys()
+            if keys is None:
+                always.append(index)
+            else:
+                for key in keys:
+                    by_key[key].append(index)
+        _handler_index = (handlers, len(handlers), always, dict(by_key))
+    _, _, always, by_key = _handler_index
+
+    indices = set(always)
+    for key in glyphs_proxy.present_keys():
+        indices.update(by_key.get(key, ()))
+    return [handlers[index] for index in sorted(indices)]
+
+
 GLYPHS_UFO_CUSTOM_PARAMS = (
     # These are be stored in the official descriptor attributes.
     # "familyName",
@@ -767,6 +827,9 @@ register(
 class MiscParamHandler(ParamHandler):
     """Copy GSFont attributes to ufo lib"""
 
+    def glyphs_keys(self):
+        return None
+
     def _read_from_glyphs(self, glyphs):
         return glyphs.get_attribute_value(self.glyphs_name)
 
@@ -980,7 +1043,10 @@ class ReplacePrefixParamHandler(AbstractParamHandler):
         glyph_names = set(ufo._owner.keys())
 
         ufo._owner.features.text = replace_prefixes(
-            repl_map, features_text, glyph_names=glyph_names
+            repl_map,
+            features_text,
+            glyph_names=glyph_names,
+            fea_documents=ufo.fea_documents,
         )
 
     def to_glyphs(self, glyphs, ufo):
@@ -1089,7 +1155,9 @@ class RenameGlyphsParamHandler(AbstractParamHandler):
 register(RenameGlyphsParamHandler())
 
 
-def to_ufo_custom_params(self, ufo, glyphs_object, set_default_params=True):
+def to_ufo_custom_params(
+    self, ufo, glyphs_object, set_default_params=True, fea_documents=None
+):
     # glyphs_module=None because we shouldn't instanciate any Glyphs classes.
 
     # In 'minimal' mode (enabled e.g. by fontmake when converting .glyphs => .ufo
@@ -1109,11 +1177,13 @@ def to_ufo_custom_params(self, ufo, glyphs_object, set_default_params=True):
     glyphs_proxy = GlyphsObjectProxy(
         glyphs_object, glyphs_module=None, ignore_disabled=ignore_disabled
     )
-    ufo_proxy = UFOProxy(ufo)
+    if fea_documents is None and self is not None:
+        fea_documents = self._fea_documents
+    ufo_proxy = UFOProxy(ufo, fea_documents)
 
     glyphs_proxy.mark_handled(UFO_FILENAME_CUSTOM_PARAM)
 
-    for handler in KNOWN_PARAM_HANDLERS:
+    for handler in _handlers_to_ufo(glyphs_proxy):
         handler.to_ufo(self, glyphs_proxy, ufo_proxy)
 
     for param in glyphs_proxy.unhandled_custom_parameters():
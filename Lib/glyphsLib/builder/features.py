@@ -21,6 +21,8 @@ from io import StringIO
 from typing import TYPE_CHECKING
 
 from fontTools.feaLib import ast, parser
+from fontTools.feaLib.error import FeatureLibError, IncludedFeaNotFound
+from fontTools.feaLib.lexer import Lexer
 
 from glyphsLib.util import PeekableIterator
 from .constants import (
@@ -40,6 +42,7 @@ if TYPE_CHECKING:
     from ufoLib2 import Font
 
     from ..classes import GSFont, GSFontMaster
+    from .axes import AxisLocationCache
     from . import UFOBuilder
 
 
@@ -60,6 +63,7 @@ def to_ufo_master_features(self, ufo, master):
             master=master,
             expand_includes=self.expand_includes,
             minimal=self.minimal,
+            axis_locations=self.axis_locations,
         )
 
 
@@ -87,10 +91,13 @@ def _to_ufo_features(  # noqa: C901
     master: GSFontMaster | None = None,
     expand_includes: bool = False,
     minimal: bool = False,
+    axis_locations: AxisLocationCache | None = None,
 ) -> str:
     """Convert GSFont features, including prefixes and classes, to UFO.
 
     Optionally, build a GDEF table definiton, excluding 'skip_export_glyphs'.
+    The axis_locations of the builder, if given, are reused to convert the
+    variable feature code of the master.
     """
     if not master:
         expander = PassThruExpander()
@@ -196,7 +203,7 @@ def _to_ufo_features(  # noqa: C901
 
     # Convert Glyphs conditional features and variable GPOS to feaLib syntax.
     if master is not None:
-        full_text = VariableFeatureConverter(font).convert(full_text)
+        full_text = VariableFeatureConverter(font, axis_locations).convert(full_text)
 
     if not full_text or not expand_includes:
         return full_text
@@ -317,7 +324,7 @@ def replace_table(tag, repl, features):
     return _replace_block("table", tag, repl, features)
 
 
-def replace_prefixes(repl_map, features_text, glyph_names=None):
+def replace_prefixes(repl_map, features_text, glyph_names=None, fea_documents=None):
     """Replace all '# Prefix: NAME' sections in features.
 
     Args:
@@ -327,6 +334,10 @@ def replace_prefixes(repl_map, features_text, glyph_names=None):
         glyph_names: Optional[Sequence[str]]: list of valid glyph names, used
             by feaLib Parser to distinguish glyph name tokens containing '-' from
             glyph ranges such as 'a-z'.
+        fea_documents: Optional[dict]: a cache of the parsed features, by
+            features text and glyph names, shared by the calls for the masters
+            or instances of a build, which usually have the same features. The
+            FeaDocuments are not modified.
 
     Returns:
         str: new feature text with replaced prefix paragraphs.
@@ -334,7 +345,14 @@ def replace_prefixes(repl_map, features_text, glyph_names=None):
     from glyphsLib.classes import GSFont
 
     temp_font = GSFont()
-    _to_glyphs_features(temp_font, features_text, glyph_names=glyph_names)
+    if fea_documents is None:
+        document = FeaDocument(features_text, glyph_names)
+    else:
+        key = (features_text, frozenset(glyph_names or ()))
+        document = fea_documents.get(key)
+        if document is None:
+            document = fea_documents[key] = FeaDocument(features_text, glyph_names)
+    FeatureFileProcessor(document).to_glyphs(temp_font)
 
     for prefix in temp_font.featurePrefixes:
         if prefix.name in repl_map:
@@ -461,19 +479,17 @@ class FeaDocument:
     """Parse the string of a fea code into statements."""
 
     def __init__(self, text, glyph_set=None, include_dir=None, expand_includes=False):
-        feature_file = StringIO(text)
+        if expand_includes:
+            # Inline the included files before parsing, so that the locations
+            # of all the statements are in the text
+            text = _expand_include_statements(text, include_dir)
         glyph_names = glyph_set if glyph_set is not None else ()
         parser_ = parser.Parser(
-            feature_file,
+            StringIO(text),
             glyphNames=glyph_names,
             includeDir=include_dir,
-            followIncludes=expand_includes,
+            followIncludes=False,
         )
-        if expand_includes:
-            # if we expand includes, we need to reparse the whole file with the
-            # new content to get the updated locations
-            text = parser_.parse().asFea()
-            parser_ = parser.Parser(StringIO(text), glyphNames=glyph_names)
         self._doc = parser_.parse()
         self.statements = self._doc.statements
         self._lines = text.splitlines(True)  # keepends=True
@@ -566,6 +582,52 @@ class FeaDocument:
         return None, line, char
 
 
+_SEMICOLON_RE = re.compile(r"\s*;")
+
+
+def _expand_include_statements(text, include_dir=None, depth=1):
+    """Replace the include statements of the fea code with the code of the
+    included files, found as feaLib's IncludingLexer does."""
+    lexer = Lexer(text, None)
+    pieces = []
+    end = 0
+    for token_type, token, _ in lexer:
+        if token_type is not Lexer.NAME or token != "include":
+            continue
+        start = lexer.pos_ - len(token)
+        fname_type, fname, fname_location = next(lexer)
+        if fname_type is not Lexer.FILENAME:
+            raise FeatureLibError("Expected file name", fname_location)
+        if depth >= 5:
+            raise FeatureLibError("Too many recursive includes", fname_location)
+        if os.path.isabs(fname):
+            path = fname
+        else:
+            path = os.path.join(
+                include_dir if include_dir is not None else os.getcwd(), fname
+            )
+        try:
+            with open(path, encoding="utf-8-sig") as fp:
+                included = fp.read()
+        except FileNotFoundError as err:
+            raise IncludedFeaNotFound(fname, fname_location) from err
+        included = _expand_include_statements(included, include_dir, depth + 1)
+        if not included.endswith("\n"):
+            # Don't let a final comment swallow the rest of the line
+            included += "\n"
+        pieces.append(text[end:start])
+        pieces.append(included)
+        # The semicolon after the include statement is optional
+        end = lexer.pos_
+        match = _SEMICOLON_RE.match(text, end)
+        if match:
+            end = match.end()
+    if not pieces:
+        return text
+    pieces.append(text[end:])
+    return "".join(pieces)
+
+
 class FeatureFileProcessor:
     """Put fea statements into the correct fields of a GSFont."""
 
@@ -325,7 +325,8 @@ def to_ufo_glyph_color(self, ufo_glyph, layer, glyph, do_color_layers=True):
         color_layers = [
             l
             for l in glyph.layers
-            if l.attributes.get("color")
+            if l._has_attribute("color")
+            and l.attributes["color"]
             and l.associatedMasterId == layer.associatedMasterId
         ]
         if color_layers:
@@ -348,7 +349,7 @@ def to_ufo_glyph_color(self, ufo_glyph, layer, glyph, do_color_layers=True):
                     for k, g in itertools.groupby(
                         color_layer.components,
                         key=lambda c: any(
-                            l.attributes.get("color")
+                            l._has_attribute("color") and l.attributes["color"]
                             for l in c.component.layers
                             if l.associatedMasterId == layer.associatedMasterId
                         ),
@@ -18,7 +18,7 @@ import logging
 
 from fontTools.varLib.models import piecewiseLinearMap
 
-from glyphsLib.util import build_ufo_path
+from glyphsLib.util import ProcessPool, build_ufo_path, worker_state
 from glyphsLib.classes import (
     CustomParametersProxy,
     GSCustomParameter,
@@ -132,10 +132,12 @@ def _to_designspace_instance(self, instance, ignore_disabled_cp=False):
 
     designspace_axis_tags = {a.tag for a in self.designspace.axes}
     location = {}
-    for axis_def in get_axis_definitions(self.font):
+    instance_locations = self.axis_locations.instance_locations()
+    row = instance_locations.row(instance)
+    for axis_def in self.axis_locations.axis_definitions():
         # Only write locations along defined axes
         if axis_def.tag in designspace_axis_tags:
-            location[axis_def.name] = axis_def.get_design_loc(instance)
+            location[axis_def.name] = instance_locations.design_column(axis_def)[row]
     ufo_instance.location = location
 
     # FIXME: (jany) should be the responsibility of ufo2ft?
@@ -238,6 +240,7 @@ def to_glyphs_instances(self):  # noqa: C901
     if self.designspace is None:
         return
 
+    axis_defs = get_axis_definitions(self.font)
     for ufo_instance in self.designspace.instances:
         instance = self.glyphs_module.GSInstance()
 
@@ -249,7 +252,7 @@ def to_glyphs_instances(self):  # noqa: C901
 
         instance.name = ufo_instance.styleName
 
-        for axis_def in get_axis_definitions(self.font):
+        for axis_def in axis_defs:
             design_loc = None
             try:
                 design_loc = ufo_instance.location[axis_def.name]
@@ -406,7 +409,7 @@ def set_width_class(ufo, designspace, instance):
     _set_class_from_instance(ufo, designspace, instance, "wdth")
 
 
-def apply_instance_data(designspace, include_filenames=None, Font=None):
+def apply_instance_data(designspace, include_filenames=None, Font=None, workers=1):
     """Open UFO instances referenced by designspace, apply Glyphs instance
     data if present, re-save UFOs and return updated UFO Font objects.
 
@@ -418,8 +421,12 @@ def apply_instance_data(designspace, include_filenames=None, Font=None):
             processed.
         Font: a callable(path: str) -> Font, used to load a UFO, such as
             defcon.Font class (default: ufoLib2.Font.open).
+        workers: number of processes used to update and save the instance
+            UFOs concurrently (default: 1, i.e. serially in this process; None
+            uses the number of CPUs). Font must be picklable when using more
+            than one worker.
     Returns:
-        List of opened and updated instance UFOs.
+        List of opened and updated instance UFOs, in designspace order.
     """
     from fontTools.designspaceLib import DesignSpaceDocument
     from os.path import normcase, normpath
@@ -435,11 +442,12 @@ def apply_instance_data(designspace, include_filenames=None, Font=None):
         designspace = DesignSpaceDocument.fromfile(designspace)
 
     basedir = os.path.dirname(designspace.path)
-    instance_ufos = []
     if include_filenames is not None:
         include_filenames = {normcase(normpath(p)) for p in include_filenames}
 
-    for designspace_instance in designspace.instances:
+    # (index in designspace.instances, UFO path) of the instances to update
+    jobs = []
+    for index, designspace_instance in enumerate(designspace.instances):
         fname = designspace_instance.filename
         assert fname is not None, "instance %r missing required filename" % getattr(
             designspace_instance, "name", designspace_instance
@@ -449,26 +457,70 @@ def apply_instance_data(designspace, include_filenames=None, Font=None):
             if fname not in include_filenames:
                 continue
 
-        logger.debug("Applying instance data to %s", fname)
         # fontmake <= 1.4.0 compares the ufo paths returned from this function
         # to the keys of a dict of designspace locations that have been passed
         # through normpath (but not normcase). We do the same.
-        ufo = Font(normpath(os.path.join(basedir, fname)))
+        jobs.append((index, normpath(os.path.join(basedir, fname))))
+
+    if workers == 1 or len(jobs) < 2:
+        instance_ufos = []
+        # The instances usually share their features, only parse them once for
+        # the "Replace Prefix" custom parameters
+        fea_documents = {}
+        for index, path in jobs:
+            logger.debug("Applying instance data to %s", path)
+            ufo = Font(path)
+            apply_instance_data_to_ufo(
+                ufo, designspace.instances[index], designspace, fea_documents
+            )
+            ufo.save()
+            instance_ufos.append(ufo)
+        return instance_ufos
+
+    # Each worker process parses the designspace once, then only receives the
+    # index of the instance to update; the UFOs are saved by the workers and
+    # reopened here, which is cheap as UFO glyphs are loaded lazily.
+    with ProcessPool(
+        workers,
+        initializer=_init_instance_data_worker,
+        initargs=(designspace.tostring(), designspace.path, Font),
+    ) as pool:
+        paths = pool.map(_apply_instance_data_in_worker, jobs)
+    return [Font(path) for path in paths]
+
+
+def _init_instance_data_worker(designspace_data, designspace_path, Font):
+    """Return the designspace, Font callable and parsed features cache of an
+    apply_instance_data worker process."""
+    from fontTools.designspaceLib import DesignSpaceDocument
+
+    designspace = DesignSpaceDocument.fromstring(designspace_data)
+    designspace.path = designspace_path
+    return designspace, Font, {}
 
-        apply_instance_data_to_ufo(ufo, designspace_instance, designspace)
 
-        ufo.save()
-        instance_ufos.append(ufo)
-    return instance_ufos
+def _apply_instance_data_in_worker(job):
+    index, path = job
+    designspace, Font, fea_documents = worker_state()
+    logger.debug("Applying instance data to %s", path)
+    ufo = Font(path)
+    apply_instance_data_to_ufo(
+        ufo, designspace.instances[index], designspace, fea_documents
+    )
+    ufo.save()
+    return path
 
 
-def apply_instance_data_to_ufo(ufo, instance, designspace):
+def apply_instance_data_to_ufo(ufo, instance, designspace, fea_documents=None):
     """Apply Glyphs instance data to UFO object.
 
     Args:
         ufo: a defcon-like font object.
         instance: a fontTools.designspaceLib.InstanceDescriptor.
         designspace: a fontTools.designspaceLib.DesignSpaceDocument.
+        fea_documents: optional dict, shared by the calls for the instances of
+            a designspace, where the features parsed for "Replace Prefix"
+            custom parameters are cached (see replace_prefixes).
     Returns:
         None.
     """
@@ -478,7 +530,7 @@ def apply_instance_data_to_ufo(ufo, instance, designspace):
         set_width_class(ufo, designspace, instance)
 
     glyphs_instance = InstanceDescriptorAsGSInstance(instance)
-    to_ufo_custom_params(None, ufo, glyphs_instance)
+    to_ufo_custom_params(None, ufo, glyphs_instance, fea_documents=fea_documents)
 
     # The name properties that have no custom parameter handler are only read
     # by fill_ufo_metadata, which builds masters. Apply them here so instances
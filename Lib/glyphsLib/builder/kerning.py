@@ -15,7 +15,9 @@
 
 import re
 from collections import OrderedDict
+from collections.abc import Mapping
 from copy import deepcopy
+from typing import Dict, NamedTuple
 
 from .constants import BRACKET_GLYPH_RE, UFO_KERN_GROUP_PATTERN
 
@@ -28,68 +30,232 @@ def flip_class_side(s):
     return s
 
 
-def to_ufo_kerning(self):
-    for master in self.font.masters:
+class KerningSparsity(NamedTuple):
+    """How much of the kerning is shared between the masters of a font."""
+
+    masters: int
+    """Number of masters with kerning."""
+    pairs: int
+    """Number of distinct pairs across all masters."""
+    shared_pairs: int
+    """Number of pairs present with the same value in every master."""
+    master_pairs: Dict[str, int]
+    """Number of pairs of each master, by master ID."""
+
+    @property
+    def total_pairs(self):
+        """Number of pairs stored when each master holds a full table."""
+        return sum(self.master_pairs.values())
+
+    @property
+    def shared_ratio(self):
+        """Fraction of the stored pairs that are identical in all masters."""
+        if not self.total_pairs:
+            return 0.0
+        return self.shared_pairs * self.masters / self.total_pairs
+
+
+def master_kerning(font):
+    """Return the kerning of each master of a GSFont, by master ID, with RTL
+    kerning flipped and merged into the LTR kerning the way it is written to
+    the UFOs. Masters using the same kerning (through a linked metrics source)
+    share the same dictionary; masters without kerning are omitted.
+    """
+    result = OrderedDict()
+    kerning_by_source = {}
+    for master in font.masters:
         kerning_source = master.metricsSource  # Maybe be a linked master
         if kerning_source is None:
             kerning_source = master
-        both_directions = (
-            kerning_source.id in self.font.kerningLTR
-            and kerning_source.id in self.font.kerningRTL
+        if kerning_source.id not in kerning_by_source:
+            kerning_by_source[kerning_source.id] = _combined_kerning(
+                font, kerning_source.id
+            )
+        if kerning_by_source[kerning_source.id]:
+            result[master.id] = kerning_by_source[kerning_source.id]
+    return result
+
+
+def _combined_kerning(font, kerning_id):
+    both_directions = kerning_id in font.kerningLTR and kerning_id in font.kerningRTL
+    combined_kerning = OrderedDict()
+    if kerning_id in font.kerningLTR:
+        kerning = font.kerningLTR[kerning_id]
+        combined_kerning = deepcopy(kerning) if both_directions else kerning
+    if kerning_id in font.kerningRTL:
+        for kern1, subtable in font.kerningRTL[kerning_id].items():
+            # flip RTL sides and combine with existing LTR dicts, but take care
+            # not to overwrite whole kern2 subtable when the flipped kern1
+            # coincides with an existing LTR kern1
+            # https://github.com/googlefonts/glyphsLib/issues/1039
+            kern1_key = flip_class_side(kern1)
+            existing_kern2 = combined_kerning.setdefault(kern1_key, {})
+            new_kern2 = {flip_class_side(kern2): v for kern2, v in subtable.items()}
+            # TODO: use 3.9+ dict.update() or | operator after we drop python3.8
+            combined_kerning[kern1_key] = {**existing_kern2, **new_kern2}
+    return combined_kerning
+
+
+def kerning_sparsity(font_or_kerning):
+    """Count the kerning pairs shared by all masters.
+
+    Takes a GSFont, or a mapping of master IDs to kerning tables as returned by
+    `master_kerning`, and returns a `KerningSparsity`.
+    """
+    if isinstance(font_or_kerning, Mapping):
+        kerning = font_or_kerning
+    else:
+        kerning = master_kerning(font_or_kerning)
+    tables = list(kerning.values())
+    master_pairs = {
+        master_id: sum(len(pairs) for pairs in table.values())
+        for master_id, table in kerning.items()
+    }
+    if not tables:
+        return KerningSparsity(0, 0, 0, master_pairs)
+
+    first, others = tables[0], tables[1:]
+    distinct = {
+        (left, right)
+        for table in tables
+        for left, pairs in table.items()
+        for right in pairs
+    }
+    shared_pairs = 0
+    for left, pairs in first.items():
+        other_pairs = [table.get(left) for table in others]
+        if any(p is None for p in other_pairs):
+            continue
+        for right, value in pairs.items():
+            if all(p.get(right, _MISSING) == value for p in other_pairs):
+                shared_pairs += 1
+    return KerningSparsity(len(tables), len(distinct), shared_pairs, master_pairs)
+
+
+_MISSING = object()
+
+
+def to_ufo_kerning(self):
+    kerning = master_kerning(self.font)
+    if not kerning:
+        return
+
+    # In compact mode, the UFO kerning key tuples, names and values are shared
+    # between all masters, so a pair that is identical in every master is only
+    # stored once, referenced from each master's kerning.
+    shared_keys = None
+    if self.compact_kerning:
+        shared_keys = {}
+        self.kerning_sparsity = kerning_sparsity(kerning)
+        self.logger.info(
+            "Kerning: %d distinct pairs in %d masters, %d (%.0f%%) of the stored "
+            "pairs are identical in all masters",
+            self.kerning_sparsity.pairs,
+            self.kerning_sparsity.masters,
+            self.kerning_sparsity.shared_pairs,
+            100 * self.kerning_sparsity.shared_ratio,
         )
-        combined_kerning = OrderedDict()
-        if kerning_source.id in self.font.kerningLTR:
-            kerning = self.font.kerningLTR[kerning_source.id]
-            combined_kerning = deepcopy(kerning) if both_directions else kerning
-        if kerning_source.id in self.font.kerningRTL:
-            for kern1, subtable in self.font.kerningRTL[kerning_source.id].items():
-                # flip RTL sides and combine with existing LTR dicts, but take care
-                # not to overwrite whole kern2 subtable when the flipped kern1
-                # coincides with an existing LTR kern1
-                # https://github.com/googlefonts/glyphsLib/issues/1039
-                kern1_key = flip_class_side(kern1)
-                existing_kern2 = combined_kerning.setdefault(kern1_key, {})
-                new_kern2 = {flip_class_side(kern2): v for kern2, v in subtable.items()}
-                # TODO: use 3.9+ dict.update() or | operator after we drop python3.8
-                combined_kerning[kern1_key] = {**existing_kern2, **new_kern2}
-        if combined_kerning:
-            _to_ufo_kerning(self, self._sources[master.id].font, combined_kerning)
-
-
-def _to_ufo_kerning(self, ufo, kerning_data):
+
+    for master_id, kerning_data in kerning.items():
+        _to_ufo_kerning(self, self._sources[master_id].font, kerning_data, shared_keys)
+
+
+def _to_ufo_kerning(self, ufo, kerning_data, shared_keys=None):
     """Add .glyphs kerning to an UFO."""
 
     warning_msg = "Non-existent glyph class %s found in kerning rules."
 
+    # Glyphs kerning key -> UFO kerning key, translated once per name
+    left_names = {}
+    right_names = {}
+
+    def ufo_name(name, names, pattern, prefix):
+        try:
+            return names[name]
+        except KeyError:
+            pass
+        ufo_name = name
+        match = pattern.match(name)
+        if match:
+            ufo_name = prefix + match.group(1)
+            if ufo_name not in ufo.groups:
+                self.logger.warning(warning_msg % ufo_name)
+        if shared_keys is not None:
+            ufo_name = shared_keys.setdefault(ufo_name, ufo_name)
+        names[name] = ufo_name
+        return ufo_name
+
+    ufo_kerning = {}
     for left, pairs in kerning_data.items():
-        match = re.match(r"@MMK_L_(.+)", left)
-        left_is_class = bool(match)
-        if left_is_class:
-            left = "public.kern1.%s" % match.group(1)
-            if left not in ufo.groups:
-                self.logger.warning(warning_msg % left)
+        left = ufo_name(left, left_names, _GLYPHS_KERN1_RE, "public.kern1.")
         for right, kerning_val in pairs.items():
-            match = re.match(r"@MMK_R_(.+)", right)
-            right_is_class = bool(match)
-            if right_is_class:
-                right = "public.kern2.%s" % match.group(1)
-                if right not in ufo.groups:
-                    self.logger.warning(warning_msg % right)
-            ufo.kerning[left, right] = kerning_val
+            right = ufo_name(right, right_names, _GLYPHS_KERN2_RE, "public.kern2.")
+            key = (left, right)
+            if shared_keys is not None:
+                key = shared_keys.setdefault(key, key)
+                kerning_val = shared_keys.setdefault(
+                    (type(kerning_val), kerning_val), kerning_val
+                )
+            ufo_kerning[key] = kerning_val
+    ufo.kerning.update(ufo_kerning)
+
+
+_GLYPHS_KERN1_RE = re.compile(r"@MMK_L_(.+)")
+_GLYPHS_KERN2_RE = re.compile(r"@MMK_R_(.+)")
 
 
 def to_glyphs_kerning(self):
     """Add UFO kerning to GSFont."""
+    # UFO names are translated once per distinct name and side, then each
+    # master's kerning is assigned to the GSFont as a whole table rather than
+    # pair by pair, which matters for fonts with hundreds of thousands of pairs.
+    left_keys = {}
+    right_keys = {}
     for master_id, source in self._sources.items():
+        kerning = {}
         for (left, right), value in source.font.kerning.items():
-            if BRACKET_GLYPH_RE.match(left) or BRACKET_GLYPH_RE.match(right):
+            try:
+                left_key = left_keys[left]
+            except KeyError:
+                left_key = left_keys[left] = _to_glyphs_kerning_key(left, "@MMK_L_")
+            try:
+                right_key = right_keys[right]
+            except KeyError:
+                right_key = right_keys[right] = _to_glyphs_kerning_key(right, "@MMK_R_")
+            if left_key is None or right_key is None:
                 # Skip all bracket glyph entries, as they are duplicates of their
                 # parents'.
                 continue
-            left_match = UFO_KERN_GROUP_PATTERN.match(left)
-            right_match = UFO_KERN_GROUP_PATTERN.match(right)
-            if left_match:
-                left = "@MMK_L_{}".format(left_match.group(2))
-            if right_match:
-                right = "@MMK_R_{}".format(right_match.group(2))
-            self.font.setKerningForPair(master_id, left, right, value)
+            pairs = kerning.get(left_key)
+            if pairs is None:
+                pairs = kerning[left_key] = {}
+            pairs[right_key] = value
+        if kerning:
+            _set_glyphs_master_kerning(self.font, master_id, kerning)
+
+
+def _to_glyphs_kerning_key(name, class_prefix):
+    """Return the Glyphs kerning key for a UFO kerning name, or None if the
+    name refers to a bracket glyph.
+    """
+    if BRACKET_GLYPH_RE.match(name):
+        return None
+    match = UFO_KERN_GROUP_PATTERN.match(name)
+    if match:
+        return class_prefix + match.group(2)
+    return name
+
+
+def _set_glyphs_master_kerning(font, master_id, kerning):
+    """Store a whole master kerning table in the font's LTR kerning, merging
+    with any pairs already present for that master.
+    """
+    existing = font.kerningLTR.get(master_id)
+    if not existing:
+        font.kerningLTR[master_id] = kerning
+        return
+    for left, pairs in kerning.items():
+        if left in existing:
+            existing[left].update(pairs)
+        else:
+            existing[left] = pairs
@@ -15,7 +15,7 @@
 
 import os
 
-from .axes import font_uses_axis_locations, get_axis_definitions
+from .axes import font_uses_axis_locations
 from .constants import (
     GLYPHS_PREFIX,
     MASTER_ID_LIB_KEY,
@@ -66,9 +66,9 @@ def to_ufo_master_attributes(self, ufo, master):
     if font_uses_axis_locations(self.font):
         # Set the OS/2 weightClass and widthClas according the this master's
         # user location ("Axis Location" parameter)
-        for axis in get_axis_definitions(self.font):
+        for axis in self.axis_locations.axis_definitions():
             if axis.tag in ("wght", "wdth"):
-                user_loc = axis.get_user_loc(master)
+                user_loc = self.axis_locations.user_loc(axis, master)
                 axis.set_ufo_user_loc(ufo, user_loc)
 
     # Set vhea values to glyphsapp defaults if they haven't been declared.
@@ -13,79 +13,130 @@
 # limitations under the License.
 
 
-from glyphsLib import types
-from glyphsLib.pens import _to_glyphs_node_type, _to_ufo_node_type
+from ufoLib2.objects import Contour, Glyph, Point
+
+from .constants import NODE_USER_DATA_KEY
+
+# Node types that map to a UFO segment type; anything else (offcurve) is None.
+_UFO_SEGMENT_TYPES = {"line": "line", "curve": "curve", "qcurve": "qcurve"}
+# UFO segment types that are not Glyphs node types
+_GLYPHS_NODE_TYPES = {None: "offcurve", "move": "line"}
 
 
 def to_ufo_paths(self, ufo_glyph, layer):
     """Draw .glyphs paths onto a pen."""
+    if isinstance(ufo_glyph, Glyph):
+        # ufoLib2 glyphs can take whole contours, skip the point pen.
+        contours = ufo_glyph.contours
+        for path_index, path in enumerate(layer.paths):
+            contours.append(
+                Contour(
+                    points=[
+                        Point(x, y, segment_type, smooth, name, identifier)
+                        for x, y, segment_type, smooth, name, identifier in (
+                            _to_ufo_points(self, ufo_glyph, path, path_index)
+                        )
+                    ]
+                )
+            )
+        return
+
     pen = ufo_glyph.getPointPen()
+    for path_index, path in enumerate(layer.paths):
+        pen.beginPath()
+        for x, y, segment_type, smooth, name, identifier in _to_ufo_points(
+            self, ufo_glyph, path, path_index
+        ):
+            pen.addPoint(
+                (x, y),
+                segmentType=segment_type,
+                smooth=smooth,
+                name=name,
+                identifier=identifier,
+            )
+        pen.endPath()
 
-    for path in layer.paths:
-        # the list is changed below, otherwise you can't draw more than once
-        # per session.
-        nodes = list(path.nodes)
 
-        pen.beginPath()
+def _to_ufo_points(self, ufo_glyph, path, path_index):
+    """Yield (x, y, segmentType, smooth, name, identifier) for each UFO point
+    of a GSPath, and store the user data of its nodes in the UFO glyph lib.
 
-        if not nodes:
-            pen.endPath()
-            continue
+    The nodes are read without going through their properties: user data
+    proxies are only involved for the few nodes that do have user data.
+    """
+    nodes = path._nodes
+    count = len(nodes)
+    if not count:
+        return
 
-        if not path.closed:
-            node = nodes.pop(0)
-            assert node.type == "line", "Open path starts with off-curve points"
-            pen.addPoint(
-                tuple(node.position),
-                segmentType="move",
-                name=node.userData.get("name"),
-                identifier=node.userData.get("UFO.identifier"),
-            )
-        else:
-            # In Glyphs.app, the starting node of a closed contour is always
-            # stored at the end of the nodes list.
-            nodes.insert(0, nodes.pop())
+    if not path.closed:
+        node = nodes[0]
+        assert node.type == "line", "Open path starts with off-curve points"
+        x, y = node._position.value
+        user_data = node._userData or {}
+        name = user_data.get("name")
+        identifier = user_data.get("UFO.identifier")
+        yield x, y, "move", False, name, identifier
+        indices = range(1, count)
+    else:
+        # In Glyphs.app, the starting node of a closed contour is always
+        # stored at the end of the nodes list.
+        indices = (count - 1, *range(count - 1))
 
-        for node in nodes:
-            node_type = _to_ufo_node_type(node.type)
-            pen.addPoint(
-                tuple(node.position),
-                segmentType=node_type,
-                smooth=node.smooth,
-                name=node.userData.get("name"),
-                identifier=node.userData.get("UFO.identifier"),
-            )
-            # NOTE: Can't do path_index, node_index through enumeration here because we
-            # might have changed node order.
-            # A node's name will be stored as a UFO point's name attribute, so filter
-            # it from the Glyph node user data to avoid storing duplicate information.
-            node_user_data = {
-                k: v
-                for k, v in node.userData.items()
-                if k not in ("UFO.identifier", "name")
-            }
-            self.to_ufo_node_user_data(ufo_glyph, node, node_user_data)
-        pen.endPath()
+    segment_types = _UFO_SEGMENT_TYPES
+    for node_index in indices:
+        node = nodes[node_index]
+        x, y = node._position.value
+        user_data = node._userData
+        if not user_data:
+            yield x, y, segment_types.get(node.type), node.smooth, None, None
+            continue
+        name = user_data.get("name")
+        identifier = user_data.get("UFO.identifier")
+        yield x, y, segment_types.get(node.type), node.smooth, name, identifier
+        # A node's name will be stored as a UFO point's name attribute, so filter
+        # it from the Glyph node user data to avoid storing duplicate information.
+        node_user_data = {
+            k: v for k, v in user_data.items() if k not in ("UFO.identifier", "name")
+        }
+        self.to_ufo_node_user_data(
+            ufo_glyph, node, node_user_data, path_index, node_index
+        )
 
 
 def to_glyphs_paths(self, ufo_glyph, layer):
     # Keep track of path and node numbers, otherwise to_glyphs_node_user_data must
     # call _indices on every single GSNode, which is a huge performance drain.
+    has_node_user_data = any(
+        key.startswith(NODE_USER_DATA_KEY) for key in ufo_glyph.lib.keys()
+    )
+    GSNode = self.glyphs_module.GSNode
+    node_types = _GLYPHS_NODE_TYPES
     for contour_index, contour in enumerate(ufo_glyph):
-        path = self.glyphs_module.GSPath()
+        nodes = []
         for point in contour:
-            node = self.glyphs_module.GSNode()
-            node.position = types.Point(point.x, point.y)
-            node.type = _to_glyphs_node_type(point.segmentType)
-            node.smooth = point.smooth
-            node.name = point.name
+            node = GSNode(
+                (point.x, point.y),
+                node_types.get(point.segmentType, point.segmentType),
+                point.smooth,
+            )
+            # Only go through the user data when there is something to store
+            if point.name is not None:
+                node.name = point.name
             if point.identifier is not None:
                 node.userData["UFO.identifier"] = point.identifier
-            path.nodes.append(node)
+            nodes.append(node)
+        path = self.glyphs_module.GSPath()
         path.closed = not contour.open
-        if not contour.open:
-            path.nodes.append(path.nodes.pop(0))
+        if path.closed and nodes:
+            # In Glyphs.app, the starting node of a closed contour is always
+            # stored at the end of the nodes list.
+            nodes = nodes[1:] + nodes[:1]
+        path.nodes = nodes
         layer.paths.append(path)
 
-        for node_index, node in enumerate(path.nodes):
-            self.to_glyphs_node_user_data(ufo_glyph, node, contour_index, node_index)
+        if has_node_user_data:
+            for node_index, node in enumerate(nodes):
+                self.to_glyphs_node_user_data(
+                    ufo_glyph, node, contour_index, node_index
+                )
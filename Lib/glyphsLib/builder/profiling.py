@@ -0,0 +1,140 @@
+# Copyright 2026 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wall time, call and item counts of the stages of a Glyphs <-> UFO conversion.
+
+Pass a `BuildProfile` as the ``profile`` argument of `to_ufos`,
+`to_designspace`, `to_glyphs`, `preflight_glyphs` or `build_masters` (or of the
+builders), then read its `stages` or write it out with `BuildProfile.save`:
+
+    profile = BuildProfile(slowest_glyphs=10)
+    designspace = to_designspace(font, profile=profile)
+    profile.save("profile.json")
+
+Stages are named after the builder methods or preflight transformations they
+time, e.g. "to_ufo_layers" or "preflight.propagate_all_anchors". The hits and
+misses of the caches used by the conversion, e.g. the interpolation models of
+the font (see `glyphsLib.builder.variation_models`), are counted in `caches`.
+"""
+
+import heapq
+import json
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from time import perf_counter
+
+
+@dataclass
+class StageStats:
+    """The accumulated statistics of one stage."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    items: int = 0
+
+
+@dataclass
+class CacheStats:
+    """The accumulated hits and misses of one cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class BuildProfile:
+    """Collect the timings of the stages of a conversion.
+
+    If slowest_glyphs is more than 0, the conversion time of each glyph layer
+    is recorded as well, and the slowest ones are kept.
+    """
+
+    def __init__(self, slowest_glyphs=0):
+        self.stages = {}
+        self.caches = {}
+        self.slowest_glyphs = slowest_glyphs
+        self._glyph_times = []  # min-heap of (seconds, glyph name, layer name)
+
+    def _stats(self, name):
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        return stats
+
+    @contextmanager
+    def stage(self, name, items=0):
+        """Time the code in the context as one call of the named stage."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            stats = self._stats(name)
+            stats.calls += 1
+            stats.seconds += perf_counter() - start
+            stats.items += items
+
+    def add_items(self, name, items):
+        """Count items (glyphs, layers, kerning pairs...) processed by a stage."""
+        self._stats(name).items += items
+
+    def add_cache_stats(self, name, hits, misses):
+        """Count hits and misses of the named cache."""
+        stats = self.caches.get(name)
+        if stats is None:
+            stats = self.caches[name] = CacheStats()
+        stats.hits += hits
+        stats.misses += misses
+
+    def add_glyph_time(self, glyph_name, layer_name, seconds):
+        if len(self._glyph_times) < self.slowest_glyphs:
+            heapq.heappush(self._glyph_times, (seconds, glyph_name, layer_name))
+        elif self._glyph_times:
+            heapq.heappushpop(self._glyph_times, (seconds, glyph_name, layer_name))
+
+    @property
+    def slowest(self):
+        """The slowest glyph layers, as (seconds, glyph name, layer name) tuples
+        in decreasing order of time."""
+        return sorted(self._glyph_times, reverse=True)
+
+    def as_dict(self):
+        return {
+            "stages": {name: asdict(stats) for name, stats in self.stages.items()},
+            "caches": {
+                name: {**asdict(stats), "hitRate": stats.hit_rate}
+                for name, stats in self.caches.items()
+            },
+            "slowestGlyphs": [
+                {"glyph": glyph_name, "layer": layer_name, "seconds": seconds}
+                for seconds, glyph_name, layer_name in self.slowest
+            ],
+        }
+
+    def save(self, path):
+        """Write the profile to a JSON file."""
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump(self.as_dict(), fp, indent=2)
+            fp.write("\n")
+
+
+def stage(profile, name, items=0):
+    """Return a context manager timing a stage in the given profile, or doing
+    nothing if the profile is None."""
+    if profile is None:
+        return nullcontext()
+    return profile.stage(name, items)
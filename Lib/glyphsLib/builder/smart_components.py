@@ -22,11 +22,13 @@ OpenType interpolation model to adjust the node positions.
 
 from enum import IntEnum
 
-from fontTools.varLib.models import VariationModel, normalizeValue, VariationModelError
+from fontTools.varLib.models import VariationModelError
 from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates
 
 from glyphsLib.classes import GSLayer
 
+from .variation_models import interpolation_models
+
 
 # smartComponentPoleMapping returns 1 for bottom of axis and 2 for top.
 class Pole(IntEnum):
@@ -57,11 +59,15 @@ def normalized_location(layer, base_layer):
     return loc
 
 
-def variation_model(glyph, smart_layers, layer):
+def variation_model(glyph, smart_layers, layer, models=None):
+    # The model is shared by all the uses of the component, see
+    # glyphsLib.builder.variation_models
+    if models is None:
+        models = interpolation_models(glyph.parent)
     master_locations = [normalized_location(l, smart_layers[0]) for l in smart_layers]
     axis_order = [ax.name for ax in glyph.smartComponentAxes]
     try:
-        model = VariationModel(master_locations, axisOrder=axis_order, extrapolate=True)
+        model = models.model(master_locations, axis_order=axis_order, extrapolate=True)
     except VariationModelError as e:
         locations = "Locations were:\n"
         for smart_layer, master_location in zip(smart_layers, master_locations):
@@ -151,7 +157,8 @@ def get_smart_component_variation_model(layer, component):
     if len(masters) == 1:
         return None, None, None
 
-    model = variation_model(root, masters, layer)
+    models = interpolation_models(root.parent)
+    model = variation_model(root, masters, layer, models)
 
     # Determine the normalized location of the interpolant within the
     # mini-designspace, remembering that we have to work out where the
@@ -163,10 +170,9 @@ def get_smart_component_variation_model(layer, component):
         else:
             defaultValue = ax.topValue
         axes_tuples[ax.name] = (ax.bottomValue, defaultValue, ax.topValue)
-    normalized_location = {
-        name: normalizeValue(value, axes_tuples[name], extrapolate=True)
-        for name, value in component.smartComponentValues.items()
-    }
+    normalized_location = models.normalize(
+        component.smartComponentValues, axes_tuples, extrapolate=True
+    )
 
     return model, normalized_location, masters
 
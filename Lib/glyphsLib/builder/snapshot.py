@@ -0,0 +1,73 @@
+# Copyright 2026 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cheap copies of a GSFont for conversions that must not modify their input.
+
+The preflight transformations (see `glyphsLib.builder.preflight_glyphs`) only
+modify composite glyphs and glyphs with an "*origin" anchor, and glyph
+subsetting only modifies font-level data. `snapshot_font` therefore deep-copies
+those glyphs and the font-level data, while the other glyphs are shallow-copied
+so that their layers, which hold most of the outline data, are shared with the
+original font.
+"""
+
+import copy
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_font(font):
+    """Return a copy of a GSFont that can go through `preflight_glyphs`,
+    `subset_glyphs` and the UFO conversion without changing the original.
+
+    The layers of the glyphs that are not modified by these steps are shared
+    with the original font, and still have its glyphs as their parent. The
+    per-master kerning dictionaries are shared too, since the conversion only
+    ever replaces them.
+    """
+    memo = {}
+    shared = 0
+    for glyph in font.glyphs:
+        if _may_be_modified(glyph):
+            continue
+        # The glyph object itself is copied, so that the copy can be given
+        # the new font as its parent.
+        memo[id(glyph)] = copy.copy(glyph)
+        shared += 1
+    for kerning in (font._kerningLTR, font._kerningRTL, font._kerningVertical):
+        for master_kerning in kerning.values():
+            memo[id(master_kerning)] = master_kerning
+
+    new_font = copy.deepcopy(font, memo)
+    for glyph in new_font._glyphs:
+        glyph.parent = new_font
+    logger.debug(
+        "Snapshot of %d glyphs, %d sharing their layers with the original",
+        len(new_font._glyphs),
+        shared,
+    )
+    return new_font
+
+
+def _may_be_modified(glyph):
+    # propagate_all_anchors and align_alternate_layers only touch glyphs with
+    # components, apply_origin_anchor only layers with an "*origin" anchor.
+    for layer in glyph.layers:
+        if layer.components:
+            return True
+        for anchor in layer.anchors:
+            if anchor.name == "*origin":
+                return True
+    return False
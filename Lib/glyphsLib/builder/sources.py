@@ -127,10 +127,11 @@ def _to_designspace_source(self, master, is_regular):
 
     designspace_axis_tags = {a.tag for a in self.designspace.axes}
     location = {}
-    for axis_def in get_axis_definitions(self.font):
+    axis_locations = self.axis_locations
+    for axis_def in axis_locations.axis_definitions():
         # Only write locations along defined axes
         if axis_def.tag in designspace_axis_tags:
-            location[axis_def.name] = axis_def.get_design_loc(master)
+            location[axis_def.name] = axis_locations.design_loc(axis_def, master)
     source.location = location
 
 
@@ -209,15 +210,16 @@ def _to_designspace_source_layer(self):
 
 
 def to_glyphs_sources(self):
+    axis_defs = get_axis_definitions(self.font)
     for master in self.font.masters:
-        _to_glyphs_source(self, master)
+        _to_glyphs_source(self, master, axis_defs)
 
 
-def _to_glyphs_source(self, master):
+def _to_glyphs_source(self, master, axis_defs):
     source = self._sources[master.id]
 
     # Retrieve the master locations: weight, width, custom 0 - 1 - 2 - 3
-    for axis_def in get_axis_definitions(self.font):
+    for axis_def in axis_defs:
         try:
             design_location = source.location[axis_def.name]
         except KeyError:
@@ -25,7 +25,6 @@ import re
 from fontTools.designspaceLib import AxisLabelDescriptor, DiscreteAxisDescriptor
 
 from glyphsLib.classes import InstanceType
-from glyphsLib.builder.axes import get_axis_definitions, is_instance_active
 
 
 def _is_italic(instance):
@@ -82,24 +81,20 @@ def to_designspace_stat(self):
     if all(_stat_disabled(instance) for instance in variable):
         return
 
-    axis_defs = {ad.tag: ad for ad in get_axis_definitions(font)}
     axis_tags = {axis.tag for axis in designspace.axes}
     slope_tag = (
         "ital" if "ital" in axis_tags else "slnt" if "slnt" in axis_tags else None
     )
 
-    instances = [
-        instance
-        for instance in font.instances
-        if instance.type != InstanceType.VARIABLE and is_instance_active(instance)
-    ]
-
-    def user_loc(axis, instance):
-        axis_def = axis_defs.get(axis.tag)
-        return axis_def.get_user_loc(instance) if axis_def else None
+    locations = _UserLocations(
+        designspace.axes,
+        self.axis_locations.axis_definitions(),
+        self.axis_locations.instance_locations(),
+    )
+    instances = locations.instances
 
     default_instance = next(
-        (i for i in instances if _at_default(i, designspace.axes, user_loc)), None
+        (i for row, i in enumerate(instances) if locations.at_default(row)), None
     )
 
     italic = default_instance is not None and _is_italic(default_instance)
@@ -109,11 +104,12 @@ def to_designspace_stat(self):
 
     # “Style Name as STAT entry” on any instance switches the whole font to manual
     # mode.
-    if any(_stat_entry_tags(instance) for instance in instances):
-        _manual_labels(designspace, instances, user_loc)
+    entry_tags = [_stat_entry_tags(instance) for instance in instances]
+    if any(entry_tags):
+        _manual_labels(designspace, locations, entry_tags)
     else:
         _automatic_labels(
-            designspace, instances, user_loc, slope_tag, default_instance, plain_italic
+            designspace, locations, slope_tag, default_instance, plain_italic
         )
 
     designspace.elidedFallbackName = "Regular"
@@ -138,32 +134,66 @@ def to_designspace_stat(self):
         )
 
 
-def _manual_labels(designspace, instances, user_loc):
+class _UserLocations:
+    """The user locations of the exported instances on the designspace axes.
+
+    `columns` maps axis names to the locations of the instances, in the order
+    of `instances`; None where the axis is not a Glyphs axis. For each instance,
+    the names of the axes on which it is off the default are collected as well.
+    """
+
+    def __init__(self, axes, axis_defs, instance_locations):
+        axis_defs = {axis_def.tag: axis_def for axis_def in axis_defs}
+        rows = [row for row, active in enumerate(instance_locations.active) if active]
+        self.instances = [instance_locations.instances[row] for row in rows]
+        self.columns = {}
+        self._off_default = [set() for _ in rows]
+        for axis in axes:
+            axis_def = axis_defs.get(axis.tag)
+            if axis_def is None:
+                column = [None] * len(rows)
+            else:
+                user_locs = instance_locations.user_column(axis_def)
+                column = [user_locs[row] for row in rows]
+            self.columns[axis.name] = column
+            for off_default, loc in zip(self._off_default, column):
+                if loc is not None and loc != axis.default:
+                    off_default.add(axis.name)
+
+    def at_default(self, row, skip=None):
+        """Return whether the instance at row is at the default location on every
+        axis, except skip."""
+        off_default = self._off_default[row]
+        return not off_default or (skip is not None and off_default == {skip.name})
+
+    def by_value(self, axis):
+        """Return the rows of the instances by user location along an axis, in
+        order of appearance."""
+        rows = {}
+        for row, loc in enumerate(self.columns[axis.name]):
+            if loc is not None:
+                rows.setdefault(loc, []).append(row)
+        return rows
+
+
+def _manual_labels(designspace, locations, entry_tags):
     for axis in designspace.axes:
         labels = {}
-        for instance in instances:
-            if axis.tag in _stat_entry_tags(instance):
-                loc = user_loc(axis, instance)
-                if loc is not None and loc not in labels:
-                    labels[loc] = (instance.name, _is_elidable(instance, axis))
+        for instance, tags, loc in zip(
+            locations.instances, entry_tags, locations.columns[axis.name]
+        ):
+            if axis.tag in tags and loc is not None and loc not in labels:
+                labels[loc] = (instance.name, _is_elidable(instance, axis))
         _set_axisLabels(axis, labels)
 
 
-def _at_default(instance, axes, user_loc, skip=None):
-    return all(
-        user_loc(axis, instance) in (None, axis.default)
-        for axis in axes
-        if axis is not skip
-    )
-
-
-def _representative_instance(instances, axis, designspace, user_loc):
+def _representative_instance(rows, axis, locations):
     # The instance at this value that is at the default on every other axis.
     # Fall back to the first instance when none qualifies.
-    for instance in instances:
-        if _at_default(instance, designspace.axes, user_loc, skip=axis):
-            return instance
-    return instances[0]
+    for row in rows:
+        if locations.at_default(row, skip=axis):
+            return locations.instances[row]
+    return locations.instances[rows[0]]
 
 
 def _label_name(instance, default, plain_italic):
@@ -174,7 +204,7 @@ def _label_name(instance, default, plain_italic):
 
 
 def _automatic_labels(
-    designspace, instances, user_loc, slope_tag, default_instance, plain_italic=False
+    designspace, locations, slope_tag, default_instance, plain_italic=False
 ):
     # The default value of the first axis the instances vary on takes the
     # default instance’s name, every other default value elides to the
@@ -183,25 +213,17 @@ def _automatic_labels(
         (
             axis
             for axis in designspace.axes
-            if len({user_loc(axis, i) for i in instances} - {None}) > 1
+            if len(set(locations.columns[axis.name]) - {None}) > 1
         ),
         None,
     )
 
     for axis in designspace.axes:
         default = _default_name(axis.tag)
-        by_value = {}  # user value -> instances sitting there
-        for instance in instances:
-            loc = user_loc(axis, instance)
-            if loc is not None:
-                by_value.setdefault(loc, []).append(instance)
-
         labels = {}
-        for loc, instances_at_loc in by_value.items():
+        for loc, rows in locations.by_value(axis).items():
             if loc != axis.default:
-                instance = _representative_instance(
-                    instances_at_loc, axis, designspace, user_loc
-                )
+                instance = _representative_instance(rows, axis, locations)
             elif axis is first and default_instance is not None:
                 instance = default_instance
             else:
@@ -215,8 +237,12 @@ def _automatic_labels(
     # other axes.
     wght = next((a for a in designspace.axes if a.tag == "wght"), None)
     if wght is not None and _default_value_elides(wght):
-        bold = next((i for i in instances if i.isBold), None)
-        _set_linked_value(wght, user_loc(wght, bold) if bold else None)
+        bold = next(
+            (row for row, i in enumerate(locations.instances) if i.isBold), None
+        )
+        _set_linked_value(
+            wght, locations.columns[wght.name][bold] if bold is not None else None
+        )
 
     # On a real “ital” axis the upright value links to the italic value.
     if slope_tag == "ital":
@@ -0,0 +1,332 @@
+# Copyright 2026 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Restrict a GSFont to a selection of glyphs before converting it to UFOs.
+
+This is meant for debugging and preview builds, where converting the whole
+font is not needed: the selected glyphs are kept along with all the glyphs
+they reference as components (or corner, cap and segment components),
+transitively, and the kerning and kerning groups are pruned accordingly.
+Once the UFOs are built, `subset_features` removes the other glyphs from their
+feature code, and drops the rules that are left without glyphs to apply to, so
+that the UFOs can still be compiled.
+"""
+
+import io
+import logging
+
+from fontTools.feaLib import ast
+from fontTools.feaLib.error import FeatureLibError
+from fontTools.feaLib.parser import Parser
+
+from .constants import UFO_GROUPS_NOT_IN_FEATURE_KEY, UFO_ORIGINAL_KERNING_GROUPS_KEY
+
+logger = logging.getLogger(__name__)
+
+
+def subset_glyphs(font, glyph_filter):
+    """Remove from a GSFont all glyphs but the selected ones and their
+    component closure. Modifies the font in-place.
+
+    Args:
+        font: a GSFont object.
+        glyph_filter: a collection of glyph names, or a callable taking a glyph
+            name and returning True for the glyphs to keep.
+
+    Returns:
+        The set of the names of the glyphs left in the font.
+    """
+    if isinstance(glyph_filter, str):
+        raise TypeError(
+            "glyph_filter must be a collection of glyph names or a callable, "
+            f"not a string: {glyph_filter!r}"
+        )
+    if callable(glyph_filter):
+        selected = {glyph.name for glyph in font.glyphs if glyph_filter(glyph.name)}
+    else:
+        selected = set(glyph_filter)
+        missing = selected.difference(glyph.name for glyph in font.glyphs)
+        if missing:
+            logger.warning(
+                "Glyphs selected for conversion are not in the font: %s",
+                ", ".join(sorted(missing)),
+            )
+            selected -= missing
+
+    keep = component_closure(font, selected)
+    if len(keep) == len(font.glyphs):
+        return keep
+
+    font.glyphs = [glyph for glyph in font.glyphs if glyph.name in keep]
+    _subset_kerning(font, keep)
+    _subset_groups(font, keep)
+    return keep
+
+
+def component_closure(font, glyph_names):
+    """Return the given glyph names plus the names of all the glyphs they use,
+    directly or indirectly, as components in any of their layers.
+    """
+    glyphs = {glyph.name: glyph for glyph in font.glyphs}
+    closure = set()
+    stack = list(glyph_names)
+    while stack:
+        glyph_name = stack.pop()
+        if glyph_name in closure:
+            continue
+        closure.add(glyph_name)
+        glyph = glyphs.get(glyph_name)
+        if glyph is None:
+            continue
+        for layer in glyph.layers:
+            for used in _used_glyph_names(layer):
+                if used not in closure:
+                    stack.append(used)
+            if layer.hasBackground:
+                for used in _used_glyph_names(layer.background):
+                    if used not in closure:
+                        stack.append(used)
+    return closure.intersection(glyphs)
+
+
+def _used_glyph_names(layer):
+    for component in layer.components:
+        yield component.name
+    # Corner, cap and segment components are referenced by their hint's name
+    for hint in layer.hints:
+        if hint.name:
+            yield hint.name
+
+
+def _subset_kerning(font, keep):
+    # Kerning classes are referenced by the kerning groups of the glyphs, on
+    # the right side of the glyph for the first member of a pair ("L") and on
+    # the left side for the second ("R"), in both LTR and RTL kerning.
+    classes = {
+        "@MMK_L_": {g.rightKerningGroup for g in font.glyphs if g.rightKerningGroup},
+        "@MMK_R_": {g.leftKerningGroup for g in font.glyphs if g.leftKerningGroup},
+    }
+
+    def is_kept(key):
+        if key.startswith("@"):
+            names = classes.get(key[:7])
+            return names is None or key[7:] in names
+        return key in keep
+
+    for kerning in (font.kerningLTR, font.kerningRTL, font.kerningVertical):
+        if not kerning:
+            continue
+        for master_id in list(kerning):
+            master_kerning = {}
+            for left, pairs in kerning[master_id].items():
+                if not is_kept(left):
+                    continue
+                pairs = {right: v for right, v in pairs.items() if is_kept(right)}
+                if pairs:
+                    master_kerning[left] = pairs
+            kerning[master_id] = master_kerning
+
+
+def _subset_groups(font, keep):
+    orig_groups = font.userData.get(UFO_ORIGINAL_KERNING_GROUPS_KEY)
+    if orig_groups:
+        subset_groups = {}
+        for group, glyphs in orig_groups.items():
+            kept_glyphs = [name for name in glyphs if name in keep]
+            # Keep the groups that were empty to begin with
+            if kept_glyphs or not glyphs:
+                subset_groups[group] = kept_glyphs
+        font.userData[UFO_ORIGINAL_KERNING_GROUPS_KEY] = subset_groups
+
+    group_names = font.userData.get(UFO_GROUPS_NOT_IN_FEATURE_KEY)
+    if group_names:
+        group_names = set(group_names)
+        for gsclass in font.classes:
+            if gsclass.name in group_names and gsclass.code:
+                gsclass.code = " ".join(
+                    name for name in gsclass.code.split(" ") if name in keep
+                )
+
+
+def subset_features(ufos, glyph_names):
+    """Remove from the feature code of the UFOs built from a subset GSFont the
+    glyphs that are not in the UFOs. Modifies the UFOs in-place.
+
+    Glyph classes lose the removed glyphs, and the rules that are left with
+    nothing to apply to (a removed glyph, or a class with no glyph left) are
+    dropped with a warning. Single substitutions from a class to a class drop
+    the pairs of glyphs where either side was removed.
+
+    Args:
+        ufos: the UFOs built from the subset GSFont.
+        glyph_names: the names of the glyphs in the GSFont before it was
+            subset, to tell glyph names with a hyphen from glyph ranges.
+    """
+    subset_texts = {}
+    for ufo in ufos:
+        text = ufo.features.text
+        if not text:
+            continue
+        keep = frozenset(ufo.keys())
+        key = (text, keep)
+        if key not in subset_texts:
+            subset_texts[key] = _subset_feature_text(text, keep, glyph_names)
+        ufo.features.text = subset_texts[key]
+
+
+def _subset_feature_text(text, keep, glyph_names):
+    parser = Parser(
+        io.StringIO(text), glyphNames=keep.union(glyph_names), followIncludes=False
+    )
+    try:
+        feature_file = parser.parse()
+    except FeatureLibError as e:
+        logger.warning("Feature code could not be subset: %s", e)
+        return text
+
+    pruner = _FeaturePruner(keep)
+    feature_file.statements = pruner.prune_statements(feature_file.statements)
+    if not pruner.changed:
+        return text
+    if pruner.dropped:
+        logger.warning(
+            "Dropped %d feature rules using glyphs outside of the subset",
+            pruner.dropped,
+        )
+    return feature_file.asFea()
+
+
+# Returned by _FeaturePruner.prune_value for the values with no glyph left
+_REMOVED = object()
+
+
+class _FeaturePruner:
+    def __init__(self, keep):
+        self.keep = keep
+        self.changed = False
+        self.dropped = 0
+        # Glyphs of the named classes before they were pruned, in order
+        self.class_glyphs = {}
+        self.emptied_classes = set()
+
+    def prune_statements(self, statements):
+        kept = []
+        for statement in statements:
+            if isinstance(statement, ast.Block):
+                statement.statements = self.prune_statements(statement.statements)
+            elif isinstance(statement, ast.GlyphClassDefinition):
+                self.prune_class_definition(statement)
+            elif not self.prune_statement(statement):
+                self.dropped += 1
+                self.changed = True
+                continue
+            kept.append(statement)
+        return kept
+
+    def prune_class_definition(self, definition):
+        self.class_glyphs[definition.name] = list(definition.glyphSet())
+        glyphs = self.prune_value(definition.glyphs)
+        if glyphs is _REMOVED:
+            # Keep the class defined, it may be used by code left untouched
+            # like the automatic GDEF definition
+            self.emptied_classes.add(definition.name)
+            glyphs = ast.GlyphClass(location=definition.glyphs.location)
+        definition.glyphs = glyphs
+
+    def prune_statement(self, statement):
+        if isinstance(
+            statement, (ast.SingleSubstStatement, ast.ReverseChainSingleSubstStatement)
+        ) and not self.prune_single_subst(statement):
+            return False
+        # The ligature is the only glyph given by name rather than by an
+        # expression
+        if (
+            isinstance(statement, ast.LigatureSubstStatement)
+            and statement.replacement not in self.keep
+        ):
+            return False
+        for attr, value in vars(statement).items():
+            if attr == "location":
+                continue
+            pruned = self.prune_value(value)
+            if pruned is _REMOVED:
+                if not isinstance(statement, ast.GlyphClassDefStatement):
+                    return False
+                # GDEF classes may be left empty, named ones are still defined
+                if not isinstance(value, ast.GlyphClassName):
+                    pruned = ast.GlyphClass(location=statement.location)
+                else:
+                    pruned = value
+            if pruned is not value:
+                setattr(statement, attr, pruned)
+        return True
+
+    def prune_single_subst(self, statement):
+        # Classes are substituted glyph by glyph, so their glyphs are removed
+        # in pairs to keep them aligned.
+        inputs = self.glyph_list(statement.glyphs[0])
+        outputs = self.glyph_list(statement.replacements[0])
+        if inputs is None or outputs is None or len(outputs) != len(inputs):
+            return True
+        pairs = [
+            (a, b) for a, b in zip(inputs, outputs) if a in self.keep and b in self.keep
+        ]
+        if len(pairs) == len(inputs):
+            return True
+        self.changed = True
+        if not pairs:
+            return False
+        statement.glyphs = [ast.GlyphClass([a for a, _ in pairs])]
+        statement.replacements = [ast.GlyphClass([b for _, b in pairs])]
+        return True
+
+    def glyph_list(self, value):
+        if isinstance(value, ast.GlyphName):
+            return [value.glyph]
+        if isinstance(value, ast.GlyphClass):
+            return list(value.glyphs)
+        if isinstance(value, ast.GlyphClassName):
+            return self.class_glyphs.get(value.glyphclass.name)
+        return None
+
+    def prune_value(self, value):
+        """Return the value without the removed glyphs, or _REMOVED if no glyph
+        is left of it."""
+        if isinstance(value, ast.GlyphName):
+            if value.glyph in self.keep:
+                return value
+        elif isinstance(value, ast.GlyphClass):
+            glyphs = [glyph for glyph in value.glyphs if glyph in self.keep]
+            if len(glyphs) == len(value.glyphs):
+                return value
+            self.changed = True
+            if glyphs:
+                return ast.GlyphClass(glyphs, location=value.location)
+        elif isinstance(value, ast.GlyphClassName):
+            if value.glyphclass.name not in self.emptied_classes:
+                return value
+        elif isinstance(value, (ast.MarkClassName, ast.MarkClass)):
+            mark_class = getattr(value, "markClass", value)
+            if any(glyph in self.keep for glyph in mark_class.glyphs):
+                return value
+        elif type(value) in (list, tuple):
+            items = [self.prune_value(item) for item in value]
+            if any(item is _REMOVED for item in items):
+                return _REMOVED
+            if all(a is b for a, b in zip(items, value)):
+                return value
+            return type(value)(items)
+        else:
+            return value
+        return _REMOVED
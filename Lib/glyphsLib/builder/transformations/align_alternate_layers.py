@@ -1,5 +1,6 @@
 import copy
 import logging
+import uuid
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
@@ -94,7 +95,13 @@ def align_alternate_layers(font, glyph_data=None):
 
 def synthesize_bracket_layer(old_layer, axis_rules):
     new_layer = copy.copy(old_layer)  # We don't need a deep copy of everything
-    new_layer.layerId = ""
+    # The same layer ID on each run, for the anchor propagation cache
+    new_layer.layerId = str(
+        uuid.uuid5(
+            uuid.NAMESPACE_OID,
+            repr((old_layer.parent.name, old_layer.layerId, axis_rules)),
+        )
+    ).upper()
     new_layer.associatedMasterId = old_layer.layerId
 
     if new_layer.parent.parent.format_version == 2:
@@ -13,6 +13,8 @@ shared with us privately.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from collections import deque
 from itertools import chain
@@ -21,11 +23,13 @@ from typing import TYPE_CHECKING
 
 from fontTools.misc.transform import Transform
 from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates
-from fontTools.varLib.models import VariationModel, normalizeLocation
 
 from glyphsLib import glyphdata
 from glyphsLib.classes import GSAnchor
 from glyphsLib.types import Point
+from glyphsLib.util import ProcessPool, worker_state
+
+from ..variation_models import InterpolationModels, interpolation_models
 
 logger = logging.getLogger(__name__)
 
@@ -36,15 +40,107 @@ if TYPE_CHECKING:
 
 
 def propagate_all_anchors(
-    font: GSFont, *, glyph_data: glyphdata.GlyphData | None = None
+    font: GSFont,
+    *,
+    glyph_data: glyphdata.GlyphData | None = None,
+    cache: AnchorPropagationCache | None = None,
+    workers: int | None = 1,
 ) -> None:
     """Copy anchors from component glyphs into their including composites.
 
     If a custom `glyph_data` is provided, it will be used to override the
     category and subCategory of glyphs.
+
+    If an `AnchorPropagationCache` is provided, the anchors of the glyphs that
+    have not changed since it was last used are taken from it instead of being
+    computed again, and it is updated with the others.
+
+    With `workers` set to more than 1 (None means the number of CPUs), the
+    composites of each component depth, which don't depend on each other, are
+    processed in a pool of worker processes, which pays off for fonts with
+    many composites. The result is the same as when processed serially.
     """
     glyphs = {glyph.name: glyph for glyph in font.glyphs}
-    propagate_all_anchors_impl(glyphs, font=font, glyph_data=glyph_data)
+    propagate_all_anchors_impl(
+        glyphs, font=font, glyph_data=glyph_data, cache=cache, workers=workers
+    )
+
+
+class AnchorPropagationCache:
+    """The anchors propagated to each glyph, kept between runs of
+    `propagate_all_anchors`, e.g. when rebuilding a font after an edit.
+
+    The anchors of a glyph are stored along with a hash of everything they
+    depend on: the anchors, components and locations of its layers, its
+    category and subCategory, the smart component settings, the design space
+    of the font, and the hashes of its components. A glyph is only recomputed
+    when this hash changes, which is counted in `recomputed`; the glyphs taken
+    from the cache are counted in `reused`.
+
+    The cache can be written to a JSON file with `save` and read back with
+    `load`, to be reused across processes. The glyphs whose anchors have
+    userData that JSON can't represent are not cached, and the glyphs that
+    are no longer in the font are dropped at the end of each run.
+    """
+
+    def __init__(self):
+        # glyph name -> (hash, {layer ID: (anchors, number of base glyphs)}),
+        # with the anchors as [name, x, y, userData] lists
+        self.glyphs = {}
+        self.recomputed = 0
+        self.reused = 0
+
+    def _get(self, name, key):
+        entry = self.glyphs.get(name)
+        if entry is None or entry[0] != key:
+            return None
+        self.reused += 1
+        return entry[1]
+
+    def _set(self, name, key, layers):
+        self.recomputed += 1
+        if _is_json_data(layers):
+            self.glyphs[name] = (key, layers)
+        else:
+            # Anchors with e.g. bytes or dates in their userData can't be
+            # saved, these glyphs are recomputed on each run
+            self.glyphs.pop(name, None)
+
+    def _retain(self, names):
+        # Drop the glyphs that were renamed or deleted since the last run
+        for name in self.glyphs.keys() - names:
+            del self.glyphs[name]
+
+    def save(self, path):
+        """Write the cached anchors to a JSON file."""
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump({"glyphs": self.glyphs}, fp)
+
+    @classmethod
+    def load(cls, path):
+        """Read a cache written by `save`."""
+        cache = cls()
+        with open(path, encoding="utf-8") as fp:
+            cache.glyphs = {
+                name: (key, layers)
+                for name, (key, layers) in json.load(fp)["glyphs"].items()
+            }
+        return cache
+
+
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_json_data(value) -> bool:
+    """Return whether value is saved to JSON and loaded back unchanged, but
+    for tuples becoming lists."""
+    if isinstance(value, _JSON_SCALAR_TYPES):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_data(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json_data(v) for k, v in value.items())
+    return False
 
 
 # the actual implementation, easier to test and compare with the original Rust code
@@ -53,11 +149,13 @@ def propagate_all_anchors_impl(
     *,
     font: GSFont | None = None,
     glyph_data: glyphdata.GlyphData | None = None,
+    cache: AnchorPropagationCache | None = None,
+    workers: int | None = 1,
 ) -> None:
     # the reference implementation does this recursively, but we opt to
     # implement it by pre-sorting the work to ensure we always process components
     # first.
-    todo = depth_sorted_composite_glyphs(glyphs)
+    levels = depth_sorted_composite_levels(glyphs)
     num_base_glyphs: dict[(str, str), int] = {}
     # NOTE: there's an important detail here, which is that we need to call the
     # 'anchors_traversing_components' function on each glyph, and save the returned
@@ -69,36 +167,320 @@ def propagate_all_anchors_impl(
     # For brace layer interpolation
     master_locations, axes_triples = _get_design_space_info(font)
     layer_locations: dict[str, dict[str, float]] = {}
-    variation_model_cache: dict = {}
+    # Shared with the decomposition of smart components
+    models = interpolation_models(font)
+
+    if cache is not None:
+        # The master names are part of the names of the master layers, which
+        # make them brace or bracket layers in Glyphs 2
+        design_space_key = repr(
+            (
+                sorted(master_locations.items()),
+                sorted(axes_triples.items()),
+                [master.name for master in font.masters] if font else None,
+            )
+        )
+        glyph_keys: dict[str, str] = {}
+
+    # Glyphs without components only take their own anchors, the pool is for
+    # the composites
+    pool = None
+    if workers != 1 and sum(len(level) for level in levels[1:]) > 1:
+        pool = _anchor_propagation_pool(font, glyphs, glyph_data, axes_triples, workers)
+
+    try:
+        for depth, level in enumerate(levels):
+            # (name, layers, hash) of the glyphs left to the worker processes
+            pending = []
+            for name in level:
+                glyph = glyphs[name]
+                layers = list(_interesting_layers(glyph))
+                for layer in layers:
+                    # Record this layer's location before traversal so it's
+                    # available for interpolation of component anchors at
+                    # brace layer locations
+                    loc = _get_layer_location(layer, master_locations)
+                    if loc is not None:
+                        layer_locations[layer.layerId] = loc
+
+                key = None
+                if cache is not None:
+                    key = glyph_keys[name] = _glyph_key(
+                        glyph, layers, glyph_data, glyph_keys, design_space_key
+                    )
+                    cached = cache._get(name, key)
+                    if cached is not None:
+                        _restore_cached_anchors(
+                            name, cached, all_anchors, num_base_glyphs
+                        )
+                        continue
+
+                if pool is not None and depth > 0:
+                    pending.append((name, layers, key))
+                    continue
+
+                for layer in layers:
+                    anchors = anchors_traversing_components(
+                        glyph,
+                        layer,
+                        glyphs,
+                        all_anchors,
+                        num_base_glyphs,
+                        glyph_data,
+                        layer_locations=layer_locations,
+                        axes_triples=axes_triples,
+                        interpolation_models=models,
+                    )
+                    maybe_log_new_anchors(anchors, glyph, layer)
+                    all_anchors.setdefault(name, {})[layer.layerId] = anchors
+
+                if cache is not None:
+                    _cache_anchors(cache, name, key, all_anchors, num_base_glyphs)
+
+            if pending:
+                _propagate_level_in_pool(
+                    pool,
+                    pending,
+                    glyphs,
+                    all_anchors,
+                    num_base_glyphs,
+                    layer_locations,
+                )
+                if cache is not None:
+                    for name, _, key in pending:
+                        _cache_anchors(cache, name, key, all_anchors, num_base_glyphs)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    if cache is not None:
+        cache._retain(glyph_keys.keys())
+
+    # finally update our glyphs with the new anchors, where appropriate
+    _set_propagated_anchors(glyphs, all_anchors)
+
+
+def _set_propagated_anchors(glyphs, all_anchors):
+    for name, layers in all_anchors.items():
+        glyph = glyphs[name]
+        if _has_components(glyph):
+            for layer_id, layer_anchors in layers.items():
+                glyph.layers[layer_id].anchors = layer_anchors
+
+
+def _anchor_propagation_pool(font, glyphs, glyph_data, axes_triples, workers):
+    # The workers get the glyphs once, when they start (without pickling them
+    # where processes are forked); then they only receive the anchors of the
+    # components of each level.
+    return ProcessPool(
+        workers,
+        initializer=_init_anchor_propagation_worker,
+        initargs=(font, glyphs, glyph_data, axes_triples),
+    )
+
+
+def _propagate_level_in_pool(
+    pool: ProcessPool,
+    pending: list[tuple[str, list[GSLayer], str | None]],
+    glyphs: dict[str, GSGlyph],
+    all_anchors: dict[str, dict[str, list[GSAnchor]]],
+    num_base_glyphs: dict[(str, str), int],
+    layer_locations: dict[str, dict[str, float]],
+) -> None:
+    """Propagate the anchors of glyphs of the same depth in worker processes,
+    and merge them into all_anchors and num_base_glyphs."""
+    jobs = []
+    chunksize = pool.chunksize(len(pending))
+    for start in range(0, len(pending), chunksize):
+        chunk = pending[start : start + chunksize]
+        component_names = set()
+        layer_ids = set()
+        for _, layers, _ in chunk:
+            for layer in layers:
+                layer_ids.add(layer.layerId)
+                component_names.update(c.name for c in layer.components)
+        component_anchors = {}
+        base_counts = {}
+        for component_name in component_names:
+            component_layers = all_anchors.get(component_name)
+            if component_layers is None:
+                continue
+            component_anchors[component_name] = {
+                layer_id: _anchors_to_data(anchors)
+                for layer_id, anchors in component_layers.items()
+            }
+            for layer_id in component_layers:
+                layer_ids.add(layer_id)
+                count = num_base_glyphs.get((component_name, layer_id))
+                if count is not None:
+                    base_counts[(component_name, layer_id)] = count
+        locations = {
+            layer_id: layer_locations[layer_id]
+            for layer_id in layer_ids
+            if layer_id in layer_locations
+        }
+        jobs.append(
+            (
+                [name for name, _, _ in chunk],
+                component_anchors,
+                base_counts,
+                locations,
+            )
+        )
 
-    for name in todo:
+    for results in pool.map(_propagate_anchors_in_worker, jobs, chunksize=1):
+        for name, layer_anchors, counts in results:
+            glyph = glyphs[name]
+            layers = all_anchors.setdefault(name, {})
+            for layer_id, data in layer_anchors.items():
+                anchors = layers[layer_id] = _anchors_from_data(data)
+                maybe_log_new_anchors(anchors, glyph, glyph.layers[layer_id])
+            for layer_id, count in counts.items():
+                num_base_glyphs[(name, layer_id)] = count
+
+
+def _init_anchor_propagation_worker(font, glyphs, glyph_data, axes_triples):
+    """Return the glyphs, glyph data, axes and InterpolationModels of an anchor
+    propagation worker process."""
+    return glyphs, glyph_data, axes_triples, interpolation_models(font)
+
+
+def _propagate_anchors_in_worker(job):
+    names, component_anchors, base_counts, layer_locations = job
+    glyphs, glyph_data, axes_triples, models = worker_state()
+    done_anchors = {
+        name: {layer_id: _anchors_from_data(data) for layer_id, data in layers.items()}
+        for name, layers in component_anchors.items()
+    }
+    results = []
+    for name in names:
         glyph = glyphs[name]
+        layer_anchors = {}
+        counts = {}
         for layer in _interesting_layers(glyph):
-            # Record this layer's location before traversal so it's available
-            # for interpolation of component anchors at brace layer locations
-            loc = _get_layer_location(layer, master_locations)
-            if loc is not None:
-                layer_locations[layer.layerId] = loc
             anchors = anchors_traversing_components(
                 glyph,
                 layer,
                 glyphs,
-                all_anchors,
-                num_base_glyphs,
+                done_anchors,
+                base_counts,
                 glyph_data,
                 layer_locations=layer_locations,
                 axes_triples=axes_triples,
-                variation_model_cache=variation_model_cache,
+                interpolation_models=models,
             )
-            maybe_log_new_anchors(anchors, glyph, layer)
-            all_anchors.setdefault(name, {})[layer.layerId] = anchors
+            layer_anchors[layer.layerId] = _anchors_to_data(anchors)
+            count = base_counts.get((name, layer.layerId))
+            if count is not None:
+                counts[layer.layerId] = count
+        results.append((name, layer_anchors, counts))
+    return results
 
-    # finally update our glyphs with the new anchors, where appropriate
-    for name, layers in all_anchors.items():
-        glyph = glyphs[name]
-        if _has_components(glyph):
-            for layer_id, layer_anchors in layers.items():
-                glyph.layers[layer_id].anchors = layer_anchors
+
+def _anchors_to_data(anchors: list[GSAnchor]) -> list:
+    return [[a.name, a.position.x, a.position.y, dict(a.userData)] for a in anchors]
+
+
+def _anchors_from_data(data: list) -> list[GSAnchor]:
+    return [
+        GSAnchor(name=name, position=Point(x, y), userData=dict(user_data))
+        for name, x, y, user_data in data
+    ]
+
+
+def _cache_anchors(
+    cache: AnchorPropagationCache,
+    glyph_name: str,
+    key: str,
+    all_anchors: dict[str, dict[str, list[GSAnchor]]],
+    num_base_glyphs: dict[(str, str), int],
+) -> None:
+    cache._set(
+        glyph_name,
+        key,
+        {
+            layer_id: (
+                _anchors_to_data(anchors),
+                num_base_glyphs.get((glyph_name, layer_id)),
+            )
+            for layer_id, anchors in all_anchors.get(glyph_name, {}).items()
+        },
+    )
+
+
+def _glyph_key(
+    glyph: GSGlyph,
+    layers: list[GSLayer],
+    glyph_data: glyphdata.GlyphData | None,
+    glyph_keys: dict[str, str],
+    design_space_key: str,
+) -> str:
+    """Hash what the propagated anchors of a glyph depend on, including the
+    hashes of its components, which come first in the depth order."""
+    layer_keys = []
+    component_names = set()
+    has_anchors = False
+    for layer in layers:
+        has_anchors = has_anchors or bool(layer.anchors)
+        components = []
+        for component in layer.components:
+            component_names.add(component.name)
+            components.append(
+                (
+                    component.name,
+                    tuple(component.transform),
+                    component.anchor,
+                    sorted(component.smartComponentValues.items()),
+                )
+            )
+        layer_keys.append(
+            (
+                layer.layerId,
+                layer.associatedMasterId,
+                # What makes brace and bracket layers, cheaper than the name
+                layer._name,
+                layer._attributes,
+                # Only read for smart components, as it creates the mapping in
+                # the userData of Glyphs 2 layers otherwise
+                (
+                    sorted(layer.smartComponentPoleMapping.items())
+                    if glyph.smartComponentAxes
+                    else None
+                ),
+                [(a.name, tuple(a.position), a._userData) for a in layer.anchors],
+                components,
+            )
+        )
+    categories = None
+    if has_anchors or component_names:
+        categories = (
+            _get_category(glyph, glyph_data),
+            _get_subCategory(glyph, glyph_data),
+        )
+    key = (
+        design_space_key,
+        glyph.name,
+        categories,
+        [
+            (axis.name, axis.bottomValue, axis.topValue)
+            for axis in glyph.smartComponentAxes or ()
+        ],
+        layer_keys,
+        sorted((name, glyph_keys.get(name)) for name in component_names),
+    )
+    return hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _restore_cached_anchors(
+    glyph_name: str,
+    cached: dict,
+    all_anchors: dict[str, dict[str, list[GSAnchor]]],
+    num_base_glyphs: dict[(str, str), int],
+) -> None:
+    layers = all_anchors.setdefault(glyph_name, {})
+    for layer_id, (anchors, count) in cached.items():
+        layers[layer_id] = _anchors_from_data(anchors)
+        if count is not None:
+            num_base_glyphs[(glyph_name, layer_id)] = count
 
 
 def maybe_log_new_anchors(
@@ -229,13 +611,14 @@ def _interpolate_component_anchors(
     all_anchors: dict[str, dict[str, list[GSAnchor]]],
     layer_locations: dict[str, dict[str, float]],
     axes_triples: dict[str, tuple[float, float, float]],
-    variation_model_cache: dict,
+    interpolation_models: InterpolationModels,
 ) -> list[GSAnchor] | None:
     """Interpolate a component's anchors at a location where it has no source.
 
     Collects all available (location, anchors) pairs for the component, builds
     a VariationModel from normalized locations, and interpolates each anchor
-    independently. Models are cached by source location set.
+    independently. Models and normalized locations come from the font's
+    `InterpolationModels`.
 
     Returns None if the component has no entries in all_anchors or interpolation
     fails entirely.
@@ -253,13 +636,13 @@ def _interpolate_component_anchors(
         loc = layer_locations.get(layer_id)
         if loc is None:
             continue
-        norm_loc = normalizeLocation(loc, axes_triples)
+        norm_loc = interpolation_models.normalize(loc, axes_triples)
         per_location.append((norm_loc, layer_anchors))
 
     if not per_location:
         return None
 
-    norm_target = normalizeLocation(target_location, axes_triples)
+    norm_target = interpolation_models.normalize(target_location, axes_triples)
 
     # Get canonical anchor names from the default source location.
     default_source_anchors = next(
@@ -299,24 +682,20 @@ def _interpolate_component_anchors(
         if not sources:
             continue
 
-        source_locs = [loc for loc, _ in sources]
-        cache_key = frozenset(tuple(sorted(loc.items())) for loc in source_locs)
-        if cache_key not in variation_model_cache:
-            try:
-                variation_model_cache[cache_key] = VariationModel(
-                    source_locs, axisOrder=axis_order
-                )
-            except Exception as e:
-                logger.warning(
-                    "failed to build VariationModel for anchor '%s' on "
-                    "component '%s': %s",
-                    name,
-                    component_name,
-                    e,
-                )
-                continue
+        try:
+            model = interpolation_models.model(
+                [loc for loc, _ in sources], axis_order=axis_order
+            )
+        except Exception as e:
+            logger.warning(
+                "failed to build VariationModel for anchor '%s' on "
+                "component '%s': %s",
+                name,
+                component_name,
+                e,
+            )
+            continue
 
-        model = variation_model_cache[cache_key]
         master_values = [GlyphCoordinates([(pos.x, pos.y)]) for _, pos in sources]
 
         try:
@@ -397,7 +776,7 @@ def _resolve_component_anchors(
     done_anchors: dict[str, dict[str, list[GSAnchor]]],
     layer_locations: dict[str, dict[str, float]] | None,
     axes_triples: dict[str, tuple[float, float, float]] | None,
-    variation_model_cache: dict | None,
+    interpolation_models: InterpolationModels | None,
 ) -> list[GSAnchor] | None:
     """Get anchors for a component, falling back to interpolation for brace layers."""
     anchors = get_component_layer_anchors(component, layer, glyphs, done_anchors)
@@ -411,7 +790,7 @@ def _resolve_component_anchors(
         layer._is_brace_layer()
         and layer_locations is not None
         and axes_triples
-        and variation_model_cache is not None
+        and interpolation_models is not None
     ):
         target_loc = layer_locations.get(layer.layerId)
         if target_loc is None:
@@ -428,7 +807,7 @@ def _resolve_component_anchors(
                 done_anchors,
                 layer_locations,
                 axes_triples,
-                variation_model_cache,
+                interpolation_models,
             )
 
     return anchors
@@ -443,7 +822,7 @@ def anchors_traversing_components(
     glyph_data: glyphdata.GlyphData | None = None,
     layer_locations: dict[str, dict[str, float]] | None = None,
     axes_triples: dict[str, tuple[float, float, float]] | None = None,
-    variation_model_cache: dict | None = None,
+    interpolation_models: InterpolationModels | None = None,
 ) -> list[GSAnchor]:
     """Return the anchors for this glyph, including anchors from components
 
@@ -483,7 +862,7 @@ def anchors_traversing_components(
             done_anchors,
             layer_locations,
             axes_triples,
-            variation_model_cache,
+            interpolation_models,
         )
         if anchors is None:
             logger.debug(
@@ -817,3 +1196,18 @@ def depth_sorted_composite_glyphs(glyphs: dict[str, GSGlyph]) -> list[str]:
         (depth, name) for name, depth in depths.items() if not isinf(depth)
     )
     return [name for _, name in by_depth]
+
+
+def depth_sorted_composite_levels(glyphs: dict[str, GSGlyph]) -> list[list[str]]:
+    """Like depth_sorted_composite_glyphs, but return a list of sorted glyph
+    names per depth; the glyphs of a level only have components in the
+    previous ones."""
+    depths = compute_max_component_depths(glyphs)
+    levels = []
+    for depth, name in sorted(
+        (depth, name) for name, depth in depths.items() if not isinf(depth)
+    ):
+        while len(levels) <= depth:
+            levels.append([])
+        levels[depth].append(name)
+    return levels
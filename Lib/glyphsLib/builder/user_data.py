@@ -119,9 +119,13 @@ def to_ufo_layer_user_data(self, ufo_glyph, layer):
             ufo_glyph.lib[key] = other_data[key]
 
 
-def to_ufo_node_user_data(self, ufo_glyph, node, user_data: dict):
+def to_ufo_node_user_data(
+    self, ufo_glyph, node, user_data: dict, path_index=None, node_index=None
+):
     if user_data:
-        path_index, node_index = node._indices()
+        # Computing the indices is slow, pass them along when they are known.
+        if path_index is None or node_index is None:
+            path_index, node_index = node._indices()
         key = f"{NODE_USER_DATA_KEY}.{path_index}.{node_index}"
         ufo_glyph.lib[key] = user_data
 
@@ -23,7 +23,7 @@ from fontTools.misc.roundTools import otRound
 from fontTools.varLib.featureVars import overlayFeatureVariations
 from fontTools.varLib.models import piecewiseLinearMap
 
-from .axes import to_designspace_axes
+from .axes import AxisLocationCache, to_designspace_axes
 
 logger = logging.getLogger(__name__)
 
@@ -62,23 +62,28 @@ _ifndef_start_re = re.compile(r"#ifndef\s+VARIABLE")
 
 
 def _strip_ifndef(fea):
+    # Returns the feature code without the static-only code, and its copy
+    # masked by _blank_comments_and_strings.
     fea = _ifndef_re.sub("", fea)
+    masked = _blank_comments_and_strings(fea)
     # An unterminated #ifndef VARIABLE runs to the end of the enclosing
     # feature code, like in Glyphs.
-    while m := _ifndef_start_re.search(fea):
-        masked = _blank_comments_and_strings(fea)
-        end = len(fea)
-        depth = 0
-        for i in range(m.end(), len(fea)):
-            if masked[i] == "{":
-                depth += 1
-            elif masked[i] == "}":
-                if depth == 0:
-                    end = i
-                    break
-                depth -= 1
-        fea = fea[: m.start()] + fea[end:]
-    return fea
+    pieces, masked_pieces = [], []
+    pos = 0
+    for m in _ifndef_start_re.finditer(fea):
+        if m.start() < pos:
+            continue
+        end = _match_block(masked, m.end())
+        if end is None:
+            end = len(fea)
+        pieces.append(fea[pos : m.start()])
+        masked_pieces.append(masked[pos : m.start()])
+        pos = end
+    if not pieces:
+        return fea, masked
+    pieces.append(fea[pos:])
+    masked_pieces.append(masked[pos:])
+    return "".join(pieces), "".join(masked_pieces)
 
 
 # Comments and strings may contain braces that do not open or close a block.
@@ -90,16 +95,19 @@ def _blank_comments_and_strings(fea):
     return _comment_or_string_re.sub(lambda m: " " * len(m.group()), fea)
 
 
+_brace_re = re.compile(r"[{}]")
+
+
 def _match_block(masked, start):
     # index of the brace closing the block opened before `start`, or None
     depth = 1
-    for i in range(start, len(masked)):
-        if masked[i] == "{":
+    for m in _brace_re.finditer(masked, start):
+        if m.group() == "{":
             depth += 1
-        elif masked[i] == "}":
+        else:
             depth -= 1
             if depth == 0:
-                return i
+                return m.start()
     return None
 
 
@@ -123,11 +131,11 @@ _has_variable_re = re.compile(
 )
 _axis_spec_re = re.compile(_axis_spec)
 _value_record_keyword_re = re.compile(r"\b(?:device|contourpoint|NULL)\b")
-_value_record_re = re.compile(rf"{_skip}|{_value_record}")
-_scalar_re = re.compile(
+_gpos_re = re.compile(
     rf"""
       {_skip}          # Left unchanged.
-    | {_value_record}  # Left unchanged so the numbers inside are not scalars.
+    | {_value_record}  # A value record or anchor, the numbers inside are not
+                       # scalars.
     | {_number}        # A variable scalar, e.g. “10 (wght:900) 20”.
       (?:              # “(location)” value pairs after the default value.
         \s*\(\s*{_axis_spec}(?:\s*,?\s*{_axis_spec})*\s*\)  # Commas optional.
@@ -146,16 +154,20 @@ _axis_range_re = re.compile(
     re.VERBOSE,
 )
 _feature_start_re = re.compile(rf"feature\s+({_tag})(\s+useExtension)?\s*\{{")
+_feature_end_re = re.compile(rf"\s*({_tag})\s*;")
 
 
 class VariableFeatureConverter:
-    def __init__(self, font):
+    def __init__(self, font, axis_locations=None):
         # We don’t have access to axes definitions yet, so we get them here the
         # same way they will be generated for the Designspace.
+        if axis_locations is None:
+            axis_locations = AxisLocationCache(font)
         shim = SimpleNamespace(
             font=font,
             designspace=DesignSpaceDocument(),
             minimize_glyphs_diffs=False,
+            axis_locations=axis_locations,
         )
         to_designspace_axes(shim)
         axes = shim.designspace.axes
@@ -167,18 +179,11 @@ class VariableFeatureConverter:
         if not _has_variable_re.search(fea):
             return fea
 
-        fea = _strip_ifndef(fea)
-        fea = self._translate_gpos(fea)
-        fea = self._translate_gsub(fea)
-
-        # every condition must sit inside a feature block; a leftover means one
-        # appeared at top level (e.g. in a prefix) and was not converted
-        if _condition_re.search(_blank_comments_and_strings(fea)):
-            raise ValueError(
-                "condition statements outside feature blocks are not supported"
-            )
-
-        return fea
+        # The comments and strings are masked once, the feature blocks with
+        # conditions are found in the masked copy, then the code is translated
+        # piece by piece.
+        fea, masked = _strip_ifndef(fea)
+        return self._translate(fea, masked)
 
     def _axis(self, tag):
         if tag not in self.axes:
@@ -298,20 +303,16 @@ class VariableFeatureConverter:
         scalars = self._variable_scalars(tokens, 4, record, "value record")
         return f"<{' '.join(scalars)}>"
 
+    def _translate_gpos_match(self, match):
+        first = match.group(0)[0]
+        if first in '#"':
+            return match.group(0)
+        if first == "<":
+            return self._translate_value_record(match)
+        return self._translate_scalar(match)
+
     def _translate_gpos(self, fea):
-        fea = _value_record_re.sub(
-            lambda m: (
-                m.group(0) if m.group(0)[0] in '#"' else self._translate_value_record(m)
-            ),
-            fea,
-        )
-        fea = _scalar_re.sub(
-            lambda m: (
-                m.group(0) if m.group(0)[0] in '#"<' else self._translate_scalar(m)
-            ),
-            fea,
-        )
-        return fea
+        return _gpos_re.sub(self._translate_gpos_match, fea)
 
     # GSUB
 
@@ -349,30 +350,33 @@ class VariableFeatureConverter:
         self.condition_sets[conditions] = name
         return name, definition
 
-    def _split_at_conditions(self, body, masked_body):
+    def _split_at_conditions(self, body, masked_body, tag):
+        # Returns (conditions, rules) segments, with the GPOS rules translated.
+        matches = list(_condition_re.finditer(masked_body))
+        depth, last = 0, 0
+        for m in matches:
+            depth += masked_body.count("{", last, m.start())
+            depth -= masked_body.count("}", last, m.start())
+            last = m.start()
+            if depth > 0:
+                raise ValueError(
+                    f"condition statements inside lookup blocks are not supported "
+                    f"in feature '{tag}': {m.group(0).strip()}"
+                )
+
         segments = []
         last, conditions = 0, None
-        for m in _condition_re.finditer(masked_body):
-            segments.append((conditions, body[last : m.start()]))
+        for m in matches:
+            segments.append((conditions, self._translate_gpos(body[last : m.start()])))
             conditions = self._parse_conditions(m.group(1))
             last = m.end()
-        segments.append((conditions, body[last:]))
+        segments.append((conditions, self._translate_gpos(body[last:])))
         return segments
 
     def _translate_feature(self, body, masked_body, tag, use_extension=""):
         # Emit unconditional rules in the feature block, then a variation block
         # per conditional region.
-        for m in _condition_re.finditer(masked_body):
-            depth = masked_body.count("{", 0, m.start()) - masked_body.count(
-                "}", 0, m.start()
-            )
-            if depth > 0:
-                raise ValueError(
-                    f"condition statements inside lookup blocks are not supported "
-                    f"in feature '{tag}': {m.group(0).strip()}"
-                )
-
-        segments = self._split_at_conditions(body, masked_body)
+        segments = self._split_at_conditions(body, masked_body, tag)
         base = [segments[0][1]]
         conditional = []
         for conditions, text in segments[1:]:
@@ -416,7 +420,7 @@ class VariableFeatureConverter:
                             for t, axis_min, axis_max in conds
                         }
                     ],
-                    {i: text},
+                    {i: text.strip()},
                 )
                 for i, (conds, text) in enumerate(conditional)
             ]
@@ -450,34 +454,42 @@ class VariableFeatureConverter:
                 if other_box is box or _box_within(box, other_box):
                     for d in other_values:
                         merged.update(d)
-            rules = "\n".join(text.strip() for _, text in sorted(merged.items()))
+            rules = "\n".join(text for _, text in sorted(merged.items()))
             parts.append(f"\nvariation {tag} {name} {{\n{rules}\n}} {tag};\n")
 
         return "".join(parts)
 
-    def _translate_gsub(self, fea):
-        masked = _blank_comments_and_strings(fea)
+    def _translate(self, fea, masked):
         out = []
         pos = 0
         while m := _feature_start_re.search(masked, pos):
             tag = m.group(1)
             if (close := _match_block(masked, m.end())) is None:
                 break
-            tail = re.match(rf"\s*{tag}\s*;", masked[close + 1 :])
-            end = close + 1 + (tail.end() if tail else 0)
-            masked_body = masked[m.end() : close]
-            if tail is None or not _condition_re.search(masked_body):
-                out.append(fea[pos:end])
+            tail = _feature_end_re.match(masked, close + 1)
+            if tail is not None and tail.group(1) != tag:
+                tail = None
+            end = tail.end() if tail is not None else close + 1
+            if tail is None or not _condition_re.search(masked, m.end(), close):
+                out.append(self._translate_gpos(fea[pos:end]))
             else:
-                out.append(fea[pos : m.start()])
+                out.append(self._translate_gpos(fea[pos : m.start()]))
                 out.append(
                     self._translate_feature(
                         fea[m.end() : close],
-                        masked_body,
+                        masked[m.end() : close],
                         tag,
                         use_extension=" useExtension" if m.group(2) else "",
                     )
                 )
             pos = end
-        out.append(fea[pos:])
-        return "".join(out)
+        out.append(self._translate_gpos(fea[pos:]))
+        fea = "".join(out)
+
+        # every condition must sit inside a feature block; a leftover means one
+        # appeared at top level (e.g. in a prefix) and was not converted
+        if _condition_re.search(_blank_comments_and_strings(fea)):
+            raise ValueError(
+                "condition statements outside feature blocks are not supported"
+            )
+        return fea
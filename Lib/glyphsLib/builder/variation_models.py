@@ -0,0 +1,117 @@
+# Copyright 2026 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""VariationModels and normalized locations shared by the interpolations done
+while converting a font.
+
+Anchor propagation interpolates the anchors of components at the locations of
+brace layers and of smart components, and the builder interpolates the
+outlines of smart components when decomposing them. The same few sets of
+master locations come up over and over, so their models are built once per
+font, along with the normalized locations:
+
+    models = interpolation_models(font)
+    model = models.model([{}, {"wght": 1.0}], axis_order=["wght"])
+    location = models.normalize({"wght": 500}, {"wght": (100, 400, 900)})
+"""
+
+import weakref
+
+from fontTools.varLib.models import VariationModel, normalizeLocation
+
+
+class InterpolationModels:
+    """A cache of VariationModels, keyed by their normalized master locations,
+    and of normalized locations.
+
+    The number of cache hits and misses are counted in `model_hits`,
+    `model_misses`, `location_hits` and `location_misses`, see `stats`.
+    """
+
+    def __init__(self):
+        self._models = {}
+        self._locations = {}
+        self.model_hits = 0
+        self.model_misses = 0
+        self.location_hits = 0
+        self.location_misses = 0
+
+    def model(self, locations, axis_order=None, extrapolate=False):
+        """Return the VariationModel of the given normalized master locations.
+
+        The master values passed to the model must be in the order of the
+        locations. Errors building the model are raised, and not cached.
+        """
+        key = (
+            tuple(tuple(sorted(location.items())) for location in locations),
+            tuple(axis_order) if axis_order is not None else None,
+            extrapolate,
+        )
+        model = self._models.get(key)
+        if model is not None:
+            self.model_hits += 1
+            return model
+        self.model_misses += 1
+        model = self._models[key] = VariationModel(
+            locations, axisOrder=axis_order, extrapolate=extrapolate
+        )
+        return model
+
+    def normalize(self, location, axes, extrapolate=False):
+        """Return the location normalized to the axes, a mapping of axis names
+        to (minimum, default, maximum) tuples, like `normalizeLocation`.
+
+        The returned dict is shared, it must not be modified.
+        """
+        key = (tuple(location.items()), tuple(axes.items()), extrapolate)
+        normalized = self._locations.get(key)
+        if normalized is not None:
+            self.location_hits += 1
+            return normalized
+        self.location_misses += 1
+        normalized = self._locations[key] = normalizeLocation(
+            location, axes, extrapolate=extrapolate
+        )
+        return normalized
+
+    def stats(self):
+        """Return the hit and miss counts and hit rates of the caches."""
+        return {
+            "models": _hit_stats(self.model_hits, self.model_misses),
+            "locations": _hit_stats(self.location_hits, self.location_misses),
+        }
+
+
+def _hit_stats(hits, misses):
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hitRate": hits / total if total else 0.0,
+    }
+
+
+# GSFont -> its InterpolationModels, dropped along with the font
+_font_models = weakref.WeakKeyDictionary()
+
+
+def interpolation_models(font):
+    """Return the InterpolationModels shared by everything that interpolates
+    the given GSFont, or a new one if font is None."""
+    if font is None:
+        return InterpolationModels()
+    models = _font_models.get(font)
+    if models is None:
+        models = _font_models[font] = InterpolationModels()
+    return models
@@ -426,6 +426,99 @@ class GSApplication:
 Glyphs = GSApplication()
 
 
+# Attributes pointing back to the object owning a GS object. They are not
+# followed when deep-copying: the copy points to the copy of the owner if the
+# owner is being copied as well, or else to the original owner, instead of
+# dragging the whole font along.
+_OWNER_ATTRIBUTES = frozenset(("parent", "_parent", "_foreground", "font"))
+# Attributes holding caches derived from the other attributes, which are
+# neither deep-copied nor counted by `memory_report`.
+_CACHE_ATTRIBUTES = frozenset(("_name_indexes",))
+_IMMUTABLE_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+_slot_names_cache = {}
+
+
+def _slot_names(cls):
+    try:
+        return _slot_names_cache[cls]
+    except KeyError:
+        pass
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name not in ("__dict__", "__weakref__"))
+    _slot_names_cache[cls] = names = tuple(names)
+    return names
+
+
+# Python 3.11+
+_object_getstate = getattr(object, "__getstate__", None)
+
+
+def _instance_dict(obj):
+    """Return the __dict__ of obj, or None if it has none.
+
+    Unlike `obj.__dict__`, this doesn't allocate an empty dict for objects with
+    __slots__ that have no attribute outside of their slots, on Python 3.11+.
+    """
+    if _object_getstate is not None and _slot_names(type(obj)):
+        # Returns (__dict__ or None, slots) or only the former if no slot is set
+        state = _object_getstate(obj)
+        return state[0] if isinstance(state, tuple) else state
+    return getattr(obj, "__dict__", None)
+
+
+def _deepcopy_value(value, memo):
+    """Deep-copy an attribute value of a GS object, sharing immutable values and
+    copying the plain containers without the generic `copy.deepcopy` dispatch.
+    """
+    cls = type(value)
+    if cls in _IMMUTABLE_TYPES:
+        return value
+    copied = memo.get(id(value))
+    if copied is not None:
+        return copied
+    if cls is list:
+        copied = [
+            v if type(v) in _IMMUTABLE_TYPES else _deepcopy_value(v, memo)
+            for v in value
+        ]
+    elif cls is dict or cls is OrderedDict:
+        copied = cls(
+            (k, v if type(v) in _IMMUTABLE_TYPES else _deepcopy_value(v, memo))
+            for k, v in value.items()
+        )
+    elif cls is tuple and all(type(v) in _IMMUTABLE_TYPES for v in value):
+        return value
+    else:
+        deepcopy = getattr(cls, "__deepcopy__", None)
+        if deepcopy is not None:
+            # Skip the dispatch of copy.deepcopy for GS objects and values
+            return deepcopy(value, memo)
+        return copy.deepcopy(value, memo)
+    memo[id(value)] = copied
+    return copied
+
+
+def _lazy_dict_property(name):
+    """Return a property for a dict stored in the `name` slot, which is None
+    until the dict is first accessed: most objects never have any."""
+
+    def getter(self):
+        value = getattr(self, name)
+        if value is None:
+            value = {}
+            setattr(self, name, value)
+        return value
+
+    def setter(self, value):
+        setattr(self, name, value)
+
+    return property(getter, setter)
+
+
 class GSBase:
     """Represent the base class for all GS classes.
 
@@ -434,6 +527,10 @@ class GSBase:
             to imply by their absence.
     """
 
+    # The classes with many instances list their attributes in __slots__. They
+    # keep a "__dict__" slot as well, for the keys unknown to glyphsLib that
+    # the parser sets as attributes.
+    __slots__ = ()
     _defaultsForName = {}
 
     def __repr__(self):
@@ -454,6 +551,36 @@ class GSBase:
     def __setitem__(self, key, value):
         setattr(self, key, value)
 
+    def __deepcopy__(self, memo):
+        cls = self.__class__
+        clone = cls.__new__(cls)
+        memo[id(self)] = clone
+        state = _instance_dict(self)
+        if state:
+            clone.__dict__.update(
+                (
+                    name,
+                    (
+                        memo.get(id(value), value)
+                        if name in _OWNER_ATTRIBUTES
+                        else _deepcopy_value(value, memo)
+                    ),
+                )
+                for name, value in state.items()
+                if name not in _CACHE_ATTRIBUTES
+            )
+        for name in _slot_names(cls):
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            if name in _OWNER_ATTRIBUTES:
+                value = memo.get(id(value), value)
+            else:
+                value = _deepcopy_value(value, memo)
+            setattr(clone, name, value)
+        return clone
+
     @classmethod
     def _add_parsers(cls, specification):
         for field in specification:
@@ -527,7 +654,7 @@ class Proxy:
         return list(self)
 
     def __deepcopy__(self, memo):
-        return [x.copy() for x in self.values()]
+        return [copy.deepcopy(x, memo) for x in self.values()]
 
     def setter(self, values):
         method = self.setterMethod()
@@ -559,20 +686,24 @@ class ListDictionaryProxy(Proxy):
     def append(self, item):
         item.parent = self._owner
         self._items.append(item)
+        self._invalidate_index()
 
     def extend(self, items):
         for item in items:
             item.parent = self._owner
         self._items.extend(items)
+        self._invalidate_index()
 
     def remove(self, item):
         if isinstance(item, str):
             item = self.__getitem__(item)
         self._items.remove(item)
+        self._invalidate_index()
 
     def insert(self, index, item):
         item.parent = self._owner
         self._items.insert(index, item)
+        self._invalidate_index()
 
     def values(self):
         return self._items
@@ -598,6 +729,7 @@ class ListDictionaryProxy(Proxy):
         else:
             item = self._class(name, value)
             self._items.append(item)
+            self._invalidate_index()
 
     def __delitem__(self, key):
         if isinstance(key, int):
@@ -608,6 +740,7 @@ class ListDictionaryProxy(Proxy):
                     self._items.remove(item)
         else:
             raise KeyError(key)
+        self._invalidate_index()
 
     def __contains__(self, item):
         if isinstance(item, str):
@@ -626,9 +759,51 @@ class ListDictionaryProxy(Proxy):
             item.parent = self._owner
         self._items = items
         setattr(self._owner, self._name, items)
+        self._invalidate_index()
+
+    # The proxies are created anew on each access to e.g. `customParameters`,
+    # so the index of the items by name is kept by the owner, in its
+    # `_name_indexes` dict, which is neither deep-copied nor counted by
+    # `memory_report`. It is dropped when the list is modified through a
+    # proxy or when one of its items is renamed, and rebuilt when the list was
+    # replaced or resized behind the proxies' back.
+
+    @staticmethod
+    def _item_renamed(item):
+        # Only the indexes of the item's owner can have gone stale
+        indexes = getattr(getattr(item, "parent", None), "_name_indexes", None)
+        if indexes:
+            indexes.clear()
+
+    def _invalidate_index(self):
+        indexes = getattr(self._owner, "_name_indexes", None)
+        if indexes:
+            indexes.pop(self._name, None)
+
+    def _name_index(self):
+        """Return a dict of the item names to the items with that name, in
+        list order."""
+        owner = self._owner
+        items = self._items
+        indexes = getattr(owner, "_name_indexes", None)
+        cached = indexes.get(self._name) if indexes else None
+        if cached is not None and cached[0] is items and cached[1] == len(items):
+            return cached[2]
+        index = {}
+        for item in items:
+            index.setdefault(item.name, []).append(item)
+            # Items put in the list behind the proxies' back have no parent
+            # yet, which they need to drop the index when renamed
+            if getattr(item, "parent", None) is None:
+                item.parent = owner
+        if owner is not None:
+            if indexes is None:
+                indexes = owner._name_indexes = {}
+            indexes[self._name] = (items, len(items), index)
+        return index
 
     def _get_by_name(self, name):
-        for item in self._items:
+        for item in self._name_index().get(name, ()):
             if item.name == name:
                 return item
 
@@ -1219,21 +1394,54 @@ class LayerShapesProxy(IndexedObjectsProxy):
             return self._owner._shapes[:]
 
 
-class LayerHintsProxy(IndexedObjectsProxy):
+class LazyIndexedObjectsProxy(IndexedObjectsProxy):
+    """Proxy to a list that the owner only allocates once something is added
+    to it, storing None instead of an empty list. Reading does not allocate."""
+
+    def _current_values(self):
+        return getattr(self._owner, self._objects_name) or []
+
+    def __getitem__(self, key):
+        if isinstance(key, (slice, int)):
+            return self._current_values()[key]
+        else:
+            raise KeyError
+
+    def __len__(self):
+        return len(self._current_values())
+
+    def __iter__(self):
+        return iter(self._current_values())
+
+    def values(self):
+        values = getattr(self._owner, self._objects_name)
+        if values is None:
+            values = []
+            setattr(self._owner, self._objects_name, values)
+        return values
+
+    def setter(self, values):
+        values = list(values)
+        setattr(self._owner, self._objects_name, values or None)
+        for value in values:
+            value._parent = self._owner
+
+
+class LayerHintsProxy(LazyIndexedObjectsProxy):
     _objects_name = "_hints"
 
     def __init__(self, owner):
         super().__init__(owner)
 
 
-class LayerAnnotationProxy(IndexedObjectsProxy):
+class LayerAnnotationProxy(LazyIndexedObjectsProxy):
     _objects_name = "_annotations"
 
     def __init__(self, owner):
         super().__init__(owner)
 
 
-class LayerGuideLinesProxy(IndexedObjectsProxy):
+class LayerGuideLinesProxy(LazyIndexedObjectsProxy):
     _objects_name = "_guides"
 
     def __init__(self, owner):
@@ -1497,11 +1705,23 @@ class GSCustomParameter(GSBase):
     )
     _CUSTOM_DICT_PARAMS = frozenset("GASP Table")
 
+    _name = None
+
     def __init__(self, name="New Value", value="New Parameter", disabled=False):
         self.name = name
         self.value = value
         self.disabled = disabled
 
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        if self._name is not None and name != self._name:
+            ListDictionaryProxy._item_renamed(self)
+        self._name = name
+
     def __repr__(self):
         return f"<{self.__class__.__name__} {self.name}: {self._value}>"
 
@@ -1619,10 +1839,22 @@ class GSGuide(GSBase):
             writer.writeObjectKeyValue(self, "position", self.position != Point(0, 0))
         writer.writeObjectKeyValue(self, "showMeasurement", "if_true")
 
-    _parent = None
+    __slots__ = (
+        "_parent",
+        "alignment",
+        "angle",
+        "filter",
+        "lockAngle",
+        "locked",
+        "name",
+        "position",
+        "showMeasurement",
+        "__dict__",
+    )
     _defaultsForName = {"position": Point(0, 0), "angle": 0}
 
     def __init__(self):
+        self._parent = None
         self.alignment = ""
         self.angle = 0
         self.filter = ""
@@ -2133,6 +2365,22 @@ class GSNode(GSBase):
         if name is not None:
             self.name = name
 
+    def __deepcopy__(self, memo):
+        # Nodes can number in the 10000s, skip the generic GSBase.__deepcopy__
+        node = self.__class__.__new__(self.__class__)
+        memo[id(self)] = node
+        try:
+            node._parent = memo.get(id(self._parent), self._parent)
+        except AttributeError:
+            pass
+        node._position = Point(self._position.value[0], self._position.value[1])
+        node._userData = (
+            None if self._userData is None else _deepcopy_value(self._userData, memo)
+        )
+        node.smooth = self.smooth
+        node.type = self.type
+        return node
+
     def clone(self):
         """Clones the node (does not clone attributes)"""
         return GSNode(
@@ -2354,12 +2602,20 @@ class GSNode(GSBase):
 
 
 class GSPath(GSBase):
+    __slots__ = (
+        "_attributes",
+        "_nodes",
+        "_parent",
+        "_segmentLength",
+        "_segments",
+        "closed",
+        "__dict__",
+    )
     _defaultsForName = {"closed": True}
-    _parent = None
 
     def _serialize_to_plist(self, writer):
-        if writer.format_version == 3 and self.attributes:
-            writer.writeObjectKeyValue(self, "attributes", keyName="attr")
+        if writer.format_version == 3 and self._attributes:
+            writer.writeObjectKeyValue(self, "_attributes", keyName="attr")
         writer.writeObjectKeyValue(self, "closed")
         writer.writeObjectKeyValue(self, "nodes", "if_true")
 
@@ -2376,7 +2632,8 @@ class GSPath(GSBase):
     def __init__(self):
         self.closed = self._defaultsForName["closed"]
         self._nodes = []
-        self.attributes = {}
+        self._attributes = None
+        self._parent = None
 
     def clone(self):
         """Clones the path (Does not clone attributes)"""
@@ -2389,6 +2646,8 @@ class GSPath(GSBase):
     def parent(self):
         return self._parent
 
+    attributes = _lazy_dict_property("_attributes")
+
     nodes = property(
         lambda self: PathNodesProxy(self),
         lambda self, value: PathNodesProxy(self).setter(value),
@@ -2735,7 +2994,15 @@ class _GSTransformable(GSBase):
     but must not expose that mutable backing object.
     """
 
-    _parent = None
+    __slots__ = (
+        "_composedTransform",
+        "_parent",
+        "_position",
+        "_rotation",
+        "_scale",
+        "_slant",
+        "_transform",
+    )
 
     def _initTransform(self):
         self._position = Point(0, 0)
@@ -2882,8 +3149,8 @@ class GSComponent(_GSTransformable):
             position, scale, rotation, slant = self._transformFields()
             if rotation != 0:
                 writer.writeKeyValue("angle", rotation)
-            if self.attributes:
-                writer.writeObjectKeyValue(self, "attributes", keyName="attr")
+            if self._attributes:
+                writer.writeObjectKeyValue(self, "_attributes", keyName="attr")
         writer.writeObjectKeyValue(self, "locked", "if_true")
         if writer.format_version == 2:
             writer.writeObjectKeyValue(self, "name")
@@ -2902,15 +3169,25 @@ class GSComponent(_GSTransformable):
             if transform != Transform(1, 0, 0, 1, 0, 0):
                 writer.writeKeyValue("transform", transform)
 
+    __slots__ = (
+        "_attributes",
+        "alignment",
+        "anchor",
+        "locked",
+        "name",
+        "smartComponentValues",
+        "__dict__",
+    )
     _defaultsForName = {"transform": Transform(1, 0, 0, 1, 0, 0)}
 
     # TODO: glyph arg is required
     def __init__(self, glyph="", offset=(0, 0), scale=(1, 1), transform=None):
         self._initTransform()
+        self._parent = None
         self.alignment = 0
         self.anchor = ""
         self.locked = False
-        self.attributes = {}
+        self._attributes = None
 
         if isinstance(glyph, str):
             self.name = glyph
@@ -2987,6 +3264,8 @@ class GSComponent(_GSTransformable):
             ):
                 return Rect(Point(left, bottom), Point(right - left, top - bottom))
 
+    attributes = _lazy_dict_property("_attributes")
+
     # smartComponentValues = property(
     #     lambda self: self.piece,
     #     lambda self, value: setattr(self, "piece", value))
@@ -3048,10 +3327,11 @@ class GSAnchor(GSBase):
         )
         writer.writeObjectKeyValue(self, "userData", "if_true")
 
-    _parent = None
+    __slots__ = "_parent", "_userData", "name", "position", "__dict__"
     _defaultsForName = {"position": Point(0, 0)}
 
     def __init__(self, name=None, position=None, userData=None):
+        self._parent = None
         self.name = "" if name is None else name
         if position is None:
             self.position = copy.deepcopy(self._defaultsForName["position"])
@@ -3097,6 +3377,26 @@ class GSHint(GSBase):
         for field in ["target", "type"]:
             writer.writeObjectKeyValue(self, field, "if_true")
 
+    __slots__ = (
+        "_origin",
+        "_originNode",
+        "_other1",
+        "_other2",
+        "_otherNode1",
+        "_otherNode2",
+        "_parent",
+        "_target",
+        "_targetNode",
+        "horizontal",
+        "name",
+        "options",
+        "place",
+        "scale",
+        "settings",
+        "stem",
+        "type",
+        "__dict__",
+    )
     _defaultsForName = {
         # TODO: (jany) check defaults in glyphs
         "origin": None,
@@ -3383,6 +3683,8 @@ GSAnnotation._add_parsers(
 
 
 class GSFontInfoValue(GSBase):  # Combines localizable/nonlocalizable properties
+    _key = None
+
     def __init__(self, key="", value=""):
         self.key = key
         self._value = value
@@ -3408,6 +3710,16 @@ class GSFontInfoValue(GSBase):  # Combines localizable/nonlocalizable properties
         else:
             writer.writeObjectKeyValue(self, "value")
 
+    @property
+    def key(self):
+        return self._key
+
+    @key.setter
+    def key(self, key):
+        if self._key is not None and key != self._key:
+            ListDictionaryProxy._item_renamed(self)
+        self._key = key
+
     @property
     def name(self):
         return self.key
@@ -3777,6 +4089,7 @@ class GSBackgroundImage(_GSTransformable):
 
     def __init__(self, path=None):
         self._initTransform()
+        self._parent = None
         self.alpha = self._defaultsForName["alpha"]
         self.crop = Rect()
         self.imagePath = path
@@ -3842,7 +4155,7 @@ class GSLayer(GSBase):
         if self.layerId != self.associatedMasterId:
             writer.writeObjectKeyValue(self, "associatedMasterId")
         if writer.format_version > 2:
-            writer.writeObjectKeyValue(self, "attributes", "if_true", keyName="attr")
+            writer.writeObjectKeyValue(self, "_attributes", "if_true", keyName="attr")
         writer.writeObjectKeyValue(self, "background", self._background is not None)
         writer.writeObjectKeyValue(self, "backgroundImage")
         writer.writeObjectKeyValue(self, "color")
@@ -3870,7 +4183,9 @@ class GSLayer(GSBase):
         ):
             writer.writeObjectKeyValue(self, "name")
         if writer.format_version > 2:
-            writer.writeObjectKeyValue(self, "partSelection", "if_true")
+            writer.writeObjectKeyValue(
+                self, "_partSelection", "if_true", keyName="partSelection"
+            )
             if self._shapes:
                 writer.writeKeyValue("shapes", self._shapes)
         else:
@@ -3892,6 +4207,32 @@ class GSLayer(GSBase):
                 shape = parser._parse_dict(shape_dict, GSPath)
                 self.paths.append(shape)
 
+    __slots__ = (
+        "_anchors",
+        "_annotations",
+        "_attributes",
+        "_background",
+        "_foreground",
+        "_guides",
+        "_hints",
+        "_layerId",
+        "_name",
+        "_partSelection",
+        "_shapes",
+        "_userData",
+        "associatedMasterId",
+        "backgroundImage",
+        "color",
+        "metricLeft",
+        "metricRight",
+        "metricWidth",
+        "parent",
+        "vertOrigin",
+        "vertWidth",
+        "visible",
+        "width",
+        "__dict__",
+    )
     _defaultsForName = {
         "width": 600,
         "metricLeft": None,
@@ -3908,18 +4249,19 @@ class GSLayer(GSBase):
 
     def __init__(self):
         self._anchors = []
-        self._annotations = []
+        # The annotations, guides and hints lists, and the attributes and
+        # partSelection dicts are only allocated when needed
+        self._annotations = None
+        self._attributes = None
         self._background = None
         self._foreground = None
-        self._guides = []
-        self._hints = []
+        self._guides = None
+        self._hints = None
         self._layerId = ""
         self._name = ""
-        self._selection = []
+        self._partSelection = None
         self._shapes = []
         self._userData = None
-        self.attributes = {}
-        self.partSelection = {}
         self.associatedMasterId = ""
         self.backgroundImage = None
         self.color = None
@@ -4013,6 +4355,9 @@ class GSLayer(GSBase):
         lambda self, value: LayerHintsProxy(self).setter(value),
     )
 
+    attributes = _lazy_dict_property("_attributes")
+    partSelection = _lazy_dict_property("_partSelection")
+
     paths = property(
         lambda self: LayerPathsProxy(self),
         lambda self, value: LayerPathsProxy(self).setter(value),
@@ -4173,9 +4518,13 @@ class GSLayer(GSBase):
         r".*(?P<first_bracket>[\[\]])\s*(?P<value>\d+)\s*\].*"
     )
 
+    def _has_attribute(self, key):
+        # Check without allocating the attributes dict
+        return self._attributes is not None and key in self._attributes
+
     def _is_bracket_layer(self):
         if self.parent.parent.format_version > 2:
-            return "axisRules" in self.attributes  # Glyphs 3
+            return self._has_attribute("axisRules")  # Glyphs 3
         return re.match(self.BRACKET_LAYER_RE, self.name)  # Glyphs 2
 
     def _bracket_axis_rules(self):
@@ -4218,7 +4567,7 @@ class GSLayer(GSBase):
 
     def _is_brace_layer(self):
         if self.parent.parent.format_version > 2:
-            return "coordinates" in self.attributes  # Glyphs 3
+            return self._has_attribute("coordinates")  # Glyphs 3
         # Glyphs 2
         return "{" in self.name and "}" in self.name and ".background" not in self.name
 
@@ -4243,7 +4592,7 @@ class GSLayer(GSBase):
         # at a given location end up in the same UFO source layer, see:
         # https://github.com/googlefonts/glyphsLib/issues/851
         # TODO: Figure out a better API for layer.name vs layer.nameUI() mess...
-        if "coordinates" in self.attributes:
+        if self._has_attribute("coordinates"):
             # Glyphs 3
             return f"{{{', '.join(str(v) for v in self.attributes['coordinates'])}}}"
         # Glyphs 2
@@ -4253,7 +4602,7 @@ class GSLayer(GSBase):
 
     def _is_color_palette_layer(self):
         if self.parent.parent.format_version > 2:
-            return "colorPalette" in self.attributes  # Glyphs 3
+            return self._has_attribute("colorPalette")  # Glyphs 3
         return re.match(self.COLOR_PALETTE_LAYER_RE, self.name.strip())  # Glyphs 2
 
     def _color_palette_index(self):
@@ -4393,6 +4742,39 @@ class GSGlyph(GSBase):
         if self.smartComponentAxes:
             writer.writeKeyValue("partsSettings", self.smartComponentAxes)
 
+    __slots__ = (
+        "_layers",
+        "_unicodes",
+        "_userData",
+        "bottomKerningGroup",
+        "bottomMetricsKey",
+        "case",
+        "category",
+        "color",
+        "export",
+        "lastChange",
+        "leftKerningGroup",
+        "leftKerningKey",
+        "locked",
+        "metricLeft",
+        "metricRight",
+        "metricVertWidth",
+        "metricWidth",
+        "name",
+        "note",
+        "parent",
+        "partsSettings",
+        "production",
+        "rightKerningGroup",
+        "rightKerningKey",
+        "script",
+        "selected",
+        "subCategory",
+        "tags",
+        "topKerningGroup",
+        "topMetricsKey",
+        "__dict__",
+    )
     _defaultsForName = {
         "category": None,
         "color": None,
@@ -4604,7 +4986,7 @@ class GSGlyph(GSBase):
         )
 
     def hasSpecialLayers(self):
-        return any(bool(layer.attributes) for layer in self.layers)
+        return any(bool(layer._attributes) for layer in self.layers)
 
     def isAnyColorGlyph(self):
         return (
@@ -4615,16 +4997,16 @@ class GSGlyph(GSBase):
         )
 
     def isFullColorGlyph(self):
-        return any("color" in layer.attributes for layer in self.layers)
+        return any(layer._has_attribute("color") for layer in self.layers)
 
     def isColorPaletteGlyph(self):
-        return any("colorPalette" in layer.attributes for layer in self.layers)
+        return any(layer._has_attribute("colorPalette") for layer in self.layers)
 
     def isSVGColorGlyph(self):
-        return any("svg" in layer.attributes for layer in self.layers)
+        return any(layer._has_attribute("svg") for layer in self.layers)
 
     def isAppleColorGlyph(self):
-        return any("sbixSize" in layer.attributes for layer in self.layers)
+        return any(layer._has_attribute("sbixSize") for layer in self.layers)
 
 
 GSGlyph._add_parsers(
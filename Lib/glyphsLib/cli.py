@@ -18,6 +18,10 @@ import os
 import sys
 
 import glyphsLib
+from glyphsLib.builder.profiling import BuildProfile
+
+# Number of the slowest glyph layers listed in the --profile-report
+PROFILE_SLOWEST_GLYPHS = 20
 
 
 def main(args=None):
@@ -58,6 +62,14 @@ def main(args=None):
             "file."
         ),
     )
+    parser_glyphs2ufo.add_argument(
+        "--designspace-only",
+        action="store_true",
+        help=(
+            "Only write the designspace file (axes, sources, instances, rules, "
+            "STAT labels), without converting glyphs or writing master UFOs."
+        ),
+    )
     parser_glyphs2ufo.add_argument(
         "--ufo-module",
         metavar="UFO_MODULE",
@@ -135,6 +147,14 @@ def main(args=None):
             "differences due to spacing, reordering of keys, etc."
         ),
     )
+    group.add_argument(
+        "--update-ufos",
+        action="store_true",
+        help=(
+            "Update the existing master UFOs in place, only rewriting the files "
+            "that changed, instead of deleting and writing them anew."
+        ),
+    )
     group.add_argument(
         "--create-background-layers",
         action="store_true",
@@ -169,6 +189,44 @@ def main(args=None):
             "the exported UFO features.fea."
         ),
     )
+    parser_glyphs2ufo.add_argument(
+        "--subset",
+        action="append",
+        metavar="GLYPHS",
+        help=(
+            "Only convert these glyphs (comma-separated names) and the glyphs "
+            "they use as components. Can be used more than once."
+        ),
+    )
+    parser_glyphs2ufo.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Number of processes propagating anchors and writing the master UFOs "
+            "concurrently (default: %(default)s; 0 uses the number of CPUs)."
+        ),
+    )
+    parser_glyphs2ufo.add_argument(
+        "--anchor-cache",
+        metavar="JSON_FILE",
+        default=None,
+        help=(
+            "Keep the propagated anchors in this JSON file, and reuse them for "
+            "the glyphs that did not change when building again."
+        ),
+    )
+    parser_glyphs2ufo.add_argument(
+        "--profile-report",
+        metavar="JSON_FILE",
+        default=None,
+        help=(
+            "Write the wall time, call and item counts of each conversion stage, "
+            "the hit rates of its caches, and the slowest glyph layers to "
+            "convert, to this JSON file."
+        ),
+    )
     group = parser_glyphs2ufo.add_argument_group("Glyph data")
     group.add_argument(
         "--glyph-data",
@@ -257,6 +315,19 @@ def glyphs2ufo(options):
             os.path.basename(os.path.splitext(options.glyphs_file)[0]) + ".designspace",
         )
 
+    glyph_filter = None
+    if options.subset:
+        glyph_filter = {
+            name.strip()
+            for names in options.subset
+            for name in names.split(",")
+            if name.strip()
+        }
+
+    profile = None
+    if options.profile_report:
+        profile = BuildProfile(slowest_glyphs=PROFILE_SLOWEST_GLYPHS)
+
     # If options.instance_dir is None, instance UFO paths in the designspace
     # file will either use the value in customParameter's UFO_FILENAME_CUSTOM_PARAM or
     # be made relative to "instance_ufos/".
@@ -268,6 +339,7 @@ def glyphs2ufo(options):
         minimize_glyphs_diffs=options.no_preserve_glyphsapp_metadata,
         propagate_anchors=options.propagate_anchors,
         normalize_ufos=options.normalize_ufos,
+        update_ufos=options.update_ufos,
         create_background_layers=options.create_background_layers,
         generate_GDEF=options.generate_GDEF,
         store_editor_state=not options.no_store_editor_state,
@@ -276,8 +348,16 @@ def glyphs2ufo(options):
         ufo_module=__import__(options.ufo_module),
         minimal=options.minimal,
         glyph_data=options.glyph_data or None,
+        designspace_only=options.designspace_only,
+        glyph_filter=glyph_filter,
+        profile=profile,
+        workers=options.workers or None,
+        anchor_cache=options.anchor_cache,
     )
 
+    if profile is not None:
+        profile.save(options.profile_report)
+
 
 def _glyphs2ufo_entry_point():
     """Provides entry point for a script to keep argparsing in main()."""
@@ -1,4 +1,3 @@
-import copy
 from dataclasses import dataclass
 from enum import IntEnum
 import logging
@@ -14,10 +13,11 @@ from fontTools.misc.bezierTools import (
     splitCubic,
 )
 from fontTools.pens.reverseContourPen import ReverseContourPen
+from fontTools.misc.loggingTools import Timer
 from fontTools.misc.roundTools import otRound
 from fontTools.misc.transform import Transform
 from ufo2ft.filters import BaseFilter
-from ufoLib2.objects import Glyph
+from ufoLib2.objects import Contour, Glyph, Point
 
 from glyphsLib.builder.constants import HINTS_LIB_KEY, SHAPE_ORDER_LIB_KEY
 
@@ -30,6 +30,9 @@ except ImportError:
 
 
 logger = logging.getLogger(__name__)
+# Same as ufo2ft's, so that the time spent per corner component is reported
+# along with the time spent per filter.
+timing_logger = logging.getLogger("ufo2ft.timer")
 
 
 class Alignment(IntEnum):
@@ -98,29 +101,24 @@ def closest_point_on_line(seg, pt):
 
 
 def closest_point_on_cubic(bez, pt, start=0.0, end=1.0, iterations=5, slices=5):
-    tick = (end - start) / slices
-    best = 0
-    best_dist = float("inf")
-    t = start
+    # Sample the curve, then sample again around the closest sample, and so on.
     best_pt = pt
-    while t < end:
-        this_pt = cubicPointAtT(*bez, t)
-        current_distance = dist(this_pt, pt)
-        if current_distance <= best_dist:
-            best_dist = current_distance
-            best = t
-            best_pt = this_pt
-        t += tick
-    if iterations < 1:
-        return best_pt
-    return closest_point_on_cubic(
-        bez,
-        pt,
-        start=max(best - tick, 0),
-        end=min(best + tick, 1),
-        iterations=iterations - 1,
-        slices=slices,
-    )
+    for _ in range(iterations + 1):
+        tick = (end - start) / slices
+        best = 0
+        best_dist = float("inf")
+        t = start
+        best_pt = pt
+        while t < end:
+            this_pt = cubicPointAtT(*bez, t)
+            current_distance = dist(this_pt, pt)
+            if current_distance <= best_dist:
+                best_dist = current_distance
+                best = t
+                best_pt = this_pt
+            t += tick
+        start, end = max(best - tick, 0), min(best + tick, 1)
+    return best_pt
 
 
 def unbounded_seg_seg_intersection(seg1, seg2):
@@ -181,6 +179,41 @@ def split_cubic_at_point(seg, point, inward=True):
         return new_cubic_2
 
 
+@dataclass(frozen=True)
+class PreparedCornerComponent:
+    """The geometry of a corner component glyph, extracted once per font."""
+
+    origin: tuple
+    left: tuple
+    right: tuple
+    # One tuple per contour, of (x, y, segmentType, smooth, name, identifier)
+    # tuples; the first contour is the corner path proper.
+    contours: tuple
+
+    @classmethod
+    def from_glyph(cls, glyph):
+        anchors = {anchor.name: (anchor.x, anchor.y) for anchor in glyph.anchors}
+        return cls(
+            origin=anchors.get("origin", (0, 0)),
+            left=anchors.get("left"),
+            right=anchors.get("right"),
+            contours=tuple(
+                tuple(
+                    (pt.x, pt.y, pt.segmentType, pt.smooth, pt.name, pt.identifier)
+                    for pt in contour
+                )
+                for contour in glyph
+            ),
+        )
+
+    def instantiate(self):
+        """Return new, modifiable contours for the corner and other paths."""
+        contours = [
+            Contour(points=[Point(*pt) for pt in contour]) for contour in self.contours
+        ]
+        return contours[0], contours[1:]
+
+
 # Using a class here is mild overkill but it allows us to store
 # the information about the component in a slightly more readable
 # manner.
@@ -468,6 +501,44 @@ class CornerComponentApplier:
 
 
 class CornerComponentsFilter(BaseFilter):
+    def set_context(self, font, glyphSet):
+        ctx = super().set_context(font, glyphSet)
+        # Corner component name -> PreparedCornerComponent, or None if missing
+        ctx.prepared_corner_components = {}
+        # Corner component name -> [number of applications, seconds]
+        ctx.corner_component_timings = {}
+        return ctx
+
+    def __call__(self, font, glyphSet=None):
+        modified = super().__call__(font, glyphSet)
+        if timing_logger.isEnabledFor(logging.DEBUG):
+            for name, (count, seconds) in sorted(
+                self.context.corner_component_timings.items()
+            ):
+                timing_logger.debug(
+                    "Took %.3fs to apply corner component %s %d time%s",
+                    seconds,
+                    name,
+                    count,
+                    "" if count == 1 else "s",
+                )
+        return modified
+
+    def _prepared_corner_component(self, name, glyph_name):
+        prepared = self.context.prepared_corner_components
+        if name not in prepared:
+            # We use font, not .glyphSet here because corner components
+            # aren't normally exported
+            if name in self.context.font:
+                prepared[name] = PreparedCornerComponent.from_glyph(
+                    self.context.font[name]
+                )
+            else:
+                prepared[name] = None
+        if prepared[name] is None:
+            logger.warning("Corner component %s in %s not found", name, glyph_name)
+        return prepared[name]
+
     def filter(self, glyph):
         if not len(glyph) or HINTS_LIB_KEY not in glyph.lib:
             return False
@@ -497,34 +568,10 @@ class CornerComponentsFilter(BaseFilter):
                     )
             path_idx = path_indices.get(shape_index, shape_index)
 
-            # We use font, not .glyphSet here because corner components
-            # aren't normally exported
-            if glyphs_cc["name"] not in self.context.font:
-                logger.warn(
-                    "Corner component %s in %s not found",
-                    glyphs_cc["name"],
-                    glyph.name,
-                )
+            prepared = self._prepared_corner_component(glyphs_cc["name"], glyph.name)
+            if prepared is None:
                 continue
-            layer = self.context.font[glyphs_cc["name"]]
-            cc_anchor_dict = {anchor.name: anchor for anchor in layer.anchors}
-            if "origin" in cc_anchor_dict:
-                cc_origin = cc_anchor_dict["origin"].x, cc_anchor_dict["origin"].y
-            else:
-                cc_origin = (0, 0)
-
-            if "left" in cc_anchor_dict:
-                cc_left = cc_anchor_dict["left"].x, cc_anchor_dict["left"].y
-            else:
-                cc_left = None
-
-            if "right" in cc_anchor_dict:
-                cc_right = cc_anchor_dict["right"].x, cc_anchor_dict["right"].y
-            else:
-                cc_right = None
-
-            corner_path = copy.deepcopy(layer[0])
-            other_paths = [copy.deepcopy(path) for path in layer[1:]]
+            corner_path, other_paths = prepared.instantiate()
 
             cc = CornerComponentApplier(
                 glyph_name=glyph.name,
@@ -535,16 +582,21 @@ class CornerComponentsFilter(BaseFilter):
                 other_paths=other_paths,
                 path_index=path_idx,
                 glyph=glyph,
-                origin=cc_origin,
-                effective_start=cc_left,
-                effective_end=cc_right,
+                origin=prepared.origin,
+                effective_start=prepared.left,
+                effective_end=prepared.right,
                 # We pass in the current starting node, because its
                 # position may change if we apply more than one corner.
                 target_node=glyph[path_idx][(node_idx + 1) % len(glyph[path_idx])],
             )
             todo_list.append(cc)
 
+        timings = self.context.corner_component_timings
         for cc in todo_list:
-            cc.apply()
+            with Timer() as t:
+                cc.apply()
+            timing = timings.setdefault(cc.corner_name, [0, 0.0])
+            timing[0] += 1
+            timing[1] += t.elapsed
 
         return True
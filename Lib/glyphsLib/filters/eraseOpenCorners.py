@@ -1,13 +1,17 @@
 import logging
 
+from fontTools.misc.arrayTools import calcBounds
 from fontTools.pens.basePen import BasePen
-from fontTools.pens.recordingPen import RecordingPen
+from fontTools.pens.pointPen import PointToSegmentPen
+from fontTools.pens.recordingPen import RecordingPen, replayRecording
 from fontTools.misc.bezierTools import (
     segmentSegmentIntersections,
     _split_segment_at_t,
 )
 from ufo2ft.filters import BaseFilter
 
+from glyphsLib.util import ProcessPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,6 +22,69 @@ def _pointIsLeftOfLine(line, aPoint):
     ) >= 0
 
 
+def _segmentSegmentIntersections(seg1, seg2):
+    # The control points of a segment enclose it, so segments whose control
+    # boxes don't overlap can't intersect.
+    xMin1, yMin1, xMax1, yMax1 = calcBounds(seg1)
+    xMin2, yMin2, xMax2, yMax2 = calcBounds(seg2)
+    if xMin1 > xMax2 or xMin2 > xMax1 or yMin1 > yMax2 or yMin2 > yMax1:
+        return []
+    return segmentSegmentIntersections(seg1, seg2)
+
+
+def _mayHaveOpenCorner(points):
+    """Tell whether a contour, given as a list of (pt, segmentType, ...) point
+    tuples, may have an open corner for EraseOpenCornersPen to erase.
+
+    Returns False only if no line segment has the points before and after it
+    both on its right side, i.e. if the pen would not even look for
+    intersections; degenerate and open contours are always considered.
+    """
+    count = len(points)
+    if count < 3 or points[0][1] == "move":
+        return True
+    for ix, (end, segmentType, *_) in enumerate(points):
+        start, startType = points[ix - 1][:2]
+        # A qcurve without off-curve points is drawn as a line too
+        if segmentType != "line" and (segmentType != "qcurve" or startType is None):
+            continue
+        before = points[ix - 2][0]
+        after = points[(ix + 1) % count][0]
+        if start == end or before == start or after == end:
+            return True
+        line = (start, end)
+        if not _pointIsLeftOfLine(line, before) and not _pointIsLeftOfLine(line, after):
+            return True
+    return False
+
+
+def eraseOpenCorners(contours):
+    """Erase the open corners of an outline given as a list of contours, each a
+    list of (pt, segmentType, smooth, name, identifier) point tuples.
+
+    Returns the recording (see `fontTools.pens.recordingPen.RecordingPen`) of
+    the new outline, or None if the outline has no open corners.
+    """
+    if not any(_mayHaveOpenCorner(points) for points in contours):
+        return None
+    outpen = RecordingPen()
+    p = EraseOpenCornersPen(outpen)
+    for points in contours:
+        pointPen = PointToSegmentPen(p)
+        pointPen.beginPath()
+        for pt, segmentType, smooth, name, identifier in points:
+            pointPen.addPoint(pt, segmentType, smooth, name, identifier=identifier)
+        pointPen.endPath()
+    return outpen.value if p.affected else None
+
+
+def _contourPoints(contour):
+    return [
+        ((pt.x, pt.y), pt.segmentType, pt.smooth, pt.name, pt.identifier)
+        for pt in contour
+    ]
+
+
 class EraseOpenCornersPen(BasePen):
     def __init__(self, outpen):
         self.segments = []
@@ -48,7 +115,8 @@ class EraseOpenCornersPen(BasePen):
 
         ix = 0
 
-        if logger.isEnabledFor(logging.DEBUG):
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
             logger.debug(
                 "Starting open corner removal, count of segments now: %i", len(segs)
             )
@@ -63,41 +131,44 @@ class EraseOpenCornersPen(BasePen):
                 ix = ix + 1
                 continue
 
-            logger.debug(
-                "Considering line segment (%i,%i)-(%i,%i)", *segs[ix][0], *segs[ix][1]
-            )
+            if debug:
+                logger.debug(
+                    "Considering line segment (%i,%i)-(%i,%i)",
+                    *segs[ix][0],
+                    *segs[ix][1],
+                )
             # Are the incoming point from the previous segment and the outgoing point
             # from the next segment both on the right side of the line?
             # (see discussion at https://github.com/googlefonts/glyphsLib/pull/663)
             pt1 = segs[ix - 1][-2]
             pt2 = segs[next_ix][1]
             if _pointIsLeftOfLine(segs[ix], pt1) or _pointIsLeftOfLine(segs[ix], pt2):
-                logger.debug(
-                    "Crossing points (%i, %i) and (%i, %i) were not on "
-                    "same side of line segment",
-                    *pt1,
-                    *pt2,
-                )
+                if debug:
+                    logger.debug(
+                        "Crossing points (%i, %i) and (%i, %i) were not on "
+                        "same side of line segment",
+                        *pt1,
+                        *pt2,
+                    )
                 ix = ix + 1
                 continue
 
-            logger.debug(
-                "Testing for intersections between %s and %s",
-                segs[ix - 1],
-                segs[next_ix],
-            )
+            if debug:
+                logger.debug(
+                    "Testing for intersections between %s and %s",
+                    segs[ix - 1],
+                    segs[next_ix],
+                )
 
             intersection = [
                 i
-                for i in segmentSegmentIntersections(segs[ix - 1], segs[next_ix])
+                for i in _segmentSegmentIntersections(segs[ix - 1], segs[next_ix])
                 if 0 <= i.t1 <= 1 and 0 <= i.t2 <= 1
             ]
             logger.debug("Intersections: %s", intersection)
             if not intersection:
-                logger.debug("No intersections")
                 ix = ix + 1
                 continue
-
             # The t values of the intersection are measured as follows:
             #  line1 is coming *towards* the open corner line, i.e. t1=0.9 is very near
             #  the open corner.
@@ -131,7 +202,7 @@ class EraseOpenCornersPen(BasePen):
                 segs[ix : ix + 1] = []
                 self.affected = True
                 # Start again!
-                if logger.isEnabledFor(logging.DEBUG):
+                if debug:
                     logger.debug(
                         "After removing seg %i, count of segments now: %i",
                         ix,
@@ -143,7 +214,7 @@ class EraseOpenCornersPen(BasePen):
             ix = ix + 1
 
         self.outpen.moveTo(segs[0][0])
-        if logger.isEnabledFor(logging.DEBUG):
+        if debug:
             logger.debug("All done, count of segments now: %i", len(segs))
             logger.debug("Segments: %s", segs)
 
@@ -162,16 +233,47 @@ class EraseOpenCornersPen(BasePen):
 
 
 class EraseOpenCornersFilter(BaseFilter):
+    """Erase the open corners of the glyphs' outlines.
+
+    With the `workers` option set to more than 1 (None means the number of
+    CPUs), the outlines of all the glyphs to filter are processed up front in
+    a pool of worker processes, which pays off for large fonts.
+    """
+
+    _kwargs = {"workers": 1}
+
+    def set_context(self, font, glyphSet):
+        ctx = super().set_context(font, glyphSet)
+        # Glyph name -> recording of the new outline or None, when the outlines
+        # have been processed in worker processes
+        ctx.erasedOutlines = None
+        workers = self.options.workers
+        if workers != 1:
+            jobs = {}
+            for name, glyph in glyphSet.items():
+                if len(glyph) and self.include(glyph):
+                    contours = [_contourPoints(contour) for contour in glyph]
+                    if any(_mayHaveOpenCorner(points) for points in contours):
+                        jobs[name] = contours
+            if len(jobs) > 1:
+                ctx.erasedOutlines = _eraseOpenCornersInPool(jobs, workers)
+        return ctx
+
     def filter(self, glyph):
         if not len(glyph):
             return False
 
-        contours = list(glyph)
-        outpen = RecordingPen()
-        p = EraseOpenCornersPen(outpen)
-        for contour in contours:
-            contour.draw(p)
-        if p.affected:
-            glyph.clearContours()
-            outpen.replay(glyph.getPen())
-        return p.affected
+        if self.context.erasedOutlines is not None:
+            recording = self.context.erasedOutlines.get(glyph.name)
+        else:
+            recording = eraseOpenCorners([_contourPoints(c) for c in glyph])
+        if recording is None:
+            return False
+        glyph.clearContours()
+        replayRecording(recording, glyph.getPen())
+        return True
+
+
+def _eraseOpenCornersInPool(jobs, workers):
+    with ProcessPool(workers) as pool:
+        return dict(zip(jobs, pool.map(eraseOpenCorners, jobs.values())))
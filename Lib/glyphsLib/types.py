@@ -51,6 +51,7 @@ class ValueType:
     and readable/writable using the glyphsLib parser/writer.
     """
 
+    __slots__ = ()
     default = None
 
     def __init__(self, value=None):
@@ -88,6 +89,7 @@ def Vector(dim):
     class Vector(ValueType):
         """Base type for number vectors (points, rects, transform matrices)."""
 
+        __slots__ = ()
         dimension = dim
         default = [0.0] * dimension
         regex = re.compile("[({]%s[})]" % ", ".join(["([-.e\\d]+)"] * dimension))
@@ -117,6 +119,13 @@ def Vector(dim):
         def __len__(self):
             return self.dimension
 
+        def __deepcopy__(self, memo):
+            clone = copy.copy(self)
+            if isinstance(self.value, list):
+                # The coordinates are numbers, they can be shared
+                clone.value = self.value.copy()
+            return clone
+
     return Vector
 
 
@@ -147,6 +156,13 @@ class Point(Vector(2)):
     def __repr__(self):
         return "<point x={} y={}>".format(self.value[0], self.value[1])
 
+    def __deepcopy__(self, memo):
+        clone = self.__class__.__new__(self.__class__)
+        value = self.value
+        clone.value = value.copy() if isinstance(value, list) else value
+        clone.rect = None if self.rect is None else copy.deepcopy(self.rect, memo)
+        return clone
+
     @property
     def x(self):
         return self.value[0]
@@ -171,6 +187,8 @@ class Point(Vector(2)):
 
 
 class Size(Point):
+    __slots__ = ()
+
     def __repr__(self):
         return "<size width={} height={}>".format(self.value[0], self.value[1])
 
@@ -200,6 +218,7 @@ class Size(Point):
 class Rect(Vector(4)):
     """Read/write a rect of two points in curly braces."""
 
+    __slots__ = ("value",)
     regex = re.compile(r"{{([-.e\d]+), ([-.e\d]+)}, {([-.e\d]+), ([-.e\d]+)}}")
 
     def __init__(self, value=None, value2=None):
@@ -240,6 +259,8 @@ class Rect(Vector(4)):
 class Transform(Vector(6)):
     """Read/write a six-element vector."""
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value=None,
@@ -296,6 +317,8 @@ def parse_datetime(src=None):
 class Datetime(ValueType):
     """Read/write a datetime.  Doesn't maintain time zone offset."""
 
+    __slots__ = ("value",)
+
     def fromString(self, src):
         return parse_datetime(src)
 
@@ -339,6 +362,8 @@ def parse_color(src=None):
 
 # FIXME: (jany) not sure this is used
 class Color(ValueType):
+    __slots__ = ("value",)
+
     def fromString(self, src):
         return parse_color(src)
 
@@ -432,6 +457,8 @@ class IndexPath(ValueType):
     of `origin` and `target`, it can be a list containing a single string.
     """
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Union[int, str, List[Union[int, str]]],
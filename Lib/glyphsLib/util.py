@@ -14,10 +14,15 @@
 
 # TODO: (jany) merge with builder/common.py
 
+import filecmp
 import logging
 import itertools
 import os
 import shutil
+import sys
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, field
 from fontTools.misc.textTools import num2binary
 
 logger = logging.getLogger(__name__)
@@ -57,6 +62,78 @@ def clean_ufo(path):
         shutil.rmtree(path)
 
 
+def update_ufo(ufo, path, normalize=False):
+    """Save a UFO over the one at path, only rewriting the files that changed.
+
+    The UFO is written to a temporary directory next to path, and normalized
+    with ufonormalizer if normalize is True. Then the files that differ from
+    those at path are moved into place and the stale ones are deleted. The
+    files that have the same content, and the directories that are still
+    used, are left untouched.
+
+    ufoLib2 UFOs are written without changing their path. Other UFOs, e.g.
+    defcon's, are saved to the temporary directory, then given path as their
+    path once the files are in place.
+    """
+    path = os.path.normpath(path)
+    write = getattr(ufo, "write", None)
+    temp_dir = tempfile.mkdtemp(
+        prefix=".glyphsLib-", dir=os.path.dirname(os.path.abspath(path))
+    )
+    try:
+        temp_path = os.path.join(temp_dir, os.path.basename(path))
+        if write is not None:  # ufoLib2
+            from fontTools.ufoLib import UFOWriter
+
+            with UFOWriter(temp_path) as writer:
+                write(writer)
+        else:
+            ufo.save(temp_path)
+        if normalize:
+            import ufonormalizer
+
+            ufonormalizer.normalizeUFO(temp_path, writeModTimes=False)
+        _update_tree(temp_path, path)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    if write is None:
+        ufo.path = path
+
+
+def _update_tree(source, target):
+    """Move the files of the source directory to the target one, except those
+    already there with the same content, and delete the target files that are
+    not in the source."""
+    if not os.path.isdir(target):
+        if os.path.lexists(target):
+            os.remove(target)
+        os.replace(source, target)
+        return
+    names = set(os.listdir(source))
+    # Delete first, the new files may only differ by case on some systems
+    for name in os.listdir(target):
+        if name not in names:
+            _remove_path(os.path.join(target, name))
+    for name in names:
+        source_path = os.path.join(source, name)
+        target_path = os.path.join(target, name)
+        if os.path.isdir(source_path):
+            _update_tree(source_path, target_path)
+        elif not (
+            os.path.isfile(target_path)
+            and filecmp.cmp(source_path, target_path, shallow=False)
+        ):
+            _remove_path(target_path)
+            os.replace(source_path, target_path)
+
+
+def _remove_path(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
 def ufo_create_background_layer_for_all_glyphs(ufo_font):
     """Create a background layer for all glyphs in ufo_font if not present to
     reduce roundtrip differences."""
@@ -178,5 +255,230 @@ class PeekableIterator:
         return self.list[self.index + n]
 
 
+class ProcessPool:
+    """A pool of worker processes, for the steps of a build that can run
+    concurrently. Use it as a context manager, which waits for the running
+    tasks and shuts the processes down on exit.
+
+    Args:
+        workers: Number of processes (None: the number of CPUs).
+        initializer: Optional callable run in each process with initargs before
+            its first task. The tasks get its result with `worker_state()`,
+            e.g. the font data shared by all the tasks, so that it is only sent
+            to each process once.
+        mp_context: Optional multiprocessing context used to start the
+            processes, e.g. `multiprocessing.get_context("forkserver")`.
+    """
+
+    def __init__(self, workers=None, initializer=None, initargs=(), mp_context=None):
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.workers = workers or os.cpu_count() or 1
+        if initializer is not None:
+            initargs = (initializer, initargs)
+            initializer = _init_worker
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp_context,
+            initializer=initializer,
+            initargs=initargs,
+        )
+
+    def chunksize(self, count):
+        """Return the number of tasks to send to a process at once, out of
+        count: about 4 batches per process balance the load without making
+        the exchanges with the processes dominate."""
+        return max(1, count // (self.workers * 4))
+
+    def map(self, func, items, chunksize=None):
+        """Return the list of func(item) for the items, run in the processes.
+
+        The first error raised by a task is raised here, the other tasks keep
+        running until the pool is shut down.
+        """
+        items = list(items)
+        if chunksize is None:
+            chunksize = self.chunksize(len(items))
+        return list(self._executor.map(func, items, chunksize=chunksize))
+
+    def shutdown(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+
+# The result of the initializer of a ProcessPool, in its worker processes
+_worker_state = None
+
+
+def _init_worker(initializer, initargs):
+    global _worker_state
+    _worker_state = initializer(*initargs)
+
+
+def worker_state():
+    """Return the result of the initializer of the ProcessPool running the
+    current task."""
+    return _worker_state
+
+
+@dataclass
+class MemoryReport:
+    """The memory retained by a font, as returned by `memory_report`.
+
+    Sizes are in bytes. `by_class` maps the names of the classes of the font
+    objects (GSLayer, GSNode, Point...) to the number of instances and the size
+    of these objects along with the plain data (lists, dicts, strings, numbers)
+    they hold; user data dictionaries are accounted for under "userData"
+    instead. `by_glyph` maps glyph names to the size of the glyphs, with all
+    their layers.
+    """
+
+    total: int = 0
+    by_class: dict = field(default_factory=dict)
+    by_glyph: dict = field(default_factory=dict)
+
+    def largest_glyphs(self, n=10):
+        """Return the n largest glyphs, as (name, size) tuples."""
+        return sorted(self.by_glyph.items(), key=lambda item: -item[1])[:n]
+
+    def as_dict(self):
+        return {
+            "total": self.total,
+            "byClass": {
+                name: {"count": count, "size": size}
+                for name, (count, size) in self.by_class.items()
+            },
+            "byGlyph": dict(self.by_glyph),
+        }
+
+    def __str__(self):
+        lines = ["Total: %d KiB" % (self.total // 1024)]
+        for name, (count, size) in sorted(
+            self.by_class.items(), key=lambda item: -item[1][1]
+        ):
+            lines.append("%-24s %10d %10d KiB" % (name, count, size // 1024))
+        return "\n".join(lines)
+
+
+# Packages whose objects are walked into by memory_report, other objects are
+# only counted for their own size.
+_MEMORY_REPORT_PACKAGES = ("glyphsLib.", "ufoLib2.", "fontTools.designspaceLib")
+_USER_DATA_ATTRIBUTES = frozenset(("_userData", "userData"))
+_LEAF_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def memory_report(obj):
+    """Walk the object graph of a GSFont and report the memory it retains, by
+    class and by glyph (see `MemoryReport`).
+
+    Also works on UFOs and designspace documents built by the ufoLib2 and
+    fontTools.designspaceLib modules, and on lists of these. Objects shared by
+    several owners are only counted once, for the first owner found.
+    """
+    from glyphsLib.classes import _instance_dict as instance_dict
+
+    # Class -> None for the objects that are only counted for their own size,
+    # "items" or "dict" for the containers, or (slot names, skipped attributes,
+    # whether it is a glyph) for the font objects.
+    kinds = {list: "items", tuple: "items", set: "items", frozenset: "items"}
+    report = MemoryReport()
+    counts = Counter()
+    sizes = Counter()
+    glyph_sizes = Counter()
+    getsizeof = sys.getsizeof
+    seen = set()
+    stack = [(obj, None, None)]
+    while stack:
+        obj, category, glyph_name = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        cls = type(obj)
+        size = getsizeof(obj)
+        if cls in kinds:
+            kind = kinds[cls]
+        else:
+            kind = kinds[cls] = _memory_report_kind(cls)
+        if kind is None:
+            children = ()
+        elif kind == "items":
+            children = obj
+        elif kind == "dict":
+            children = itertools.chain(obj.keys(), obj.values())
+        else:
+            slot_names, skip, is_glyph = kind
+            category = cls.__name__
+            counts[category] += 1
+            if is_glyph:
+                glyph_name = obj.name
+            children = []
+            state = instance_dict(obj)
+            if state is not None:
+                size += getsizeof(state)
+            for name, value in _attribute_items(obj, state, slot_names):
+                if name in _USER_DATA_ATTRIBUTES:
+                    stack.append((value, "userData", glyph_name))
+                elif name not in skip:
+                    children.append(value)
+        for child in children:
+            # Plain values are accounted for with their owner right away,
+            # which is much faster than going through the stack.
+            if type(child) in _LEAF_TYPES:
+                if id(child) not in seen:
+                    seen.add(id(child))
+                    size += getsizeof(child)
+            else:
+                stack.append((child, category, glyph_name))
+
+        report.total += size
+        if category is not None:
+            sizes[category] += size
+        if glyph_name is not None:
+            glyph_sizes[glyph_name] += size
+
+    report.by_class = {name: (counts[name], size) for name, size in sizes.items()}
+    report.by_glyph = dict(glyph_sizes)
+    return report
+
+
+def _memory_report_kind(cls):
+    from glyphsLib.classes import (
+        _CACHE_ATTRIBUTES,
+        _OWNER_ATTRIBUTES,
+        GSGlyph,
+        Proxy,
+        _slot_names,
+    )
+
+    if issubclass(cls, dict):
+        return "dict"
+    if not cls.__module__.startswith(_MEMORY_REPORT_PACKAGES) or issubclass(
+        cls, (type, Proxy)
+    ):
+        return None
+    skip = (
+        _OWNER_ATTRIBUTES | _CACHE_ATTRIBUTES
+        if cls.__module__.startswith("glyphsLib.")
+        else ()
+    )
+    is_glyph = issubclass(cls, GSGlyph) or (
+        cls.__module__.startswith("ufoLib2.") and cls.__name__ == "Glyph"
+    )
+    return _slot_names(cls), skip, is_glyph
+
+
+def _attribute_items(obj, state, slot_names):
+    items = list(state.items()) if state is not None else []
+    for name in slot_names:
+        if hasattr(obj, name):
+            items.append((name, getattr(obj, name)))
+    return items
+
+
 # sentinel object to indicate a deprecated argument
 _DeprecatedArgument = object()
@@ -0,0 +1,216 @@
+# Copyright 2026 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time glyphsLib on a synthetic font, and measure its memory peaks.
+
+Run from the root of the repository, e.g.:
+
+    python -m tests.benchmarks --glyphs 5000 --masters 6 --memory
+    python -m tests.benchmarks to_designspace to_glyphs --json results.json
+
+Each benchmark is run --repeat times on a fresh input, of which only the
+benchmarked call is timed; the minimum and median times are reported. With
+--memory, each benchmark is run once more under tracemalloc to measure the
+peak of memory allocated by the call.
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import tracemalloc
+from time import perf_counter
+
+import glyphsLib
+from glyphsLib.builder.transformations.propagate_anchors import (
+    AnchorPropagationCache,
+    propagate_all_anchors,
+)
+from glyphsLib.builder.variable_features import VariableFeatureConverter
+
+from .synthetic import (
+    add_ufo_kerning,
+    make_cjk_ufo,
+    make_font,
+    make_variable_features,
+)
+
+# The number of kerning pairs of all the masters in kerning_import
+KERNING_IMPORT_PAIRS = 1_000_000
+
+
+def _load(text):
+    font = glyphsLib.loads(text)
+    # The first serialization adds empty backgrounds, do it beforehand
+    glyphsLib.dumps(font)
+    return font
+
+
+def _variable_features(text):
+    # As many variable rules as glyphs
+    font = glyphsLib.loads(text)
+    return font, make_variable_features(font, rules=len(font.glyphs))
+
+
+def _warm_anchor_cache(text):
+    # Propagate once on another copy, so that no glyph needs recomputing
+    cache = AnchorPropagationCache()
+    propagate_all_anchors(_load(text), cache=cache)
+    return _load(text), cache
+
+
+def _kerned_designspace(text):
+    designspace = glyphsLib.to_designspace(glyphsLib.loads(text), minimal=True)
+    ufos = {id(source.font): source.font for source in designspace.sources}
+    add_ufo_kerning(list(ufos.values()), KERNING_IMPORT_PAIRS)
+    return designspace
+
+
+def _cjk_ufo(text):
+    # As many ideographs as the synthetic font has glyphs
+    return make_cjk_ufo(glyphs=len(glyphsLib.loads(text).glyphs))
+
+
+def _cjk_roundtrip(ufo):
+    glyphsLib.to_ufos(glyphsLib.to_glyphs([ufo]), minimal=True)
+
+
+def _erase_open_corners(ufos):
+    from glyphsLib.filters.eraseOpenCorners import EraseOpenCornersFilter
+
+    for ufo in ufos:
+        EraseOpenCornersFilter()(ufo)
+
+
+# Name -> (setup, benchmarked function). The setup takes the serialized
+# synthetic font and returns the argument of the benchmarked function.
+BENCHMARKS = {
+    "loads": (lambda text: text, glyphsLib.loads),
+    "dumps": (_load, glyphsLib.dumps),
+    "to_designspace": (_load, glyphsLib.to_designspace),
+    "to_designspace_minimal": (
+        _load,
+        lambda font: glyphsLib.to_designspace(font, minimal=True),
+    ),
+    "to_glyphs": (
+        lambda text: glyphsLib.to_designspace(glyphsLib.loads(text)),
+        glyphsLib.to_glyphs,
+    ),
+    "kerning_import": (_kerned_designspace, glyphsLib.to_glyphs),
+    "cjk_roundtrip": (_cjk_ufo, _cjk_roundtrip),
+    "propagate_all_anchors": (_load, propagate_all_anchors),
+    "propagate_anchors_workers": (
+        _load,
+        lambda font: propagate_all_anchors(font, workers=None),
+    ),
+    "propagate_anchors_cached": (
+        _warm_anchor_cache,
+        lambda args: propagate_all_anchors(args[0], cache=args[1]),
+    ),
+    "variable_features": (
+        _variable_features,
+        lambda args: VariableFeatureConverter(args[0]).convert(args[1]),
+    ),
+    "erase_open_corners": (
+        lambda text: glyphsLib.to_ufos(glyphsLib.loads(text), minimal=True),
+        _erase_open_corners,
+    ),
+}
+
+
+def run_benchmark(name, text, repeat=3, memory=False):
+    setup, function = BENCHMARKS[name]
+    times = []
+    for _ in range(repeat):
+        arg = setup(text)
+        start = perf_counter()
+        function(arg)
+        times.append(perf_counter() - start)
+    result = {"min": min(times), "median": statistics.median(times)}
+    if memory:
+        arg = setup(text)
+        tracemalloc.start()
+        try:
+            function(arg)
+            result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        metavar="BENCHMARK",
+        help="Benchmarks to run, among: %s (default: all)" % ", ".join(BENCHMARKS),
+    )
+    parser.add_argument("--glyphs", type=int, default=1000)
+    parser.add_argument("--masters", type=int, default=3)
+    parser.add_argument("--components", type=float, default=0.3)
+    parser.add_argument("--brace-layers", type=float, default=0.05)
+    parser.add_argument("--bracket-layers", type=float, default=0.02)
+    parser.add_argument("--kerning-density", type=float, default=0.001)
+    parser.add_argument("--feature-rules", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument(
+        "--memory", action="store_true", help="Also measure the memory peaks."
+    )
+    parser.add_argument("--json", metavar="PATH", help="Write the results to PATH.")
+    options = parser.parse_args(args)
+    unknown = set(options.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error("unknown benchmarks: %s" % ", ".join(sorted(unknown)))
+
+    parameters = {
+        "glyphs": options.glyphs,
+        "masters": options.masters,
+        "components": options.components,
+        "brace_layers": options.brace_layers,
+        "bracket_layers": options.bracket_layers,
+        "kerning_density": options.kerning_density,
+        "feature_rules": options.feature_rules,
+        "seed": options.seed,
+    }
+    text = glyphsLib.dumps(make_font(**parameters))
+
+    results = {}
+    for name in options.benchmarks or BENCHMARKS:
+        result = results[name] = run_benchmark(
+            name, text, options.repeat, options.memory
+        )
+        line = "%-24s min %8.3fs  median %8.3fs" % (
+            name,
+            result["min"],
+            result["median"],
+        )
+        if "peak_memory" in result:
+            line += "  peak %8.1f MiB" % (result["peak_memory"] / (1 << 20))
+        print(line, flush=True)
+
+    if options.json:
+        with open(options.json, "w", encoding="utf-8") as fp:
+            json.dump({"parameters": parameters, "results": results}, fp, indent=2)
+            fp.write("\n")
+
+
+if __name__ == "__main__":
+    # The synthetic fonts make the builder warn, e.g. about kerning classes
+    logging.getLogger("glyphsLib").setLevel(logging.ERROR)
+    sys.exit(main())
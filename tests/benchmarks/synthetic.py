@@ -0,0 +1,299 @@
+# Copyright 2026 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generate large synthetic GSFonts for benchmarking.
+
+The fonts are grown from the outlines, anchors and font-level data of
+GlyphsUnitTestSans.glyphs, so that they go through the same code paths as
+real sources: composite glyphs made of a base and a mark with anchors to
+propagate, intermediate ("brace") and alternate ("bracket") layers, class and
+glyph kerning, and feature code. The result only depends on the parameters.
+"""
+
+import copy
+import itertools
+import os
+import random
+
+import ufoLib2
+
+import glyphsLib
+from glyphsLib.classes import GSClass, GSComponent, GSFeature, GSGlyph
+
+SEED_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "GlyphsUnitTestSans.glyphs"
+)
+
+# Seed glyphs copied as outline glyphs, and as marks for the composites
+BASE_GLYPHS = ("A", "I", "a", "a.sc")
+MARK_GLYPH = "dieresis"
+# Weight range of the generated masters, the one of the seed masters
+MIN_WEIGHT = 17
+MAX_WEIGHT = 220
+
+
+def make_font(
+    glyphs=1000,
+    masters=3,
+    components=0.3,
+    brace_layers=0.05,
+    bracket_layers=0.02,
+    kerning_density=0.001,
+    feature_rules=100,
+    seed=0,
+):
+    """Return a GSFont with the given number of glyphs and masters.
+
+    Args:
+        glyphs: the number of glyphs, about a tenth of which are marks.
+        masters: the number of masters, spread along the weight axis.
+        components: the proportion of composite glyphs, made of a base glyph
+            and a mark.
+        brace_layers: the proportion of outline glyphs with an intermediate
+            layer between the first two masters.
+        bracket_layers: the proportion of outline glyphs with an alternate
+            layer in each master.
+        kerning_density: the proportion of all the possible glyph pairs that
+            are kerned in each master; a tenth as many class pairs are kerned.
+        feature_rules: the number of substitution rules in the feature code.
+        seed: the seed of the random choices.
+    """
+    if masters < 2 and brace_layers:
+        raise ValueError("Brace layers need at least two masters")
+    rng = random.Random(seed)
+    font = glyphsLib.GSFont(SEED_PATH)
+    seed_glyphs = {glyph.name: glyph for glyph in font.glyphs}
+    seed_masters = list(font.masters)
+
+    # Each generated master takes its outlines from the closest seed master
+    master_sources = []
+    new_masters = []
+    for index in range(masters):
+        weight = MIN_WEIGHT + (MAX_WEIGHT - MIN_WEIGHT) * index // max(masters - 1, 1)
+        source = min(seed_masters, key=lambda m: abs(m.axes[0] - weight))
+        master = copy.deepcopy(source)
+        master.id = f"master-{index:03d}"
+        master.axes = [weight, source.axes[1]]
+        master.name = f"Weight{weight}"
+        new_masters.append(master)
+        master_sources.append(source.id)
+    font.masters = new_masters
+    font.instances = []
+    # The seed features and kerning refer to the seed glyphs and masters
+    font.features = []
+    font.featurePrefixes = []
+    font.classes = []
+    font.kerning = {}
+
+    mark_count = max(glyphs // 10, 1)
+    composite_count = int((glyphs - mark_count) * components)
+    base_count = max(glyphs - mark_count - composite_count, 1)
+
+    font.glyphs = []
+    bases = [
+        _copy_glyph(
+            font, seed_glyphs[BASE_GLYPHS[i % len(BASE_GLYPHS)]], i, master_sources
+        )
+        for i in range(base_count)
+    ]
+    marks = [
+        _copy_glyph(font, seed_glyphs[MARK_GLYPH], i, master_sources)
+        for i in range(mark_count)
+    ]
+    composites = []
+    for index in range(composite_count):
+        base = rng.choice(bases)
+        mark = rng.choice(marks)
+        glyph = GSGlyph(f"{base.name}_{mark.name}.c{index}")
+        font.glyphs.append(glyph)
+        for master in font.masters:
+            layer = glyphsLib.GSLayer()
+            layer.layerId = layer.associatedMasterId = master.id
+            layer.width = base.layers[master.id].width
+            layer.components.append(GSComponent(base.name))
+            layer.components.append(GSComponent(mark.name))
+            glyph.layers.append(layer)
+        composites.append(glyph)
+
+    for glyph in rng.sample(bases, int(len(bases) * brace_layers)):
+        _add_brace_layer(glyph, font.masters[0], font.masters[1])
+    for glyph in rng.sample(bases, int(len(bases) * bracket_layers)):
+        for master in font.masters:
+            layer = copy.deepcopy(glyph.layers[master.id])
+            layer.layerId = f"{master.id}-bracket"
+            layer.associatedMasterId = master.id
+            layer.name = f"{master.name} [{(MIN_WEIGHT + MAX_WEIGHT) // 2}]"
+            glyph.layers.append(layer)
+
+    _add_kerning(font, rng, bases + composites, kerning_density)
+    _add_features(font, rng, bases + composites, feature_rules)
+    return font
+
+
+def _copy_glyph(font, seed_glyph, index, master_sources):
+    glyph = GSGlyph(f"{seed_glyph.name}.g{index}")
+    glyph.leftKerningGroup = seed_glyph.name
+    glyph.rightKerningGroup = seed_glyph.name
+    font.glyphs.append(glyph)
+    for master, source_id in zip(font.masters, master_sources):
+        layer = copy.deepcopy(seed_glyph.layers[source_id])
+        layer.layerId = layer.associatedMasterId = master.id
+        glyph.layers.append(layer)
+    return glyph
+
+
+def _add_brace_layer(glyph, master1, master2):
+    layer = copy.deepcopy(glyph.layers[master1.id])
+    weight = (master1.axes[0] + master2.axes[0]) // 2
+    layer.layerId = f"{glyph.name}-brace"
+    layer.associatedMasterId = master1.id
+    # The width axis doesn't vary, so it is not in the designspace
+    layer.name = f"{{{weight}}}"
+    glyph.layers.append(layer)
+
+
+def _add_kerning(font, rng, glyphs, density):
+    names = [glyph.name for glyph in glyphs]
+    pair_count = int(len(names) ** 2 * density)
+    groups = sorted({glyph.leftKerningGroup for glyph in glyphs} - {None})
+    for master in font.masters:
+        kerning = {}
+        for _ in range(pair_count):
+            left, right = rng.choice(names), rng.choice(names)
+            kerning.setdefault(left, {})[right] = rng.randrange(-100, 100, 5)
+        for _ in range(pair_count // 10):
+            left = "@MMK_L_" + rng.choice(groups)
+            right = "@MMK_R_" + rng.choice(groups)
+            kerning.setdefault(left, {})[right] = rng.randrange(-100, 100, 5)
+        font.kerning[master.id] = kerning
+
+
+def _add_features(font, rng, glyphs, rule_count):
+    names = [glyph.name for glyph in glyphs]
+    font.classes.append(GSClass("Synthetic", " ".join(names[::7])))
+    rules = [
+        f"sub {rng.choice(names)} by {rng.choice(names)};" for _ in range(rule_count)
+    ]
+    rules.append("sub @Synthetic by @Synthetic;")
+    font.features.append(GSFeature("ss01", "\n".join(rules)))
+
+
+def add_ufo_kerning(ufos, pairs=1_000_000, seed=0):
+    """Replace the kerning of the master UFOs of a font made by `make_font` with
+    the given number of pairs in all (at most as many as there are glyph and
+    group pairs), a tenth of which are between kerning groups.
+    """
+    rng = random.Random(seed)
+    pair_count = pairs // len(ufos)
+    for ufo in ufos:
+        names = sorted(ufo.keys())
+        first_groups = sorted(g for g in ufo.groups if g.startswith("public.kern1."))
+        second_groups = sorted(g for g in ufo.groups if g.startswith("public.kern2."))
+        kerning = dict.fromkeys(
+            itertools.islice(
+                itertools.product(first_groups, second_groups), pair_count // 10
+            )
+        )
+        kerning.update(
+            dict.fromkeys(
+                itertools.islice(
+                    itertools.product(names, names), pair_count - len(kerning)
+                )
+            )
+        )
+        ufo.kerning.clear()
+        ufo.kerning.update((pair, rng.randrange(-100, 100, 5)) for pair in kerning)
+
+
+def make_cjk_ufo(glyphs=1000, strokes=16, seed=0):
+    """Return a UFO with the given number of ideographs, each drawn with the
+    given number of closed strokes made of lines and curves, like the large
+    outline-only UFOs of CJK fonts.
+    """
+    rng = random.Random(seed)
+    ufo = ufoLib2.Font()
+    ufo.info.familyName = "Synthetic CJK"
+    ufo.info.unitsPerEm = 1000
+    ufo.info.ascender = 880
+    ufo.info.descender = -120
+    for index in range(glyphs):
+        code = 0x4E00 + index
+        glyph = ufo.newGlyph(f"uni{code:04X}")
+        glyph.unicodes = [code]
+        glyph.width = 1000
+        pen = glyph.getPen()
+        for _ in range(strokes):
+            x, y = rng.randrange(50, 800, 2), rng.randrange(-100, 700, 2)
+            w, h = rng.randrange(30, 200, 2), rng.randrange(30, 200, 2)
+            pen.moveTo((x, y))
+            pen.lineTo((x + w, y))
+            pen.curveTo((x + w + 20, y + h // 3), (x + w + 20, y + h), (x + w, y + h))
+            pen.lineTo((x, y + h))
+            pen.curveTo((x - 10, y + h // 2), (x - 10, y + h // 3), (x, y + 10))
+            pen.closePath()
+    return ufo
+
+
+def make_variable_features(font, rules=1000, seed=0):
+    """Return feature code using the Glyphs variable feature syntax, for the
+    glyphs and weight axis of a font made by `make_font`.
+
+    The code has about the given number of rules, spread over mark and kerning
+    features with variable anchors, value records and scalars, "#ifdef" and
+    "#ifndef VARIABLE" blocks, and substitution features with conditions.
+    """
+    rng = random.Random(seed)
+    names = [glyph.name for glyph in font.glyphs]
+    middle = (MIN_WEIGHT + MAX_WEIGHT) // 2
+
+    def anchor():
+        x, y = rng.randrange(0, 500, 10), rng.randrange(0, 700, 10)
+        return f"<anchor {x} {y} (wght:{MAX_WEIGHT}) {x + 20} {y + 10}>"
+
+    mark, kern, rvrn = [], [], []
+    for index in range(rules):
+        first, second = rng.choice(names), rng.choice(names)
+        kind = index % 10
+        if kind < 4:
+            mark.append(f"pos base {first} {anchor()} mark @Marks; # {second}")
+        elif kind < 6:
+            value = rng.randrange(-100, 0, 5)
+            kern.append(f"pos {first} {second} {value} (wght:{MAX_WEIGHT}) {value*2};")
+        elif kind < 7:
+            kern.append(
+                f"pos {first} {second} <0 0 {rng.randrange(-50, 0, 5)} 0 "
+                f"(wght:{MAX_WEIGHT}) 0 0 {rng.randrange(-100, 0, 5)} 0>;"
+            )
+        elif kind < 8:
+            kern.append(
+                f"#ifdef VARIABLE\npos {first} {second} -5 (wght:{MAX_WEIGHT}) -9;"
+                f"\n#endif\n#ifndef VARIABLE\npos {first} {second} -7;\n#endif"
+            )
+        else:
+            bound = rng.randrange(MIN_WEIGHT + 1, MAX_WEIGHT)
+            rvrn.append(
+                f"condition {bound} < wght;\nsub {first} by {second};"
+                if kind == 8
+                else f'condition wght < {middle};\nsub {first} by {second}; # "x"'
+            )
+    return "\n\n".join(
+        [
+            f"@Marks = [{' '.join(names[:: max(len(names) // 20, 1)])}];",
+            "markClass @Marks <anchor 0 0> @Top;",
+            "feature mark {\n" + "\n".join(mark) + "\n} mark;",
+            "feature kern {\n" + "\n".join(kern) + "\n} kern;",
+            "feature rvrn {\n" + "\n".join(rvrn) + "\n} rvrn;",
+            "feature liga {\nsub f i by f_i;\n} liga;",
+        ]
+    )
@@ -0,0 +1,69 @@
+import json
+
+import glyphsLib
+
+from .synthetic import add_ufo_kerning, make_cjk_ufo, make_font
+from .__main__ import main
+
+
+def test_make_font():
+    font = make_font(glyphs=100, masters=4, brace_layers=0.1, bracket_layers=0.1)
+
+    assert len(font.glyphs) == 100
+    assert len(font.masters) == 4
+    assert set(font.kerning) == {master.id for master in font.masters}
+    assert any(layer.components for glyph in font.glyphs for layer in glyph.layers)
+
+    designspace = glyphsLib.to_designspace(font)
+    assert len(designspace.axes) == 1
+    # The masters and a brace layer source
+    assert len(designspace.sources) == 5
+    assert len(designspace.rules) == 1
+    assert len(glyphsLib.to_glyphs(designspace).glyphs) == 100
+
+
+def test_add_ufo_kerning():
+    font = make_font(glyphs=100, masters=2, brace_layers=0, bracket_layers=0)
+    designspace = glyphsLib.to_designspace(font)
+    ufos = [source.font for source in designspace.sources]
+
+    add_ufo_kerning(ufos, pairs=2000)
+
+    for ufo in ufos:
+        assert len(ufo.kerning) == 1000
+        # As many group pairs as there are, up to a tenth of the pairs
+        assert sum(left.startswith("public.kern1.") for left, _ in ufo.kerning) == 25
+    font = glyphsLib.to_glyphs(designspace)
+    for master in font.masters:
+        kerning = font.kerningLTR[master.id]
+        assert sum(len(pairs) for pairs in kerning.values()) == 1000
+
+
+def test_make_cjk_ufo():
+    ufo = make_cjk_ufo(glyphs=10, strokes=3)
+
+    assert len(ufo) == 10
+    assert ufo["uni4E00"].unicodes == [0x4E00]
+    assert [len(contour) for contour in ufo["uni4E00"]] == [9, 9, 9]
+    font = glyphsLib.to_glyphs([ufo])
+    (ufo2,) = glyphsLib.to_ufos(font, minimal=True)
+    for glyph in ufo:
+        assert [[(p.x, p.y, p.segmentType) for p in c] for c in glyph] == [
+            [(p.x, p.y, p.segmentType) for p in c] for c in ufo2[glyph.name]
+        ]
+
+
+def test_make_font_is_reproducible():
+    assert glyphsLib.dumps(make_font(glyphs=50)) == glyphsLib.dumps(
+        make_font(glyphs=50)
+    )
+
+
+def test_main(tmp_path, capsys):
+    path = tmp_path / "results.json"
+    main(["loads", "to_designspace", "--glyphs", "20", "-r", "1", "--json", str(path)])
+
+    assert capsys.readouterr().out.startswith("loads ")
+    results = json.loads(path.read_text())
+    assert results["parameters"]["glyphs"] == 20
+    assert set(results["results"]) == {"loads", "to_designspace"}
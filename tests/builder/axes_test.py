@@ -20,8 +20,14 @@ import pytest
 
 from fontTools import designspaceLib
 from glyphsLib import to_glyphs, to_designspace, to_ufos
-from glyphsLib.classes import GSFont, GSFontMaster, GSAxis, GSInstance
-from glyphsLib.builder.axes import _is_subset_of_default_axes, get_regular_master
+from glyphsLib.classes import GSFont, GSFontMaster, GSAxis, GSInstance, InstanceType
+from glyphsLib.builder.axes import (
+    AxisLocationCache,
+    _is_subset_of_default_axes,
+    get_axis_definitions,
+    get_regular_master,
+    update_mapping_from_instances,
+)
 from glyphsLib.builder.stat import is_stat_only_ital
 
 """
@@ -777,3 +783,61 @@ def test_hidden_axis(ufo_module):
 
     font = to_glyphs(doc)
     assert font.customParameters["Axes"] == axes
+
+
+def test_axis_location_cache():
+    font = GSFont(os.path.join("tests", "data", "GlyphsUnitTestSans.glyphs"))
+    cache = AxisLocationCache(font)
+    axis_defs = cache.axis_definitions()
+    assert axis_defs is cache.axis_definitions()
+    assert [a.tag for a in axis_defs] == [a.tag for a in get_axis_definitions(font)]
+
+    weight = axis_defs[0]
+    master = font.masters[0]
+    instance = font.instances[0]
+    assert cache.design_loc(weight, master) == weight.get_design_loc(master)
+    assert cache.user_loc(weight, instance) == weight.get_user_loc(instance)
+    # The locations are only computed once
+    instance.customParameters["weightClass"] = 900
+    master.axes[0] = 123
+    assert cache.user_loc(weight, instance) != weight.get_user_loc(instance)
+    assert cache.design_loc(weight, master) != 123
+
+    # Until the axes change
+    font.customParameters["Axes"] = [
+        {"Tag": "wght", "Name": "Weight"},
+        {"Tag": "opsz", "Name": "Optical Size"},
+    ]
+    axis_defs = cache.axis_definitions()
+    assert [a.name for a in axis_defs] == ["Weight", "Optical Size"]
+    assert cache.user_loc(axis_defs[0], instance) == 900
+    assert cache.design_loc(axis_defs[0], master) == 123
+
+
+def test_instance_locations():
+    font = GSFont(os.path.join("tests", "data", "GlyphsUnitTestSans3.glyphs"))
+    variable = GSInstance()
+    variable.type = InstanceType.VARIABLE
+    font.instances.append(variable)
+    font.instances[1].exports = False
+    cache = AxisLocationCache(font)
+    locations = cache.instance_locations()
+    assert locations is cache.instance_locations()
+    assert locations.instances == list(font.instances)[:-1]
+    assert locations.active == [True, False] + [True] * (len(font.instances) - 3)
+
+    weight = cache.axis_definitions()[0]
+    instance = font.instances[2]
+    row = locations.row(instance)
+    assert locations.design_column(weight)[row] == weight.get_design_loc(instance)
+    assert locations.user_column(weight)[row] == weight.get_user_loc(instance)
+    assert locations.axis_location_column(weight)[
+        row
+    ] == weight.get_user_loc_from_axis_location_cp(instance)
+
+    mapping = {}
+    update_mapping_from_instances(mapping, locations, weight, False)
+    expected = {}
+    update_mapping_from_instances(expected, font.instances, weight, False)
+    assert mapping == expected
+    assert len(mapping) == len(font.instances) - 2
@@ -42,6 +42,7 @@ from glyphsLib.types import Point
 
 from glyphsLib.builder import to_glyphs, to_designspace, to_ufos
 from glyphsLib.builder.builders import UFOBuilder, GlyphsBuilder
+from glyphsLib.builder.kerning import kerning_sparsity
 from glyphsLib.builder.paths import to_ufo_paths
 from glyphsLib.builder.constants import (
     COMPONENT_INFO_KEY,
@@ -125,6 +126,46 @@ def test_load_kerning(ufo_module):
     assert ufo.kerning["a", "public.kern2.V"] == 100
 
 
+def test_compact_kerning(ufo_module):
+    font = generate_minimal_font()
+    bold = GSFontMaster()
+    bold.id = "bold"
+    font.masters.append(bold)
+    for glyph_name in ("A", "V", "v"):
+        glyph = add_glyph(font, glyph_name)
+        glyph.rightKerningGroup = glyph_name.upper()
+        glyph.leftKerningGroup = glyph_name.upper()
+    font.kerning = {
+        "id": {"@MMK_L_A": {"@MMK_R_V": -250, "v": -100}, "V": {"A": -30}},
+        "bold": {"@MMK_L_A": {"@MMK_R_V": -250, "v": -120}},
+    }
+
+    sparsity = kerning_sparsity(font)
+    assert sparsity.masters == 2
+    assert sparsity.pairs == 3
+    assert sparsity.shared_pairs == 1
+    assert sparsity.master_pairs == {"id": 3, "bold": 2}
+    assert sparsity.shared_ratio == pytest.approx(2 / 5)
+
+    builder = UFOBuilder(font, ufo_module=ufo_module, compact_kerning=True)
+    regular, bold = builder.masters
+    assert builder.kerning_sparsity == sparsity
+    assert dict(regular.kerning) == {
+        ("public.kern1.A", "public.kern2.V"): -250,
+        ("public.kern1.A", "v"): -100,
+        ("V", "A"): -30,
+    }
+    assert dict(bold.kerning) == {
+        ("public.kern1.A", "public.kern2.V"): -250,
+        ("public.kern1.A", "v"): -120,
+    }
+    # The shared pair is stored once and referenced by both masters
+    regular_keys = {k: k for k in regular.kerning.keys()}
+    bold_keys = {k: k for k in bold.kerning.keys()}
+    shared_key = ("public.kern1.A", "public.kern2.V")
+    assert regular_keys[shared_key] is bold_keys[shared_key]
+
+
 def test_propagate_anchors_on(ufo_module):
     """Test anchor propagation for some relatively complicated cases."""
 
@@ -2835,6 +2876,48 @@ def test_to_ufo_draw_paths_qcurve(ufo_module):
     assert first_segment_type == "qcurve"
 
 
+def test_to_ufo_draw_paths_into_ufo_glyph(ufo_module):
+    layer = GSLayer()
+    open_path = GSPath()
+    open_path.nodes = [
+        GSNode(position=(0, 0), nodetype="line", name="start"),
+        GSNode(position=(1, 1), nodetype="offcurve"),
+        GSNode(position=(2, 2), nodetype="offcurve"),
+        GSNode(position=(3, 3), nodetype="curve", smooth=True),
+    ]
+    open_path.closed = False
+    closed_path = GSPath()
+    closed_path.nodes = [
+        GSNode(position=(0, 0), nodetype="line"),
+        GSNode(position=(10, 0), nodetype="line"),
+        GSNode(position=(10, 10), nodetype="line", name="corner"),
+    ]
+    closed_path.nodes[2].userData["key"] = "value"
+    layer.paths.extend([open_path, closed_path])
+
+    glyph = ufo_module.Font().newGlyph("a")
+    to_ufo_paths(UFOBuilder(GSFont(), ufo_module=ufo_module), glyph, layer)
+
+    assert [
+        [(p.x, p.y, p.segmentType, p.smooth, p.name) for p in contour]
+        for contour in glyph
+    ] == [
+        [
+            (0, 0, "move", False, "start"),
+            (1, 1, None, False, None),
+            (2, 2, None, False, None),
+            (3, 3, "curve", True, None),
+        ],
+        [
+            (10, 10, "line", False, "corner"),
+            (0, 0, "line", False, None),
+            (10, 0, "line", False, None),
+        ],
+    ]
+    # The user data is keyed by the node index in the Glyphs path
+    assert glyph.lib == {GLYPHLIB_PREFIX + "nodeUserData.1.2": {"key": "value"}}
+
+
 def test_glyph_color(ufo_module):
     font = generate_minimal_font()
     glyph = GSGlyph(name="a")
@@ -28,8 +28,13 @@ import ufoLib2
 from glyphsLib.builder.builders import UFOBuilder
 from glyphsLib.builder import to_ufos
 from glyphsLib.builder.custom_params import (
+    _handlers_to_ufo,
     _set_default_params,
+    GlyphsObjectProxy,
     GLYPHS_UFO_CUSTOM_PARAMS,
+    KNOWN_PARAM_HANDLERS,
+    MiscParamHandler,
+    ParamHandler,
 )
 from glyphsLib.builder.constants import (
     UFO2FT_FILTERS_KEY,
@@ -785,3 +790,22 @@ def test_disabled_glyphOrder_custom_params(ufo_module, disabled):
         assert ufo.lib["public.glyphOrder"] == implicit_glyph_order
     else:
         assert ufo.lib["public.glyphOrder"] == custom_glyph_order
+
+
+def test_handlers_to_ufo():
+    master = GSFontMaster()
+    master.customParameters["typoAscender"] = 800
+    master.customParameters["openTypeOS2TypoDescender"] = -200
+    handlers = _handlers_to_ufo(GlyphsObjectProxy(master, None))
+
+    # In registration order
+    assert handlers == [h for h in KNOWN_PARAM_HANDLERS if h in handlers]
+    names = {h.glyphs_name for h in handlers if isinstance(h, ParamHandler)}
+    assert {"typoAscender", "typoDescender"} <= names
+    assert "typoLineGap" not in names
+    # The handlers that don't only read custom parameters are always called
+    for handler in KNOWN_PARAM_HANDLERS:
+        if not isinstance(handler, ParamHandler) or isinstance(
+            handler, MiscParamHandler
+        ):
+            assert handler in handlers
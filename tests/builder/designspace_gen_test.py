@@ -682,3 +682,29 @@ def test_designspace_generation_instances_disabled_custom_params(
         assert len(regular_instance.lib) == 1
         assert CUSTOM_PARAMETERS_KEY in regular_instance.lib
         assert regular_instance.lib[CUSTOM_PARAMETERS_KEY] == [("fsType", [])]
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "GlyphsUnitTestSans.glyphs",
+        "AlignAlternateLayers-g3.glyphs",
+        "Playfair-dollar.glyphspackage",
+    ],
+)
+def test_designspace_only(datadir, filename, ufo_module):
+    path = str(datadir.join(filename))
+    expected = to_designspace(
+        glyphsLib.GSFont(path), ufo_module=ufo_module, write_skipexportglyphs=True
+    )
+    skeleton = to_designspace(
+        glyphsLib.GSFont(path),
+        ufo_module=ufo_module,
+        write_skipexportglyphs=True,
+        designspace_only=True,
+    )
+
+    assert skeleton.tostring() == expected.tostring()
+    for source in skeleton.sources:
+        assert len(source.font) == 0
+        assert source.font.info.familyName == expected.sources[0].font.info.familyName
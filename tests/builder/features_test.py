@@ -18,7 +18,12 @@ import os
 from textwrap import dedent
 
 from glyphsLib import to_glyphs, to_ufos, classes, to_designspace
-from glyphsLib.builder.features import _build_public_opentype_categories
+from glyphsLib.builder import features
+from glyphsLib.builder.features import (
+    FeaDocument,
+    _build_public_opentype_categories,
+    replace_prefixes,
+)
 
 from fontTools.designspaceLib import DesignSpaceDocument
 import pytest
@@ -327,6 +332,63 @@ def test_to_glyphs_expand_includes(tmp_path, ufo_module):
     assert font.featurePrefixes[0].code.strip() == "# hello from family.fea"
 
 
+def test_fea_document_expand_includes(tmp_path):
+    (tmp_path / "kern.fea").write_text("pos a b -10;\ninclude(more.fea)")
+    (tmp_path / "more.fea").write_text("pos b a -20; # no final newline")
+    text = dedent("""\
+        # Prefix: include
+        include(family.fea)
+        feature kern {
+        include(kern.fea); pos a a 5;
+        } kern;
+        """)
+    (tmp_path / "family.fea").write_text("languagesystem DFLT dflt;\n")
+
+    document = FeaDocument(text, include_dir=str(tmp_path), expand_includes=True)
+
+    assert document.text(document.statements) == dedent("""\
+        # Prefix: include
+        languagesystem DFLT dflt;
+
+        feature kern {
+        pos a b -10;
+        pos b a -20; # no final newline
+         pos a a 5;
+        } kern;
+        """)
+
+
+def test_replace_prefix_parses_features_once(monkeypatch, ufo_module):
+    parsed = []
+
+    class CountingFeaDocument(FeaDocument):
+        def __init__(self, text, *args, **kwargs):
+            parsed.append(text)
+            super().__init__(text, *args, **kwargs)
+
+    monkeypatch.setattr(features, "FeaDocument", CountingFeaDocument)
+    font = classes.GSFont()
+    for name in ("Regular", "Bold", "Black"):
+        master = classes.GSFontMaster()
+        master.name = name
+        master.customParameters["Replace Prefix"] = "FOO; # " + name
+        font.masters.append(master)
+    feature_prefix = classes.GSFeaturePrefix()
+    feature_prefix.name = "FOO"
+    feature_prefix.code = "# foo"
+    font.featurePrefixes.append(feature_prefix)
+
+    ufos = to_ufos(font, ufo_module=ufo_module)
+
+    assert [ufo.features.text for ufo in ufos] == [
+        "# Prefix: FOO\n# Regular\n",
+        "# Prefix: FOO\n# Bold\n",
+        "# Prefix: FOO\n# Black\n",
+    ]
+    assert len(parsed) == 1
+    assert replace_prefixes({}, ufos[0].features.text) == ufos[0].features.text
+
+
 def test_to_ufos_expand_includes(tmp_path, ufo_module):
     font = classes.GSFont()
     font.masters.append(classes.GSFontMaster())
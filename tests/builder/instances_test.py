@@ -17,6 +17,7 @@
 import os
 import glyphsLib
 from fontTools.designspaceLib import DesignSpaceDocument
+from glyphsLib.builder import features
 from glyphsLib.builder.instances import apply_instance_data
 
 import pytest
@@ -78,6 +79,67 @@ def test_apply_instance_data(tmpdir, instance_names, ufo_module):
         assert ufo.info.openTypeOS2WidthClass is None  # GlyphsUnitTestSans is wght only
 
 
+def test_apply_instance_data_workers(tmpdir, ufo_module):
+    font = glyphsLib.GSFont(os.path.join(DATA, "GlyphsUnitTestSans.glyphs"))
+    designspace = glyphsLib.to_designspace(font, instance_dir="instances")
+    path = str(tmpdir / (font.familyName + ".designspace"))
+    write_designspace_and_UFOs(designspace, path)
+
+    tmpdir.mkdir("instances")
+    for instance in designspace.instances:
+        ufo_module.Font().save(str(tmpdir / instance.filename))
+
+    ufos = apply_instance_data(designspace.path, workers=2)
+
+    assert [ufo.path for ufo in ufos] == [
+        os.path.normpath(str(tmpdir / instance.filename))
+        for instance in designspace.instances
+    ]
+    assert [ufo.info.openTypeOS2WeightClass for ufo in ufos] == [
+        100,
+        200,
+        300,
+        400,
+        500,
+        700,
+        900,
+        357,
+    ]
+
+
+def test_apply_instance_data_parses_replaced_prefixes_once(
+    tmpdir, ufo_module, monkeypatch
+):
+    parsed = []
+
+    class CountingFeaDocument(features.FeaDocument):
+        def __init__(self, text, *args, **kwargs):
+            parsed.append(text)
+            super().__init__(text, *args, **kwargs)
+
+    monkeypatch.setattr(features, "FeaDocument", CountingFeaDocument)
+    font = glyphsLib.GSFont(os.path.join(DATA, "GlyphsUnitTestSans.glyphs"))
+    for instance in font.instances:
+        instance.customParameters["Replace Prefix"] = "FOO; # " + instance.name
+    designspace = glyphsLib.to_designspace(font, instance_dir="instances")
+    path = str(tmpdir / (font.familyName + ".designspace"))
+    write_designspace_and_UFOs(designspace, path)
+
+    tmpdir.mkdir("instances")
+    for instance in designspace.instances:
+        ufo = ufo_module.Font()
+        ufo.features.text = "# Prefix: FOO\n# foo\n"
+        ufo.save(str(tmpdir / instance.filename))
+
+    Font = getattr(ufo_module.Font, "open", ufo_module.Font)
+    ufos = apply_instance_data(designspace.path, Font=Font)
+
+    assert [ufo.features.text for ufo in ufos] == [
+        "# Prefix: FOO\n# %s\n" % instance.name for instance in font.instances
+    ]
+    assert len(parsed) == 1
+
+
 def test_reexport_apply_instance_data():
     # this is for compatibility with fontmake
     # https://github.com/googlefonts/fontmake/issues/451
@@ -0,0 +1,89 @@
+import json
+import os
+
+import pytest
+
+import glyphsLib
+from glyphsLib import to_designspace, to_glyphs, to_ufos
+from glyphsLib.builder import BuildProfile
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+
+
+@pytest.fixture
+def font():
+    return glyphsLib.GSFont(os.path.join(DATA, "GlyphsUnitTestSans.glyphs"))
+
+
+def test_profile_to_designspace(font):
+    profile = BuildProfile(slowest_glyphs=3)
+    designspace = to_designspace(font, profile=profile)
+
+    stages = profile.stages
+    assert stages["preflight.propagate_all_anchors"].calls == 1
+    assert stages["to_ufo_layers"].calls == 1
+    # Glyph layers, not counting backgrounds and bracket layers
+    assert (
+        0
+        < stages["to_ufo_layers"].items
+        < sum(
+            len(layer) for source in designspace.sources for layer in source.font.layers
+        )
+    )
+    assert stages["to_ufo_master_features"].calls == len(font.masters)
+    assert stages["to_ufo_custom_params"].calls == len(font.masters)
+    assert stages["to_designspace_instances"].items == len(font.instances)
+    assert all(stats.seconds >= 0 for stats in stages.values())
+
+    slowest = profile.slowest
+    assert len(slowest) == 3
+    assert [seconds for seconds, _, _ in slowest] == sorted(
+        (seconds for seconds, _, _ in slowest), reverse=True
+    )
+    assert {glyph_name for _, glyph_name, _ in slowest} <= {g.name for g in font.glyphs}
+
+
+def test_profile_to_glyphs(font):
+    designspace = to_designspace(font)
+    profile = BuildProfile()
+    to_glyphs(designspace, profile=profile)
+
+    assert profile.stages["to_glyphs_font_attributes"].calls == len(font.masters)
+    assert profile.stages["to_glyphs_master_attributes"].calls == len(font.masters)
+    assert profile.stages["to_glyphs_kerning"].calls == 1
+    assert profile.slowest == []
+
+
+def test_profile_save(font, tmp_path):
+    profile = BuildProfile(slowest_glyphs=1)
+    to_designspace(font, profile=profile, preserve_original=True)
+    path = tmp_path / "profile.json"
+    profile.save(path)
+
+    report = json.loads(path.read_text())
+    assert report["stages"]["snapshot_font"] == {
+        "calls": 1,
+        "seconds": pytest.approx(profile.stages["snapshot_font"].seconds),
+        "items": len(font.glyphs),
+    }
+    assert len(report["slowestGlyphs"]) == 1
+    assert set(report["slowestGlyphs"][0]) == {"glyph", "layer", "seconds"}
+
+
+def test_profile_interpolation_caches():
+    font = glyphsLib.GSFont(os.path.join(DATA, "NestedSmartComponent.glyphs"))
+    first = BuildProfile()
+    to_ufos(font, profile=first)
+    # The font keeps its interpolation models, but each build counts its own
+    # cache hits and misses
+    second = BuildProfile()
+    to_ufos(font, profile=second)
+
+    for name in ("interpolation_models.models", "interpolation_models.locations"):
+        assert first.caches[name].misses > 0
+        assert second.caches[name].misses == 0
+        assert second.caches[name].hits == (
+            first.caches[name].hits + first.caches[name].misses
+        )
+    report = second.as_dict()["caches"]["interpolation_models.models"]
+    assert report["hitRate"] == 1.0
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+import glyphsLib
+from glyphsLib import to_designspace
+from glyphsLib.builder.snapshot import snapshot_font
+from glyphsLib.classes import GSAnchor
+from glyphsLib.types import Point
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+
+
+@pytest.fixture
+def font():
+    font = glyphsLib.GSFont(os.path.join(DATA, "GlyphsUnitTestSans.glyphs"))
+    font.glyphs["a"].layers[0].anchors.append(GSAnchor("*origin", Point(10, 0)))
+    return font
+
+
+def test_snapshot_font(font):
+    snapshot = snapshot_font(font)
+
+    assert snapshot is not font
+    assert all(glyph.parent is snapshot for glyph in snapshot.glyphs)
+    # Plain outline glyphs share their layers with the original
+    assert snapshot.glyphs["A"] is not font.glyphs["A"]
+    assert snapshot.glyphs["A"].layers[0] is font.glyphs["A"].layers[0]
+    # Composites and glyphs with an origin anchor are copied
+    for name in ("Adieresis", "a"):
+        layer = snapshot.glyphs[name].layers[0]
+        assert layer is not font.glyphs[name].layers[0]
+        assert layer.parent is snapshot.glyphs[name]
+    assert snapshot.kerningLTR is not font.kerningLTR
+    assert snapshot.kerningLTR == font.kerningLTR
+
+
+def test_preserve_original(font):
+    # Serializing a font creates its empty backgrounds, do it beforehand
+    glyphsLib.dumps(font)
+    original = glyphsLib.dumps(font)
+
+    designspace = to_designspace(
+        font, preserve_original=True, glyph_filter=["Adieresis", "a"]
+    )
+
+    ufo = designspace.sources[0].font
+    assert set(ufo.keys()) == {"A", "Adieresis", "dieresis", "a"}
+    assert [a.name for a in ufo["Adieresis"].anchors] == ["bottom", "ogonek", "top"]
+    assert glyphsLib.dumps(font) == original
+    assert all(glyph.parent is font for glyph in font.glyphs)
+    assert not font.glyphs["Adieresis"].layers[0].anchors
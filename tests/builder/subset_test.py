@@ -0,0 +1,170 @@
+import os
+
+import pytest
+import ufo2ft
+
+import glyphsLib
+from glyphsLib import to_designspace, to_ufos
+from glyphsLib.builder.subset import component_closure, subset_features, subset_glyphs
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+
+
+@pytest.fixture
+def font():
+    return glyphsLib.GSFont(os.path.join(DATA, "GlyphsUnitTestSans.glyphs"))
+
+
+def test_component_closure(font):
+    assert component_closure(font, ["Adieresis", "m"]) == {
+        "Adieresis",
+        "A",
+        "dieresis",
+        "m",
+        "_part.stem",
+        "_part.shoulder",
+    }
+
+
+def test_subset_glyphs(font):
+    master_id = font.masters[0].id
+    font.kerningLTR[master_id] = {
+        "@MMK_L_A": {"@MMK_R_A": -5, "@MMK_R_a": -10, "Adieresis": -15},
+        "@MMK_L_a": {"@MMK_R_A": -20},
+        "dieresis": {"@MMK_R_A": -25, "I": -30},
+    }
+
+    keep = subset_glyphs(font, lambda name: name.startswith("Adieresis"))
+
+    assert keep == {"Adieresis", "A", "dieresis"}
+    assert [glyph.name for glyph in font.glyphs] == ["A", "Adieresis", "dieresis"]
+    assert font.kerningLTR[master_id] == {
+        "@MMK_L_A": {"@MMK_R_A": -5, "Adieresis": -15},
+        "dieresis": {"@MMK_R_A": -25},
+    }
+    for master in font.masters[1:]:
+        assert font.kerningLTR[master.id] == {}
+
+
+def test_subset_glyphs_missing_glyph(font, caplog):
+    keep = subset_glyphs(font, ["n", "nonexistent"])
+
+    assert keep == {"n", "_part.stem", "_part.shoulder"}
+    assert "nonexistent" in caplog.text
+
+
+def test_subset_glyphs_string_filter(font):
+    with pytest.raises(TypeError, match="not a string"):
+        subset_glyphs(font, "adieresis")
+
+
+def test_subset_features(ufo_module, caplog):
+    ufo = ufo_module.Font()
+    for name in ("a", "b", "a.sc", "f", "i", "f_i", "acutecomb"):
+        ufo.newGlyph(name)
+    ufo.features.text = """\
+@lower = [a b c];
+@smcp = [a.sc b.sc c.sc];
+@gone = [c];
+markClass [acutecomb gravecomb] <anchor 0 500> @top;
+markClass [gravecomb] <anchor 0 600> @top_gone;
+
+feature smcp {
+    sub @lower by @smcp;
+    sub [b c] by [b.sc c.sc];
+} smcp;
+
+feature liga {
+    sub f i by f_i;
+    sub f l by f_l;
+    sub c by c.sc;
+    sub @gone by a;
+    pos [a c] [f i] -10;
+} liga;
+
+feature mark {
+    pos base a <anchor 0 500> mark @top;
+    pos base b <anchor 0 600> mark @top_gone;
+} mark;
+
+table GDEF {
+    GlyphClassDef @lower, [f_i], @gone, ;
+} GDEF;
+"""
+
+    glyph_names = {"a", "b", "c", "a.sc", "b.sc", "c.sc", "f", "i", "l", "f_i", "f_l"}
+    subset_features([ufo], glyph_names | {"acutecomb", "gravecomb"})
+
+    assert ufo.features.text == """\
+@lower = [a b];
+@smcp = [a.sc];
+@gone = [];
+markClass [acutecomb] <anchor 0 500> @top;
+feature smcp {
+    sub [a] by [a.sc];
+} smcp;
+
+feature liga {
+    sub f i by f_i;
+    pos [a] [f i] -10;
+} liga;
+
+feature mark {
+    pos base a
+        <anchor 0 500> mark @top;
+} mark;
+
+table GDEF {
+    GlyphClassDef @lower, [f_i], @gone, ;
+} GDEF;
+"""
+    assert "Dropped 6 feature rules" in caplog.text
+
+
+def test_subset_features_untouched(ufo_module):
+    ufo = ufo_module.Font()
+    ufo.newGlyph("a")
+    text = "# Comment\nfeature liga {sub a by a;} liga;\n"
+    ufo.features.text = text
+
+    subset_features([ufo], {"a", "b"})
+
+    assert ufo.features.text == text
+
+
+def test_to_ufos_glyph_filter_compiles(ufo_module):
+    font = glyphsLib.GSFont(os.path.join(DATA, "gf", "Lexend.glyphs"))
+
+    ufos = to_ufos(font, ufo_module=ufo_module, glyph_filter=["A"], minimal=True)
+
+    assert list(ufos[0].keys()) == ["A"]
+    ttf = ufo2ft.compileTTF(ufos[0])
+    assert ttf.getGlyphOrder() == [".notdef", "A"]
+
+
+def test_to_ufos_glyph_filter(font, ufo_module):
+    glyph_names = [glyph.name for glyph in font.glyphs]
+    kerning = {master_id: dict(pairs) for master_id, pairs in font.kerning.items()}
+
+    ufos = to_ufos(font, ufo_module=ufo_module, glyph_filter={"adieresis"})
+
+    # The caller's font is left untouched
+    assert [glyph.name for glyph in font.glyphs] == glyph_names
+    assert font.kerning == kerning
+
+    for ufo in ufos:
+        assert set(ufo.keys()) == {"a", "adieresis", "dieresis"}
+        assert dict(ufo.groups) == {
+            "public.kern1.a": ["a"],
+            "public.kern2.a": ["a"],
+        }
+        assert {left for left, _ in ufo.kerning.keys()} <= {"public.kern1.a"}
+        categories = ufo.lib["public.openTypeCategories"]
+        assert set(categories) <= set(ufo.keys())
+
+
+def test_to_designspace_glyph_filter(font, ufo_module):
+    designspace = to_designspace(font, ufo_module=ufo_module, glyph_filter=["h"])
+
+    for source in designspace.sources:
+        assert set(source.font.keys()) == {"h", "_part.stem", "_part.shoulder"}
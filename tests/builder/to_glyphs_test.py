@@ -526,6 +526,44 @@ def test_open_contour(ufo_module):
     ]
 
 
+def test_paths_use_glyphs_module_nodes(ufo_module):
+    class MyNode(classes.GSNode):
+        pass
+
+    class MyModule:
+        def __getattr__(self, name):
+            return getattr(classes, name)
+
+    module = MyModule()
+    module.GSNode = MyNode
+
+    ufo = ufo_module.Font()
+    a = ufo.newGlyph("a")
+    pen = a.getPointPen()
+    pen.beginPath()
+    pen.addPoint((0, 0), "line", name="start", identifier="id0")
+    pen.addPoint((50, 0))
+    pen.addPoint((100, 50))
+    pen.addPoint((100, 100), "curve", smooth=True)
+    pen.endPath()
+
+    font = to_glyphs([ufo], glyphs_module=module)
+
+    path = font.glyphs["a"].layers[0].paths[0]
+    assert path.closed
+    assert all(type(node) is MyNode for node in path.nodes)
+    assert all(node.parent is path for node in path.nodes)
+    assert [(n.position.x, n.position.y, n.type, n.smooth) for n in path.nodes] == [
+        (50, 0, "offcurve", False),
+        (100, 50, "offcurve", False),
+        (100, 100, "curve", True),
+        (0, 0, "line", False),
+    ]
+    assert path.nodes[-1].name == "start"
+    assert path.nodes[-1].userData["UFO.identifier"] == "id0"
+    assert not path.nodes[0].userData
+
+
 def test_background_before_foreground(ufo_module):
     ufo = ufo_module.Font()
     ufo.newGlyph("a")
@@ -668,3 +706,27 @@ def test_weird_kerning_roundtrip(ufo_module):
         assert set(glyphs) == set(ufo.groups[name])
 
     assert ufo.kerning == kerning
+
+
+def test_kerning_to_glyphs_per_master(ufo_module):
+    ufo1 = ufo_module.Font()
+    ufo2 = ufo_module.Font()
+    for ufo in (ufo1, ufo2):
+        for name in ("a", "b"):
+            ufo.newGlyph(name)
+        bracket_glyph = ufo.newGlyph("b.BRACKET.300")
+        bracket_glyph.lib[GLYPHLIB_PREFIX + "_originalLayerName"] = ""
+        ufo.groups["public.kern1.A"] = ["a"]
+        ufo.groups["public.kern2.B"] = ["b"]
+    ufo1.kerning[("public.kern1.A", "b")] = -10
+    ufo1.kerning[("public.kern1.A", "public.kern2.B")] = -20
+    ufo1.kerning[("a", "b.BRACKET.300")] = -30
+    ufo2.kerning[("b", "a")] = 5
+
+    font = to_glyphs([ufo1, ufo2])
+    master1, master2 = (m.id for m in font.masters)
+
+    # Bracket glyph pairs are dropped, group names become Glyphs class keys
+    assert font.kerningLTR[master1] == {"@MMK_L_A": {"b": -10, "@MMK_R_B": -20}}
+    assert font.kerningLTR[master2] == {"b": {"a": 5}}
+    assert font.kerningForPair(master1, "@MMK_L_A", "@MMK_R_B") == -20
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 
 from fontTools.misc.transform import Transform as Affine
 
+from glyphsLib import to_ufos
 from glyphsLib.classes import (
     GSAnchor,
     GSFont,
@@ -29,12 +30,14 @@ from glyphsLib.builder.transformations.align_alternate_layers import (
     align_alternate_layers,
 )
 from glyphsLib.builder.transformations.propagate_anchors import (
+    AnchorPropagationCache,
     _get_design_space_info,
     compute_max_component_depths,
     get_xy_rotation,
     propagate_all_anchors,
     propagate_all_anchors_impl,
     depth_sorted_composite_glyphs,
+    depth_sorted_composite_levels,
 )
 
 if TYPE_CHECKING:
@@ -1377,3 +1380,148 @@ def test_interpolate_brace_uses_default_source_anchor_names():
         brace_layers[0].anchors,
         [("top", (150, 650)), ("bottom", (100, 0))],
     )
+
+
+def _all_anchors(font):
+    return [
+        [(a.name, tuple(a.position)) for a in layer.anchors]
+        for glyph in font.glyphs
+        for layer in glyph.layers
+    ]
+
+
+def test_propagate_anchors_cache(tmp_path):
+    path = os.path.join(DATA, "PropagateAnchorsTest.glyphs")
+    expected = GSFont(path)
+    propagate_all_anchors(expected)
+
+    cache = AnchorPropagationCache()
+    font = GSFont(path)
+    propagate_all_anchors(font, cache=cache)
+    assert _all_anchors(font) == _all_anchors(expected)
+    assert cache.reused == 0
+    computed = cache.recomputed
+    assert computed > 0
+
+    font = GSFont(path)
+    propagate_all_anchors(font, cache=cache)
+    assert _all_anchors(font) == _all_anchors(expected)
+    assert (cache.recomputed, cache.reused) == (computed, computed)
+
+    # Changing a component recomputes the glyphs that use it, and only them
+    font = GSFont(path)
+    font.glyphs["acutecomb"].layers[0].anchors["_top"].position = Point(0, 600)
+    cache.recomputed = cache.reused = 0
+    propagate_all_anchors(font, cache=cache)
+    changed = {"acutecomb"}
+    for name in depth_sorted_composite_glyphs({g.name: g for g in font.glyphs}):
+        layers = font.glyphs[name].layers
+        if any(c.name in changed for l in layers for c in l.components):
+            changed.add(name)
+    assert len(changed) > 1
+    assert cache.recomputed == len(changed)
+    assert cache.reused == computed - cache.recomputed
+
+    cache.save(tmp_path / "cache.json")
+    loaded = AnchorPropagationCache.load(tmp_path / "cache.json")
+    font = GSFont(path)
+    font.glyphs["acutecomb"].layers[0].anchors["_top"].position = Point(0, 600)
+    expected = deepcopy(font)
+    propagate_all_anchors(expected)
+    propagate_all_anchors(font, cache=loaded)
+    assert _all_anchors(font) == _all_anchors(expected)
+    assert (loaded.recomputed, loaded.reused) == (0, computed)
+
+    # Glyphs renamed or deleted since are dropped from the cache
+    font = GSFont(path)
+    font.glyphs["Aacute"].name = "Aacute.renamed"
+    del font.glyphs["acutecomb"]
+    propagate_all_anchors(font, cache=loaded)
+    assert "Aacute.renamed" in loaded.glyphs
+    assert not {"Aacute", "acutecomb"} & loaded.glyphs.keys()
+    assert loaded.glyphs.keys() == {glyph.name for glyph in font.glyphs}
+
+
+def test_propagate_anchors_cache_skips_non_json_user_data(tmp_path):
+    path = os.path.join(DATA, "PropagateAnchorsTest.glyphs")
+    font = GSFont(path)
+    anchor = font.glyphs["acutecomb"].layers[0].anchors["_top"]
+    anchor.userData["data"] = b"\x00"
+    anchor.userData["date"] = datetime(2024, 1, 1)
+
+    cache = AnchorPropagationCache()
+    propagate_all_anchors(font, cache=cache)
+    assert cache.recomputed > 0
+    assert "acutecomb" not in cache.glyphs
+    assert "A" in cache.glyphs
+    cache.save(tmp_path / "cache.json")
+
+    loaded = AnchorPropagationCache.load(tmp_path / "cache.json")
+    assert loaded.glyphs.keys() == cache.glyphs.keys()
+
+
+@pytest.mark.parametrize(
+    "test_file",
+    ["PropagateAnchorsTest.glyphs", "AlignAlternateLayers-g3.glyphs"],
+)
+def test_propagate_anchors_in_workers(test_file):
+    path = os.path.join(DATA, test_file)
+    expected = GSFont(path)
+    expected_cache = AnchorPropagationCache()
+    propagate_all_anchors(expected, cache=expected_cache)
+
+    font = GSFont(path)
+    cache = AnchorPropagationCache()
+    propagate_all_anchors(font, cache=cache, workers=2)
+    assert _all_anchors(font) == _all_anchors(expected)
+    assert cache.glyphs == expected_cache.glyphs
+
+
+def test_to_ufos_propagates_anchors_in_workers(ufo_module):
+    path = os.path.join(DATA, "PropagateAnchorsTest.glyphs")
+    expected = to_ufos(GSFont(path), ufo_module=ufo_module)
+
+    ufos = to_ufos(GSFont(path), ufo_module=ufo_module, workers=2)
+
+    for ufo, expected_ufo in zip(ufos, expected):
+        for glyph in ufo:
+            assert [(a.name, a.x, a.y) for a in glyph.anchors] == [
+                (a.name, a.x, a.y) for a in expected_ufo[glyph.name].anchors
+            ]
+
+
+def test_to_ufos_anchor_cache(tmp_path, ufo_module):
+    path = os.path.join(DATA, "PropagateAnchorsTest.glyphs")
+    cache_path = tmp_path / "anchors.json"
+    expected = to_ufos(GSFont(path), ufo_module=ufo_module)
+
+    to_ufos(GSFont(path), ufo_module=ufo_module, anchor_cache=cache_path)
+    cache = AnchorPropagationCache.load(cache_path)
+    assert cache.glyphs
+    ufos = to_ufos(GSFont(path), ufo_module=ufo_module, anchor_cache=cache, workers=2)
+
+    assert cache.recomputed == 0
+    assert cache.reused == len(cache.glyphs)
+    for ufo, expected_ufo in zip(ufos, expected):
+        for glyph in ufo:
+            assert [(a.name, a.x, a.y) for a in glyph.anchors] == [
+                (a.name, a.x, a.y) for a in expected_ufo[glyph.name].anchors
+            ]
+
+
+def test_depth_sorted_composite_levels():
+    glyphs = {
+        g.name: g
+        for g in (
+            make_glyph("A", []),
+            make_glyph("acutecomb", []),
+            make_glyph("Aacute", ["A", "acutecomb"]),
+            make_glyph("Aacute.sc", ["Aacute"]),
+            make_glyph("Acomb", ["A"]),
+        )
+    }
+    assert depth_sorted_composite_levels(glyphs) == [
+        ["A", "acutecomb"],
+        ["Aacute", "Acomb"],
+        ["Aacute.sc"],
+    ]
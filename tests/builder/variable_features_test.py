@@ -550,6 +550,44 @@ def convert(fea, axes=("wght",), font=None):
             ("wght",),
             "feature rlig {\nsub a by b;\n} rlig;",
         ),
+        # Each unterminated #ifndef runs to the end of its own block.
+        (
+            "feature rlig {\nsub a by b;\n#ifndef VARIABLE\nsub c by d;\n"
+            "lookup L {\n#ifndef VARIABLE\nsub g by h;\n} L;\n} rlig;\n"
+            "feature liga {\n#ifndef VARIABLE\nsub e by f;\n} liga;",
+            ("wght",),
+            "feature rlig {\nsub a by b;\n} rlig;\nfeature liga {\n} liga;",
+        ),
+        # Several features with conditions share the condition sets.
+        (
+            dedent("""\
+                feature rlig { condition 600 < wght; sub a by b; } rlig;
+                feature kern { pos a b 10 (wght:900) 20; } kern;
+                feature liga { condition 600 < wght; sub f i by f_i; } liga;"""),
+            ("wght",),
+            dedent("""\
+                feature rlig {
+
+                } rlig;
+
+                conditionset conditionset_1 {
+                    wght 600.0 1000.0;
+                } conditionset_1;
+
+                variation rlig conditionset_1 {
+                sub a by b;
+                } rlig;
+
+                feature kern { pos a b (wght=400:10 wght=900.0:20); } kern;
+                feature liga {
+
+                } liga;
+
+                variation liga conditionset_1 {
+                sub f i by f_i;
+                } liga;
+                """),
+        ),
         # Rules after #endif but before the next condition are still
         # conditional.
         (
@@ -688,6 +726,12 @@ def test_idempotent():
             ("wght",),
             "outside feature blocks",
         ),
+        (
+            # The condition statement runs into the following feature block
+            "sub f i by f_i;\ncondition\nlookup L {\n }feature kern{} rlig;",
+            ("wght",),
+            "outside feature blocks",
+        ),
         (
             "feature rlig { condition 600 < opsz; sub a by b; } rlig;",
             ("wght",),
@@ -0,0 +1,56 @@
+import pytest
+
+from fontTools.varLib.models import VariationModelError, normalizeLocation
+
+from glyphsLib.builder.variation_models import InterpolationModels, interpolation_models
+from glyphsLib.classes import GSFont
+
+
+def test_model_cache():
+    models = InterpolationModels()
+    locations = [{}, {"wght": 1.0}, {"wght": -1.0}]
+    model = models.model(locations, axis_order=["wght"])
+    assert models.model([{}, {"wght": 1.0}, {"wght": -1.0}], ["wght"]) is model
+    assert model.interpolateFromMasters({"wght": 0.5}, [10, 20, 0]) == 15
+    # The master values follow the order of the locations
+    reordered = models.model([{"wght": 1.0}, {}, {"wght": -1.0}], ["wght"])
+    assert reordered is not model
+    assert reordered.interpolateFromMasters({"wght": 0.5}, [20, 10, 0]) == 15
+    assert models.model(locations, ["wght"], extrapolate=True) is not model
+    assert (models.model_hits, models.model_misses) == (1, 3)
+
+    with pytest.raises(VariationModelError):
+        models.model([{}, {}])
+    assert models.model_misses == 4
+
+
+def test_normalize_cache():
+    models = InterpolationModels()
+    axes = {"wght": (100, 400, 900), "wdth": (75, 100, 100)}
+    location = {"wght": 650, "wdth": 75}
+    normalized = models.normalize(location, axes)
+    assert (
+        normalized
+        == normalizeLocation(location, axes)
+        == {
+            "wght": 0.5,
+            "wdth": -1.0,
+        }
+    )
+    assert models.normalize(dict(location), axes) is normalized
+    assert models.normalize({"wght": 1000}, axes) == {"wght": 1.0, "wdth": 0.0}
+    assert models.normalize({"wght": 1000}, axes, extrapolate=True)["wght"] == 1.2
+
+    assert models.stats()["locations"] == {
+        "hits": 1,
+        "misses": 3,
+        "hitRate": 0.25,
+    }
+    assert models.stats()["models"] == {"hits": 0, "misses": 0, "hitRate": 0.0}
+
+
+def test_interpolation_models_per_font():
+    font = GSFont()
+    assert interpolation_models(font) is interpolation_models(font)
+    assert interpolation_models(font) is not interpolation_models(GSFont())
+    assert interpolation_models(None) is not interpolation_models(None)
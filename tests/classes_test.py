@@ -20,6 +20,7 @@ import copy
 import unittest
 import pytest
 
+import glyphsLib
 from glyphsLib.classes import (
     GSFont,
     GSFontMaster,
@@ -270,6 +271,35 @@ class GSFontFromFileTest(GSObjectsTestCase):
     def setUp(self):
         super().setUp()
 
+    def test_deepcopy(self):
+        font = self.font
+        font_copy = copy.deepcopy(font)
+        self.assertEqual(glyphsLib.dumps(font_copy), glyphsLib.dumps(font))
+        for master in font_copy.masters:
+            self.assertIs(master.font, font_copy)
+        glyph = font_copy.glyphs["a"]
+        self.assertIsNot(glyph, font.glyphs["a"])
+        self.assertIs(glyph.parent, font_copy)
+        layer = glyph.layers[0]
+        self.assertIs(layer.parent, glyph)
+        node = layer.paths[0].nodes[0]
+        self.assertIs(node.parent, layer.paths[0])
+        node.position.x += 10
+        self.assertNotEqual(
+            node.position, font.glyphs["a"].layers[0].paths[0].nodes[0].position
+        )
+
+    def test_deepcopy_keeps_original_owner(self):
+        layer = self.font.glyphs["a"].layers[0]
+        layer_copy = copy.deepcopy(layer)
+        self.assertIsNot(layer_copy, layer)
+        # The owner is not copied along with the layer
+        self.assertIs(layer_copy.parent, layer.parent)
+        self.assertIs(layer_copy.paths[0].parent, layer_copy)
+        self.assertEqual(
+            [c.name for c in layer_copy.components], [c.name for c in layer.components]
+        )
+
     def test_pathlike_path(self):
         from pathlib import Path
 
@@ -1834,6 +1864,57 @@ class GSCustomParameterTest(unittest.TestCase):
             "\nkey2 = value2;\n};\n}",
         )
 
+    def test_lookup_by_name(self):
+        master = GSFontMaster()
+        master.customParameters = [
+            GSCustomParameter("param", 1, disabled=True),
+            GSCustomParameter("param", 2),
+            GSCustomParameter("other", 3),
+        ]
+        # The first parameter with the name counts, even if disabled
+        self.assertIsNone(master.customParameters["param"])
+        self.assertNotIn("param", master.customParameters)
+        self.assertEqual(master.customParameters["other"], 3)
+
+        del master.customParameters[0]
+        self.assertEqual(master.customParameters["param"], 2)
+        master.customParameters.append(GSCustomParameter("new", 4))
+        self.assertEqual(master.customParameters["new"], 4)
+        master.customParameters["newer"] = 5
+        self.assertEqual(master.customParameters.get("newer"), 5)
+        del master.customParameters["other"]
+        self.assertNotIn("other", master.customParameters)
+        # Modifications of the list that don't go through the proxy
+        master._customParameters.append(GSCustomParameter("direct", 6))
+        self.assertEqual(master.customParameters["direct"], 6)
+        master._customParameters = [GSCustomParameter("replaced", 7)]
+        self.assertNotIn("param", master.customParameters)
+        self.assertEqual(master.customParameters["replaced"], 7)
+
+        # Items renamed in place
+        master.customParameters[0].name = "renamed"
+        self.assertNotIn("replaced", master.customParameters)
+        self.assertEqual(master.customParameters["renamed"], 7)
+        # Only the index of the renamed item's owner is dropped
+        other = GSFontMaster()
+        other.customParameters = [GSCustomParameter("param", 8)]
+        self.assertEqual(other.customParameters["param"], 8)
+        master.customParameters[0].name = "renamed again"
+        self.assertIn("_customParameters", other._name_indexes)
+        self.assertNotIn("_customParameters", master._name_indexes)
+        self.assertEqual(master.customParameters["renamed again"], 7)
+        # The index is not copied along with the master
+        self.assertNotIn("_name_indexes", copy.deepcopy(master).__dict__)
+
+        font = GSFont()
+        font.properties["designers"] = "me"
+        self.assertEqual(font.properties["designers"], "me")
+        font.properties[0].key = "manufacturers"
+        self.assertNotIn("designers", font.properties)
+        self.assertEqual(font.properties["manufacturers"], "me")
+        font.properties = []
+        self.assertNotIn("manufacturers", font.properties)
+
 
 class GSBackgroundLayerTest(unittest.TestCase):
     """Goal: forbid in glyphsLib all the GSLayer.background APIs that don't
@@ -1980,5 +2061,49 @@ class FontClassesProxyTest(unittest.TestCase):
         assert self.font.features["aalt"] in self.font.features
 
 
+class CompactLayoutTest(unittest.TestCase):
+    def test_no_instance_dict(self):
+        node = GSNode((10, 20))
+        self.assertFalse(hasattr(node, "__dict__"))
+        self.assertFalse(hasattr(node.position, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.foo = 1
+
+    def test_unknown_keys_from_file(self):
+        font = glyphsLib.loads(
+            "{\n.formatVersion = 3;\nglyphs = (\n{\nglyphname = A;\n"
+            "someFutureKey = 1;\n}\n);\n}\n"
+        )
+        self.assertEqual(font.glyphs["A"].someFutureKey, 1)
+
+    def test_lazy_containers(self):
+        layer = GSLayer()
+        path = GSPath()
+        layer.paths.append(path)
+        glyphsLib.dumps(layer)
+        self.assertEqual(len(layer.hints), 0)
+        self.assertEqual(list(layer.guides), [])
+        self.assertEqual(layer.annotations[:], [])
+        self.assertFalse(layer._has_attribute("coordinates"))
+        for name in ("_hints", "_guides", "_annotations", "_attributes"):
+            self.assertIsNone(getattr(layer, name), name)
+        self.assertIsNone(path._attributes)
+
+        hint = GSHint()
+        layer.hints.append(hint)
+        self.assertEqual(list(layer.hints), [hint])
+        self.assertIs(hint.parent, layer)
+        layer.attributes["coordinates"] = [100]
+        path.attributes["fillColor"] = [0, 0, 0, 255]
+        self.assertTrue(layer._has_attribute("coordinates"))
+
+        copied = copy.deepcopy(layer)
+        self.assertEqual(copied.attributes, {"coordinates": [100]})
+        self.assertEqual(copied.paths[0].attributes, {"fillColor": [0, 0, 0, 255]})
+        self.assertEqual(len(copied.hints), 1)
+        layer.hints = []
+        self.assertIsNone(layer._hints)
+
+
 if __name__ == "__main__":
     unittest.main()
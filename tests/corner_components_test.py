@@ -23,3 +23,18 @@ def test_corner_components(glyph):
         expectation.contours, test_glyph.contours
     ):
         assert test_contour == expectation_contour, glyph
+
+
+def test_corner_components_prepared_once():
+    font = glyphsLib.load_to_ufos(datadir.join("CornerComponents.glyphs"))[0]
+    glyphs = {glyph for glyph in test_glyphs if "left_anchor" not in glyph}
+    philter = CornerComponentsFilter(include=glyphs)
+    assert philter(font)
+
+    prepared = philter.context.prepared_corner_components
+    timings = philter.context.corner_component_timings
+    assert set(prepared) == set(timings)
+    assert sum(count for count, _ in timings.values()) > len(prepared)
+    for name, corner in prepared.items():
+        assert len(corner.contours) == len(font[name])
+        assert timings[name][1] >= 0
@@ -1,7 +1,13 @@
 import pytest
 from defcon import Font
+from fontTools.pens.recordingPen import RecordingPen
 
-from glyphsLib.filters.eraseOpenCorners import EraseOpenCornersFilter
+from glyphsLib.filters.eraseOpenCorners import (
+    EraseOpenCornersFilter,
+    EraseOpenCornersPen,
+    _contourPoints,
+    _mayHaveOpenCorner,
+)
 
 
 @pytest.fixture(
@@ -417,3 +423,36 @@ def test_compatibility3():
     newcontour2 = font2["incompatible3"][0]
     assert len(newcontour1) == len(newcontour2)
     assert structure(newcontour1) == structure(newcontour2)
+
+
+def test_quick_skip_is_conservative(font):
+    for glyph in font:
+        p = EraseOpenCornersPen(RecordingPen())
+        for contour in glyph:
+            contour.draw(p)
+        if p.affected:
+            assert any(_mayHaveOpenCorner(_contourPoints(c)) for c in glyph)
+    # A square has no open corner and is skipped without drawing
+    square = [
+        ((0, 0), "line", False, None, None),
+        ((100, 0), "line", False, None, None),
+        ((100, 100), "line", False, None, None),
+        ((0, 100), "line", False, None, None),
+    ]
+    assert not _mayHaveOpenCorner(square)
+
+
+def test_workers(font):
+    serial = Font()
+    for glyph in font:
+        serial.insertGlyph(glyph)
+
+    modified = EraseOpenCornersFilter()(serial)
+    assert modified
+    assert EraseOpenCornersFilter(workers=2)(font) == modified
+    for glyph in font:
+        expected = RecordingPen()
+        serial[glyph.name].draw(expected)
+        actual = RecordingPen()
+        glyph.draw(actual)
+        assert actual.value == expected.value
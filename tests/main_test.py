@@ -18,8 +18,13 @@ import difflib
 import glob
 import os
 
+import pytest
+
 import glyphsLib.cli
 import glyphsLib.parser
+from glyphsLib.builder.transformations.propagate_anchors import AnchorPropagationCache
+
+from .test_helpers import read_files
 
 DATA = os.path.join(os.path.dirname(__file__), "data")
 
@@ -123,3 +128,122 @@ def test_parser_main_v3_upstream(capsys):
     actual_diff = [line for line in actual_diff if not line.startswith("?")]
 
     assert actual_diff == expected_diff.splitlines()
+
+
+def test_glyphs_main_designspace_only(tmpdir):
+    filename = os.path.join(DATA, "GlyphsUnitTestSans.glyphs")
+    master_dir = os.path.join(str(tmpdir), "master_ufos_test")
+
+    glyphsLib.cli.main(["glyphs2ufo", filename, "-m", master_dir, "--designspace-only"])
+
+    assert not glob.glob(master_dir + "/*.ufo")
+    assert os.path.isfile(os.path.join(master_dir, "GlyphsUnitTestSans.designspace"))
+
+
+def test_glyphs_main_subset(tmpdir):
+    import fontTools.designspaceLib
+    import ufoLib2
+
+    filename = os.path.join(DATA, "GlyphsUnitTestSans.glyphs")
+    master_dir = os.path.join(str(tmpdir), "master_ufos_test")
+
+    glyphsLib.cli.main(["glyphs2ufo", filename, "-m", master_dir, "--subset", "n,A"])
+
+    designspace = fontTools.designspaceLib.DesignSpaceDocument.fromfile(
+        os.path.join(master_dir, "GlyphsUnitTestSans.designspace")
+    )
+    for source in designspace.sources:
+        ufo = ufoLib2.Font.open(source.path)
+        assert set(ufo.keys()) == {"A", "n", "_part.stem", "_part.shoulder"}
+
+
+def test_glyphs_main_profile_report(tmpdir):
+    import json
+
+    filename = os.path.join(DATA, "GlyphsUnitTestSans.glyphs")
+    master_dir = os.path.join(str(tmpdir), "master_ufos_test")
+    report_path = os.path.join(str(tmpdir), "profile.json")
+
+    glyphsLib.cli.main(
+        ["glyphs2ufo", filename, "-m", master_dir, "--profile-report", report_path]
+    )
+
+    with open(report_path) as fp:
+        report = json.load(fp)
+    assert report["stages"]["parse"]["calls"] == 1
+    assert report["stages"]["to_ufo_layers"]["items"] > 0
+    assert report["stages"]["save_ufos"]["calls"] == len(
+        glob.glob(master_dir + "/*.ufo")
+    )
+    assert report["slowestGlyphs"]
+    assert set(report["caches"]) == {
+        "interpolation_models.models",
+        "interpolation_models.locations",
+    }
+
+
+def test_glyphs_main_workers(tmpdir):
+    filename = os.path.join(DATA, "GlyphsUnitTestSans.glyphs")
+    serial_dir = os.path.join(str(tmpdir), "serial")
+    parallel_dir = os.path.join(str(tmpdir), "parallel")
+
+    glyphsLib.cli.main(["glyphs2ufo", filename, "-m", serial_dir, "-N"])
+    glyphsLib.cli.main(
+        ["glyphs2ufo", filename, "-m", parallel_dir, "-N", "--workers", "2"]
+    )
+
+    assert len(glob.glob(parallel_dir + "/*.ufo")) == 3
+    assert read_files(parallel_dir) == read_files(serial_dir)
+
+
+def test_glyphs_main_anchor_cache(tmpdir):
+    filename = os.path.join(DATA, "GlyphsUnitTestSans.glyphs")
+    master_dir = os.path.join(str(tmpdir), "master_ufos_test")
+    cache_path = os.path.join(str(tmpdir), "anchors.json")
+
+    glyphsLib.cli.main(
+        ["glyphs2ufo", filename, "-m", master_dir, "--anchor-cache", cache_path]
+    )
+
+    cache = AnchorPropagationCache.load(cache_path)
+    assert "Adieresis" in cache.glyphs
+
+
+@pytest.mark.parametrize("update_ufos", [False, True])
+def test_build_masters_workers_return_bound_ufos(tmpdir, update_ufos):
+    filename = os.path.join(DATA, "GlyphsUnitTestSans.glyphs")
+    results = {}
+    for workers in (1, 2):
+        master_dir = os.path.join(str(tmpdir), str(workers))
+        masters = glyphsLib.build_masters(
+            filename, master_dir, update_ufos=update_ufos, workers=workers
+        )
+        for name, ufo in masters.ufos.items():
+            assert ufo.path == os.path.join(master_dir, name)
+        results[workers] = {
+            name: (sorted(ufo.keys()), ufo.info.styleName, dict(ufo.kerning))
+            for name, ufo in masters.ufos.items()
+        }
+    assert results[1] == results[2]
+
+
+def test_build_masters_workers_unpicklable_ufos(tmpdir):
+    import defcon
+
+    filename = os.path.join(DATA, "GlyphsUnitTestSans.glyphs")
+    with pytest.raises(TypeError, match="can't be pickled"):
+        glyphsLib.build_masters(filename, str(tmpdir), ufo_module=defcon, workers=2)
+    assert not glob.glob(str(tmpdir) + "/*.ufo")
+
+
+def test_build_masters_workers_error(tmpdir):
+    filename = os.path.join(DATA, "GlyphsUnitTestSans.glyphs")
+    master_dir = str(tmpdir)
+    # A file in the way of one of the UFOs
+    with open(os.path.join(master_dir, "GlyphsUnitTestSans-Bold.ufo"), "w"):
+        pass
+
+    with pytest.raises(NotADirectoryError):
+        glyphsLib.build_masters(filename, master_dir, workers=2)
+
+    assert os.path.isdir(os.path.join(master_dir, "GlyphsUnitTestSans-Light.ufo"))
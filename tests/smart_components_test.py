@@ -18,6 +18,7 @@ import pytest
 
 from fontTools.pens.areaPen import AreaPen
 from glyphsLib import to_ufos, load
+from glyphsLib.builder.variation_models import interpolation_models
 from glyphsLib.classes import (
     GSFont,
     GSFontMaster,
@@ -301,3 +302,19 @@ def test_smart_component_at_default_location(smart_font):
     rect, clockwise = get_rectangle_data(ufo)
     assert rect == (100, 100, 100, 100)
     assert not clockwise
+
+
+def test_smart_component_models_are_shared(smart_font):
+    regular = smart_font.glyphs["a"].layers[0]
+    regular.components[0].smartComponentValues = {"Width": 0.5}
+    component = GSComponent("_part.rectangle")
+    component.smartComponentValues = {"Width": 1, "Height": 300}
+    regular.components.append(component)
+
+    (ufo,) = to_ufos(smart_font)
+
+    assert len(ufo["a"]) == 2
+    # Both components are interpolated with the same model
+    stats = interpolation_models(smart_font).stats()
+    assert stats["models"]["misses"] == 1
+    assert stats["models"]["hits"] >= 1
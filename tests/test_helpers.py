@@ -322,3 +322,15 @@ def designspace_files(directory):
         for filename in files:
             if filename.endswith(".designspace"):
                 yield os.path.join(root, filename)
+
+
+def read_files(directory):
+    """Return a dict of the paths of the files under directory, relative to
+    it, to their content."""
+    files = {}
+    for root, _dirs, filenames in os.walk(directory):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            with open(path, "rb") as fp:
+                files[os.path.relpath(path, directory)] = fp.read()
+    return files
@@ -14,9 +14,23 @@
 # limitations under the License.
 
 
+import os
+import tempfile
 import unittest
 
-from glyphsLib.util import bin_to_int_list, int_list_to_bin
+import glyphsLib
+from glyphsLib.util import (
+    ProcessPool,
+    bin_to_int_list,
+    int_list_to_bin,
+    memory_report,
+    update_ufo,
+    worker_state,
+)
+
+from .test_helpers import read_files
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
 
 
 class UtilTest(unittest.TestCase):
@@ -35,3 +49,154 @@ class UtilTest(unittest.TestCase):
         self.assertEqual(int_list_to_bin([0, 1]), 3)
         self.assertEqual(int_list_to_bin([2]), 4)
         self.assertEqual(int_list_to_bin([7, 30]), (1 << 7) + (1 << 30))
+
+    def test_memory_report(self):
+        font = glyphsLib.GSFont(os.path.join(DATA, "GlyphsUnitTestSans.glyphs"))
+        report = memory_report(font)
+
+        node_count = sum(
+            len(path.nodes)
+            for glyph in font.glyphs
+            for layer in glyph.layers
+            for path in layer.paths
+        )
+        self.assertGreaterEqual(report.by_class["GSNode"][0], node_count)
+        self.assertEqual(report.by_class["GSGlyph"][0], len(font.glyphs))
+        self.assertEqual(report.by_class["GSFont"][0], 1)
+        self.assertIn("userData", report.by_class)
+        self.assertEqual(
+            report.total, sum(size for _, size in report.by_class.values())
+        )
+        self.assertEqual(set(report.by_glyph), {glyph.name for glyph in font.glyphs})
+        self.assertLess(sum(report.by_glyph.values()), report.total)
+        name, size = report.largest_glyphs(1)[0]
+        self.assertEqual(size, max(report.by_glyph.values()))
+
+        # A glyph doesn't drag its font along through its parent; on its own,
+        # it is also charged for the values it shares with other objects.
+        glyph_report = memory_report(font.glyphs[name])
+        self.assertNotIn("GSFont", glyph_report.by_class)
+        self.assertGreaterEqual(glyph_report.total, size)
+        self.assertLess(glyph_report.total, size * 1.1)
+
+    def test_memory_report_ufos(self):
+        font = glyphsLib.GSFont(os.path.join(DATA, "GlyphsUnitTestSans.glyphs"))
+        ufos = glyphsLib.to_ufos(font)
+        report = memory_report(ufos)
+
+        self.assertEqual(report.by_class["Font"][0], len(ufos))
+        self.assertEqual(
+            report.by_class["Glyph"][0],
+            sum(len(layer) for ufo in ufos for layer in ufo.layers),
+        )
+
+
+def _scale(value):
+    return value * worker_state()
+
+
+def _fail(value):
+    raise ValueError(value)
+
+
+class ProcessPoolTest(unittest.TestCase):
+    def test_map(self):
+        with ProcessPool(2, initializer=int, initargs=("10",)) as pool:
+            self.assertEqual(pool.workers, 2)
+            self.assertEqual(pool.map(_scale, range(20)), list(range(0, 200, 10)))
+            self.assertEqual(pool.map(_scale, [1, 2], chunksize=1), [10, 20])
+
+    def test_chunksize(self):
+        pool = ProcessPool(2)
+        self.addCleanup(pool.shutdown)
+        self.assertEqual(pool.chunksize(3), 1)
+        self.assertEqual(pool.chunksize(80), 10)
+        default_pool = ProcessPool(None)
+        self.addCleanup(default_pool.shutdown)
+        self.assertEqual(default_pool.workers, os.cpu_count() or 1)
+
+    def test_error(self):
+        with ProcessPool(2) as pool:
+            with self.assertRaisesRegex(ValueError, "^1$"):
+                pool.map(_fail, [1, 2])
+
+
+class UpdateUfoTest(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(DATA, "GlyphsUnitTestSans.glyphs")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_build_masters(self):
+        expected_dir = os.path.join(self.tmp.name, "expected")
+        expected = glyphsLib.build_masters(self.path, expected_dir, normalize_ufos=True)
+        master_dir = os.path.join(self.tmp.name, "masters")
+        # Once to create the UFOs, then to update them
+        for _ in range(2):
+            masters = glyphsLib.build_masters(
+                self.path, master_dir, normalize_ufos=True, update_ufos=True
+            )
+
+        self.assertEqual(sorted(masters.ufos), sorted(expected.ufos))
+        self.assertEqual(
+            sorted(os.listdir(master_dir)), sorted(os.listdir(expected_dir))
+        )
+        for filename, ufo in masters.ufos.items():
+            path = os.path.join(master_dir, filename)
+            self.assertEqual(ufo.path, path)
+            self.assertEqual(
+                read_files(path), read_files(os.path.join(expected_dir, filename))
+            )
+
+    def test_only_changed_files_are_written(self):
+        ufo = glyphsLib.to_ufos(glyphsLib.GSFont(self.path))[0]
+        path = os.path.join(self.tmp.name, "Font.ufo")
+        update_ufo(ufo, path)
+        self.assertIsNone(ufo.path)
+        # Mark all the files as old, and add one that isn't part of the UFO
+        inodes = {}
+        for root, _, files in os.walk(path):
+            for name in files:
+                os.utime(os.path.join(root, name), ns=(0, 0))
+                inodes[os.path.join(root, name)] = os.stat(
+                    os.path.join(root, name)
+                ).st_ino
+        glyphs_dir_inode = os.stat(os.path.join(path, "glyphs")).st_ino
+        stale = os.path.join(path, "glyphs", "stale.glif")
+        with open(stale, "w") as fp:
+            fp.write("<glyph/>")
+
+        ufo["A"].width += 10
+        del ufo["a"]
+        update_ufo(ufo, path)
+
+        changed = {
+            os.path.relpath(os.path.join(root, name), path)
+            for root, _, files in os.walk(path)
+            for name in files
+            if os.stat(os.path.join(root, name)).st_mtime_ns != 0
+        }
+        self.assertEqual(
+            changed,
+            {
+                os.path.join("glyphs", "A_.glif"),
+                os.path.join("glyphs", "contents.plist"),
+            },
+        )
+        self.assertFalse(os.path.exists(stale))
+        # The unchanged files and the directories are the same as before
+        fontinfo = os.path.join(path, "fontinfo.plist")
+        self.assertEqual(os.stat(fontinfo).st_ino, inodes[fontinfo])
+        self.assertEqual(os.stat(os.path.join(path, "glyphs")).st_ino, glyphs_dir_inode)
+        self.assertFalse(os.path.exists(os.path.join(path, "glyphs", "a.glif")))
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["Font.ufo"])
+
+    def test_defcon(self):
+        import defcon
+
+        ufo = glyphsLib.to_ufos(glyphsLib.GSFont(self.path), ufo_module=defcon)[0]
+        path = os.path.join(self.tmp.name, "Font.ufo")
+        for _ in range(2):
+            update_ufo(ufo, path)
+            self.assertEqual(ufo.path, path)
+        self.assertEqual(sorted(defcon.Font(path).keys()), sorted(ufo.keys()))